@@ -35,7 +35,9 @@ from comet.core.database import (
 from comet.core.execution import setup_executor, shutdown_executor
 from comet.core.logger import logger
 from comet.core.models import STREMIO_API_PREFIX, settings
+from comet.metadata.title_index import local_title_index
 from comet.observability import metrics
+from comet.scrapers.manager import scraper_manager
 from comet.services.anime import anime_mapper
 from comet.services.bandwidth import bandwidth_monitor
 from comet.services.debrid_account_scraper import shutdown_account_sync_tasks
@@ -121,6 +123,7 @@ async def lifespan(app: FastAPI):
         cleanup.push_async_callback(teardown_database)
         cleanup.push_async_callback(shutdown_cache_writes)
         cleanup.push_async_callback(anime_mapper.stop)
+        cleanup.push_async_callback(local_title_index.stop)
 
         cleanup.callback(shutdown_executor)
         setup_executor()
@@ -139,6 +142,9 @@ async def lifespan(app: FastAPI):
         async with aiohttp.ClientSession() as session:
             await anime_mapper.load_anime_mapping(session)
 
+        scraper_manager.compile_plans()
+        cleanup.callback(scraper_manager.invalidate_plans)
+
         # Initialize bandwidth monitoring system
         if settings.PROXY_DEBRID_STREAM:
             cleanup.push_async_callback(bandwidth_monitor.shutdown)
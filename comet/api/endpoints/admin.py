@@ -10,6 +10,10 @@ from fastapi.templating import Jinja2Templates
 from comet.background_scraper.worker import background_scraper
 from comet.core.logger import log_capture, logger
 from comet.core.models import database, settings
+from comet.core.scrape import ScrapeContext
+from comet.scrapers.circuit import scraper_circuits
+from comet.scrapers.latency import scraper_latency
+from comet.scrapers.manager import scraper_manager
 from comet.services.bandwidth import bandwidth_monitor
 from comet.utils.formatting import format_bytes
 from comet.utils.signed_session import (
@@ -497,6 +501,45 @@ async def admin_api_metrics(
     return JSONResponse(metrics_data)
 
 
+@router.get(
+    "/admin/api/scrapers/health",
+    tags=["Admin"],
+    summary="Scraper Health",
+    description="Returns circuit breaker states and rolling latency of this worker's scraper instances.",
+)
+async def admin_api_scraper_health(
+    admin_session: str = Cookie(None, description="Admin session token"),
+):
+    require_admin_auth(admin_session)
+    return JSONResponse(
+        {
+            "circuit_breaker_enabled": settings.SCRAPER_CIRCUIT_BREAKER_ENABLED,
+            "circuits": scraper_circuits.snapshot(),
+            "latency": scraper_latency.snapshot(),
+        }
+    )
+
+
+@router.get(
+    "/admin/api/scrapers/plan",
+    tags=["Admin"],
+    summary="Scraper Execution Plan",
+    description="Returns the compiled scraper instances, timeouts, and anime-only gates per scrape context.",
+)
+async def admin_api_scraper_plan(
+    admin_session: str = Cookie(None, description="Admin session token"),
+):
+    require_admin_auth(admin_session)
+    return JSONResponse(
+        {
+            "plans": [
+                scraper_manager.get_plan(context).describe()
+                for context in ScrapeContext
+            ]
+        }
+    )
+
+
 @router.get(
     "/admin/api/background-scraper/status",
     tags=["Admin"],
@@ -1,5 +1,4 @@
 import re
-import time
 from urllib.parse import urlsplit
 
 import mediaflow_proxy.utils.http_utils
@@ -8,12 +7,7 @@ from fastapi import APIRouter, Query, Request
 from fastapi.responses import RedirectResponse
 
 from comet.core.config_validation import config_check
-from comet.core.database import (
-    DOWNLOAD_LINK_CACHE_TTL,
-    build_scope_lookup_params,
-    build_scope_params,
-    database,
-)
+from comet.core.database import database
 from comet.core.logger import logger
 from comet.core.models import settings
 from comet.debrid.exceptions import DebridLinkGenerationError
@@ -23,6 +17,10 @@ from comet.debrid.manager import (
     get_debrid_credentials,
 )
 from comet.metadata.manager import MetadataScraper
+from comet.services.download_links import (
+    cache_download_link,
+    get_cached_download_link,
+)
 from comet.services.status_video import build_status_video_response
 from comet.services.streaming.manager import custom_handle_stream_request
 from comet.utils.http_client import http_client_manager
@@ -115,61 +113,6 @@ def _build_playback_media_id(
     return f"{media_only_id}:{season}:{episode}"
 
 
-async def cache_download_link(
-    *,
-    debrid_service: str,
-    account_key_hash: str,
-    info_hash: str,
-    season: int | None,
-    episode: int | None,
-    download_url: str,
-):
-    params = {
-        "debrid_service": debrid_service,
-        "account_key_hash": account_key_hash,
-        "info_hash": info_hash,
-        "download_url": download_url,
-        "updated_at": time.time(),
-        **build_scope_params(season, episode),
-    }
-    await database.execute(
-        """
-        INSERT INTO download_links_cache (
-            debrid_service,
-            account_key_hash,
-            info_hash,
-            season,
-            episode,
-            season_norm,
-            episode_norm,
-            download_url,
-            updated_at
-        )
-        VALUES (
-            :debrid_service,
-            :account_key_hash,
-            :info_hash,
-            :season,
-            :episode,
-            :season_norm,
-            :episode_norm,
-            :download_url,
-            :updated_at
-        )
-        ON CONFLICT (
-            debrid_service,
-            account_key_hash,
-            info_hash,
-            season_norm,
-            episode_norm
-        ) DO UPDATE SET
-            download_url = EXCLUDED.download_url,
-            updated_at = EXCLUDED.updated_at
-        """,
-        params,
-    )
-
-
 async def _cache_download_link_safely(**kwargs) -> None:
     try:
         await cache_download_link(**kwargs)
@@ -235,31 +178,17 @@ async def playback(
     account_key_hash = build_account_key_hash(debrid_api_key)
 
     session = await http_client_manager.get_session()
-    min_timestamp = time.time() - DOWNLOAD_LINK_CACHE_TTL
-    scope_params = build_scope_lookup_params(season, episode)
-    cached_link = await database.fetch_one(
-        """
-        SELECT download_url
-        FROM download_links_cache
-        WHERE debrid_service = :debrid_service
-        AND account_key_hash = :account_key_hash
-        AND info_hash = :info_hash
-        AND season_norm = :season_norm
-        AND episode_norm = :episode_norm
-        AND updated_at >= :min_timestamp
-        """,
-        {
-            "debrid_service": debrid_service,
-            "account_key_hash": account_key_hash,
-            "info_hash": hash,
-            "min_timestamp": min_timestamp,
-            **scope_params,
-        },
+    cached_download_url = await get_cached_download_link(
+        debrid_service=debrid_service,
+        account_key_hash=account_key_hash,
+        info_hash=hash,
+        season=season,
+        episode=episode,
     )
 
     download_url = None
-    if cached_link:
-        download_url = _valid_download_url(cached_link["download_url"])
+    if cached_download_url:
+        download_url = _valid_download_url(cached_download_url)
 
     ip = get_client_ip(request)
     should_proxy = (
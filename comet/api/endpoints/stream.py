@@ -7,6 +7,11 @@ from comet.core.config_validation import config_check
 from comet.core.models import settings
 from comet.debrid.manager import get_debrid_extension
 from comet.observability import metrics
+from comet.services.download_links import (
+    LinkPrefetchCandidate,
+    LinkPrefetchContext,
+    download_link_prefetcher,
+)
 from comet.services.media_search import MediaSearchStatus, search_media
 from comet.services.trackers import trackers
 from comet.utils.cache import CachePolicies, cached_json_response
@@ -410,6 +415,7 @@ async def stream(
     )
 
     added_hashes = set()
+    prefetch_candidates = [] if settings.DEBRID_LINK_PREFETCH_ENABLED else None
 
     for info_hash in ranked_info_hashes:
         torrent = torrents[info_hash]
@@ -487,6 +493,17 @@ async def stream(
 
             if is_cached:
                 added_hashes.add(info_hash)
+                if prefetch_candidates is not None:
+                    prefetch_candidates.append(
+                        LinkPrefetchCandidate(
+                            service,
+                            debrid_entries[entry_index]["apiKey"],
+                            info_hash,
+                            file_index_str,
+                            torrent_title,
+                            torrent.get("sources") or [],
+                        )
+                    )
 
             if sort_mixed or is_cached:
                 cached_results.append(the_stream)
@@ -542,6 +559,26 @@ async def stream(
 
     has_results = len(final_streams) > 0
 
+    if prefetch_candidates:
+        should_proxy = (
+            settings.PROXY_DEBRID_STREAM
+            and settings.PROXY_DEBRID_STREAM_PASSWORD
+            == config["debridStreamProxyPassword"]
+        )
+        download_link_prefetcher.schedule(
+            background_tasks.add_task,
+            prefetch_candidates,
+            LinkPrefetchContext(
+                media_id,
+                media_only_id,
+                title,
+                search_season,
+                search_episode,
+                search_result.aliases,
+                "" if should_proxy else get_client_ip(request),
+            ),
+        )
+
     return _stream_response(
         {"streams": final_streams},
         is_empty=not has_results,
@@ -14,11 +14,17 @@ from comet.core.logger import logger
 from comet.core.models import database, settings
 from comet.metadata.episode_index import EpisodeIndexService
 from comet.metadata.imdb import resolve_imdb_title
+from comet.metadata.title_index import local_title_index
 from comet.metadata.tmdb import TMDBApi
 from comet.observability import metrics
 from comet.services.media_search import MediaSearchResult, MediaSearchStatus, search_media
+from comet.services.recent_feed import RecentFeed, recent_feed_cache
 from comet.services.trackers import trackers as global_trackers
-from comet.utils.cache import CachePolicies, cached_response
+from comet.utils.cache import (
+    CachePolicies,
+    cached_chunked_response,
+    cached_response,
+)
 from comet.utils.http_client import http_client_manager
 from comet.utils.network import get_client_ip
 from comet.utils.parsing import MediaScope, parse_media_id
@@ -30,6 +36,7 @@ TORZNAB_NAMESPACE = "http://torznab.com/schemas/2015/feed"
 NEWZNAB_NAMESPACE = "http://www.newznab.com/DTD/2010/feeds/attributes/"
 RECENT_CANDIDATE_LIMIT = 20
 FEED_LIMIT = 10_000
+ITEM_FRAGMENT_CACHE_SIZE = settings.TORZNAB_ITEM_CACHE_SIZE
 
 _IMDB_ID = re.compile(r"tt([0-9]{7,10})", re.IGNORECASE)
 _IMDB_ID_WITHOUT_PREFIX = re.compile(r"[0-9]{7,10}")
@@ -46,6 +53,10 @@ _ILLEGAL_XML_CHARACTER = re.compile(
     "[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
 )
 _XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
+_FEED_FOOTER = b"</channel></rss>"
+_LINK_OPEN = b"<link>"
+_FEED_MEDIA_TYPE = "application/rss+xml; charset=utf-8"
+_XML_MEDIA_TYPE = "application/xml; charset=utf-8"
 _XML_ESCAPES = (
     ("&", "&amp;"),
     ("<", "&lt;"),
@@ -295,12 +306,16 @@ async def resolve_search_target(
     if imdb_id is None:
         if not title_query:
             raise TorznabProtocolError(200, "Missing parameter")
-        match = await resolve_imdb_title(
-            session,
-            title_query,
-            media_type=forced_type,
-            year=query.year,
+        match = local_title_index.resolve(
+            title_query, media_type=forced_type, year=query.year
         )
+        if match is None:
+            match = await resolve_imdb_title(
+                session,
+                title_query,
+                media_type=forced_type,
+                year=query.year,
+            )
         if match is None:
             return None
         imdb_id = match.imdb_id
@@ -445,17 +460,22 @@ def _encoded_trackers(candidates: tuple[str, ...]) -> str:
     return "".join(f"&tr={quote(tracker, safe='')}" for tracker in trackers)
 
 
-def build_magnet(info_hash: str, title: str, torrent: dict) -> str:
+def _tracker_candidates(torrent: dict) -> tuple[str, ...]:
     sources = torrent.get("sources")
-    trackers = _encoded_trackers(
-        tuple(sources) if sources else tuple(global_trackers)
-    )
+    return tuple(sources) if sources else tuple(global_trackers)
+
+
+def _magnet(info_hash: str, title: str, encoded_trackers: str) -> str:
     return (
         f"magnet:?xt={quote(f'urn:btih:{info_hash}', safe=':')}"
-        f"&dn={quote(_clean_xml(title), safe='')}{trackers}"
+        f"&dn={quote(_clean_xml(title), safe='')}{encoded_trackers}"
     )
 
 
+def build_magnet(info_hash: str, title: str, torrent: dict) -> str:
+    return _magnet(info_hash, title, _encoded_trackers(_tracker_candidates(torrent)))
+
+
 def _pub_date(value: object, fallback_timestamp: float) -> str:
     try:
         timestamp = float(value)
@@ -475,15 +495,65 @@ def _torznab_attribute(name: str, value: object) -> str:
     return f'<torznab:attr name="{name}" value="{_escape(value)}"/>'
 
 
+@lru_cache(maxsize=ITEM_FRAGMENT_CACHE_SIZE)
+def _item_fragments(
+    info_hash: str,
+    title: str,
+    size: int,
+    encoded_trackers: str,
+    media_type: str,
+) -> tuple[bytes, bytes, bytes, bytes]:
+    """Encode the parts of an item that depend only on the release.
+
+    Returns the fragment before `<pubDate>`, the escaped magnet and the two
+    fragments that follow its `<link>` and enclosure occurrences. The magnet
+    is kept once and emitted three times by `_serialize_items`, and the key
+    holds the shared encoded tracker string rather than the tracker tuple.
+    """
+    category_id = "2000" if media_type == "movie" else "5000"
+    category_name = "Movies" if media_type == "movie" else "TV"
+    # Magnets are percent-encoded ASCII, so "&" is their only XML-significant
+    # character and no illegal-character sweep is needed.
+    magnet = _magnet(info_hash, title, encoded_trackers).replace("&", "&amp;")
+    head = (
+        f"<item><title>{_escape(title)}</title>"
+        f'<guid isPermaLink="false">{info_hash}</guid>'
+    )
+    after_link = (
+        f"</link><category>{category_name}</category><size>{size}</size>"
+        '<enclosure url="'
+    )
+    after_enclosure = "".join(
+        (
+            f'" length="{size}"'
+            ' type="application/x-bittorrent;x-scheme-handler/magnet"/>',
+            _torznab_attribute("category", category_id),
+            _torznab_attribute("size", size),
+            _torznab_attribute("infohash", info_hash),
+            '<torznab:attr name="magneturl" value="',
+        )
+    )
+    return head.encode(), magnet.encode(), after_link.encode(), after_enclosure.encode()
+
+
 def _serialize_items(
     result: MediaSearchResult,
     media_type: str,
     request_timestamp: float,
-) -> list[str]:
-    items = []
-    imdb_digits = result.media_only_id.removeprefix("tt")
-    category_id = "2000" if media_type == "movie" else "5000"
-    category_name = "Movies" if media_type == "movie" else "TV"
+) -> tuple[list[bytes], int]:
+    """Serialize ranked results as encoded `<item>` fragments.
+
+    Each item spans several fragments, so the count is returned alongside.
+    """
+    fragments = []
+    count = 0
+    imdb_attribute = _torznab_attribute("imdb", result.media_only_id.removeprefix("tt"))
+    scope_attributes = ""
+    if media_type == "series":
+        if result.search_season is not None:
+            scope_attributes += _torznab_attribute("season", result.search_season)
+        if result.search_episode is not None:
+            scope_attributes += _torznab_attribute("episode", result.search_episode)
 
     for raw_info_hash in result.ranked_info_hashes:
         if (
@@ -508,58 +578,66 @@ def _serialize_items(
             if type(raw_size) is int and raw_size >= 0
             else 0
         )
-        # Magnets are percent-encoded ASCII, so "&" is their only XML-significant
-        # character and no illegal-character sweep is needed.
-        magnet = build_magnet(info_hash, title, torrent).replace("&", "&amp;")
-        fragments = [
-            f"<item><title>{_escape(title)}</title>"
-            f'<guid isPermaLink="false">{info_hash}</guid>'
-            f"<pubDate>{_pub_date(torrent.get('updatedAt'), request_timestamp)}</pubDate>"
-            f"<link>{magnet}</link>"
-            f"<category>{category_name}</category>"
-            f"<size>{size}</size>"
-            f'<enclosure url="{magnet}" length="{size}"'
-            ' type="application/x-bittorrent;x-scheme-handler/magnet"/>',
-            _torznab_attribute("category", category_id),
-            _torznab_attribute("size", size),
-            _torznab_attribute("infohash", info_hash),
-            f'<torznab:attr name="magneturl" value="{magnet}"/>',
-            _torznab_attribute("imdb", imdb_digits),
-        ]
+        head, magnet, after_link, after_enclosure = _item_fragments(
+            info_hash,
+            title,
+            size,
+            _encoded_trackers(_tracker_candidates(torrent)),
+            media_type,
+        )
+        tail = ['"/>', imdb_attribute]
 
         seeders = torrent.get("seeders")
         if type(seeders) is int and seeders >= 0:
-            fragments.append(_torznab_attribute("seeders", seeders))
-        if media_type == "series":
-            if result.search_season is not None:
-                fragments.append(
-                    _torznab_attribute("season", result.search_season)
-                )
-            if result.search_episode is not None:
-                fragments.append(
-                    _torznab_attribute("episode", result.search_episode)
-                )
+            tail.append(_torznab_attribute("seeders", seeders))
+        tail.append(scope_attributes)
 
         parsed = torrent.get("parsed")
         if parsed is not None:
             parsed_year = getattr(parsed, "year", None)
             if type(parsed_year) is int and parsed_year > 0:
-                fragments.append(_torznab_attribute("year", parsed_year))
+                tail.append(_torznab_attribute("year", parsed_year))
             languages = getattr(parsed, "languages", None)
             if isinstance(languages, list):
                 language = ",".join(
                     value for value in languages if isinstance(value, str) and value
                 )
                 if language:
-                    fragments.append(_torznab_attribute("language", language))
+                    tail.append(_torznab_attribute("language", language))
             resolution = str(getattr(parsed, "resolution", "") or "")
             if resolution and resolution.casefold() != "unknown":
-                fragments.append(_torznab_attribute("resolution", resolution))
+                tail.append(_torznab_attribute("resolution", resolution))
+
+        tail.append("</item>")
+        pub_date = _pub_date(torrent.get("updatedAt"), request_timestamp)
+        fragments.extend(
+            (
+                head,
+                f"<pubDate>{pub_date}</pubDate>".encode(),
+                _LINK_OPEN,
+                magnet,
+                after_link,
+                magnet,
+                after_enclosure,
+                magnet,
+                "".join(tail).encode(),
+            )
+        )
+        count += 1
 
-        fragments.append("</item>")
-        items.append("".join(fragments))
+    return fragments, count
 
-    return items
+
+def _feed_header(link: str, total: int) -> bytes:
+    return _xml_document(
+        f'<rss version="2.0" xmlns:torznab="{TORZNAB_NAMESPACE}"'
+        f' xmlns:newznab="{NEWZNAB_NAMESPACE}"><channel>'
+        "<title>Comet</title>"
+        "<description>Comet torrent results</description>"
+        f"<link>{_escape(link)}</link>"
+        "<language>en</language>"
+        f'<newznab:response offset="0" total="{total}"/>'
+    )
 
 
 def serialize_feed(
@@ -569,31 +647,16 @@ def serialize_feed(
     *,
     request_timestamp: float | None = None,
 ) -> tuple[bytes, int]:
-    items = (
+    fragments, total = (
         _serialize_items(
             result,
             media_type,
             request_timestamp if request_timestamp is not None else time.time(),
         )
         if result is not None and media_type is not None
-        else []
-    )
-    total = len(items)
-
-    return (
-        _xml_document(
-            f'<rss version="2.0" xmlns:torznab="{TORZNAB_NAMESPACE}"'
-            f' xmlns:newznab="{NEWZNAB_NAMESPACE}"><channel>'
-            "<title>Comet</title>"
-            "<description>Comet torrent results</description>"
-            f"<link>{_escape(link)}</link>"
-            "<language>en</language>"
-            f'<newznab:response offset="0" total="{total}"/>',
-            *items,
-            "</channel></rss>",
-        ),
-        total,
+        else ([], 0)
     )
+    return b"".join((_feed_header(link, total), *fragments, _FEED_FOOTER)), total
 
 
 def serialize_caps() -> bytes:
@@ -631,11 +694,7 @@ def _xml_response(
     return cached_response(
         request,
         content,
-        media_type=(
-            "application/rss+xml; charset=utf-8"
-            if feed
-            else "application/xml; charset=utf-8"
-        ),
+        media_type=_FEED_MEDIA_TYPE if feed else _XML_MEDIA_TYPE,
         cache_policy=cache_policy,
     )
 
@@ -661,19 +720,63 @@ def _request_link(request: Request) -> str:
 
 def _feed_response(
     request: Request,
-    result: MediaSearchResult | None = None,
-    media_type: str | None = None,
-) -> tuple[Response, int]:
-    content, total = serialize_feed(result, media_type, _request_link(request))
-    response = _xml_response(
+    fragments: list[bytes] | tuple[bytes, ...] = (),
+    total: int = 0,
+) -> Response:
+    return cached_chunked_response(
         request,
-        content,
-        feed=True,
+        [_feed_header(_request_link(request), total), *fragments, _FEED_FOOTER],
+        media_type=_FEED_MEDIA_TYPE,
         cache_policy=(
             CachePolicies.streams() if total else CachePolicies.empty_results()
         ),
     )
-    return response, total
+
+
+async def _search_target(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    target: SearchTarget,
+) -> tuple[MediaSearchResult, list[bytes], int]:
+    config = config_check(None, strict_b64config=True)
+    if config is None:
+        raise RuntimeError("Default configuration is unavailable")
+    result = await search_media(
+        target.media_type,
+        target.media_id,
+        config,
+        get_client_ip(request),
+        background_tasks.add_task,
+    )
+
+    if result.status is MediaSearchStatus.INVALID:
+        raise TorznabProtocolError(201, "Invalid parameter")
+    if result.status is MediaSearchStatus.DISABLED:
+        raise TorznabProtocolError(203, "Function not available")
+    if result.status is MediaSearchStatus.BUSY:
+        raise TorznabProtocolError(900, "Search busy; retry shortly")
+
+    empty = result.status in {
+        MediaSearchStatus.UNRELEASED,
+        MediaSearchStatus.METADATA_UNAVAILABLE,
+    }
+    fragments, total = (
+        ([], 0) if empty else _serialize_items(result, target.media_type, time.time())
+    )
+    return result, fragments, total
+
+
+async def _build_recent_feed(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    constraint: CategoryConstraint,
+    session,
+) -> RecentFeed:
+    target = await find_recent_target(constraint, session)
+    if target is None:
+        return RecentFeed((), 0, None, None)
+    result, fragments, total = await _search_target(request, background_tasks, target)
+    return RecentFeed(tuple(fragments), total, target.media_type, result.cache_state)
 
 
 @router.get(
@@ -706,7 +809,7 @@ async def torznab_api(
             and constraint.media_type is not None
             and function_type != constraint.media_type
         ):
-            return _feed_response(request)[0]
+            return _feed_response(request)
 
         session = await http_client_manager.get_session()
         if (
@@ -716,49 +819,38 @@ async def torznab_api(
         ):
             if query.season is not None or query.episode is not None:
                 raise TorznabProtocolError(200, "Missing parameter")
-            target = await find_recent_target(constraint, session)
-        else:
-            target = await resolve_search_target(query, constraint, session)
+            # RSS polls are served from the materialized recent feed.
+            feed = await recent_feed_cache.get(
+                constraint.media_type,
+                lambda: _build_recent_feed(
+                    request, background_tasks, constraint, session
+                ),
+            )
+            if feed.media_type is not None:
+                metrics.observe_stream(
+                    feed.media_type,
+                    "torznab",
+                    feed.cache_state,
+                    "success" if feed.total else "empty",
+                    feed.total,
+                )
+            return _feed_response(request, feed.fragments, feed.total)
 
+        target = await resolve_search_target(query, constraint, session)
         if target is None:
-            return _feed_response(request)[0]
+            return _feed_response(request)
 
-        config = config_check(None, strict_b64config=True)
-        if config is None:
-            raise RuntimeError("Default configuration is unavailable")
-        result = await search_media(
-            target.media_type,
-            target.media_id,
-            config,
-            get_client_ip(request),
-            background_tasks.add_task,
+        result, fragments, total = await _search_target(
+            request, background_tasks, target
         )
-
-        if result.status is MediaSearchStatus.INVALID:
-            raise TorznabProtocolError(201, "Invalid parameter")
-        if result.status is MediaSearchStatus.DISABLED:
-            raise TorznabProtocolError(203, "Function not available")
-        if result.status is MediaSearchStatus.BUSY:
-            raise TorznabProtocolError(900, "Search busy; retry shortly")
-
-        empty = result.status in {
-            MediaSearchStatus.UNRELEASED,
-            MediaSearchStatus.METADATA_UNAVAILABLE,
-        }
-        response, total = _feed_response(
-            request,
-            None if empty else result,
-            None if empty else target.media_type,
-        )
-
         metrics.observe_stream(
             target.media_type,
             "torznab",
             result.cache_state,
-            "empty" if total == 0 else "success",
+            "success" if total else "empty",
             total,
         )
-        return response
+        return _feed_response(request, fragments, total)
     except TorznabProtocolError as error:
         return _protocol_error_response(
             request,
@@ -8,6 +8,7 @@ from comet.core.database import database
 from comet.core.logger import logger
 from comet.core.models import settings
 from comet.core.scrape import ScrapeContext
+from comet.metadata.episode_index import EpisodeIndexService
 from comet.metadata.manager import MetadataScraper
 from comet.observability import metrics
 from comet.services.cache_state import mark_scope_scraped
@@ -1378,6 +1379,11 @@ class BackgroundScraperWorker:
         if not episodes:
             return 0
 
+        # Episode scrapes resolve air dates for date-named releases.
+        await EpisodeIndexService(self.metadata_scraper.session).preload_series(
+            media_id
+        )
+
         for episode in episodes:
             if not self.is_running:
                 break
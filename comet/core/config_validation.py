@@ -1,7 +1,9 @@
 import base64
+from collections import OrderedDict
 from functools import lru_cache
 
 import orjson
+import xxhash
 
 from comet.core.models import (
     ConfigModel,
@@ -45,6 +47,14 @@ def _normalize_debrid_config(validated_config: dict) -> dict:
     return validated_config
 
 
+def _fingerprint_config(validated_config: dict) -> str:
+    # Hashes the validated model dump, so key order, whitespace and omitted
+    # defaults in the submitted config do not change the fingerprint.
+    return xxhash.xxh3_128_hexdigest(
+        orjson.dumps(validated_config, option=orjson.OPT_SORT_KEYS)
+    )
+
+
 def _default_validated_config():
     return _DEFAULT_VALIDATED_CONFIG
 
@@ -53,6 +63,14 @@ _DEFAULT_VALIDATED_CONFIG = default_config.copy()
 _DEFAULT_VALIDATED_CONFIG["_debridEntries"] = []
 _DEFAULT_VALIDATED_CONFIG["_enableTorrent"] = True
 _DEFAULT_OPTIONS = rtn_settings_default.options.model_dump()
+_INTERNED_CONFIGS_MAX_ENTRIES = 4096
+_interned_configs: OrderedDict[str, dict] = OrderedDict()
+
+
+def _intern_config(fingerprint: str, validated_config: dict):
+    _interned_configs[fingerprint] = validated_config
+    if len(_interned_configs) > _INTERNED_CONFIGS_MAX_ENTRIES:
+        _interned_configs.popitem(last=False)
 
 
 @lru_cache(maxsize=4096)
@@ -63,6 +81,13 @@ def _parse_and_validate_config(b64config: str):
         validated_config = ConfigModel(**config)
         validated_config = validated_config.model_dump()
 
+        # Equivalent configs share one validated dict and settings model.
+        fingerprint = _fingerprint_config(validated_config)
+        interned_config = _interned_configs.get(fingerprint)
+        if interned_config is not None:
+            _interned_configs.move_to_end(fingerprint)
+            return interned_config
+
         options = _DEFAULT_OPTIONS | (validated_config["options"] or {})
         if type(options["remove_ranks_under"]) not in (int, float):
             options["remove_ranks_under"] = _DEFAULT_OPTIONS["remove_ranks_under"]
@@ -106,6 +131,7 @@ def _parse_and_validate_config(b64config: str):
             )
 
         validated_config = _normalize_debrid_config(validated_config)
+        _intern_config(fingerprint, validated_config)
 
         return validated_config
     except Exception:
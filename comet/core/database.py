@@ -739,6 +739,11 @@ async def _perform_startup_cleanup(current_time: float):
             "updated_at < :min_timestamp",
             {"min_timestamp": current_time - settings.TORRENT_CACHE_TTL},
         )
+        await _delete_where(
+            "resolved_magnets",
+            "updated_at < :min_timestamp",
+            {"min_timestamp": current_time - settings.TORRENT_CACHE_TTL},
+        )
 
     await _delete_where(
         "debrid_availability",
@@ -746,6 +751,12 @@ async def _perform_startup_cleanup(current_time: float):
         {"min_timestamp": current_time - settings.DEBRID_CACHE_TTL},
     )
 
+    await _delete_where(
+        "debrid_negative_availability",
+        "expires_at < :current_time",
+        {"current_time": current_time},
+    )
+
     await _delete_where(
         "debrid_account_magnets",
         "synced_at < :min_timestamp",
@@ -772,6 +783,18 @@ async def _perform_startup_cleanup(current_time: float):
         {"current_time": current_time},
     )
 
+    await _delete_where(
+        "scraper_response_cache",
+        "expires_at < :current_time",
+        {"current_time": current_time},
+    )
+
+    await _delete_where(
+        "torrent_link_cache",
+        "expires_at < :current_time",
+        {"current_time": current_time},
+    )
+
     run_retention_days = settings.BACKGROUND_SCRAPER_RUN_RETENTION_DAYS
     if run_retention_days > 0:
         await _delete_where(
@@ -1,7 +1,7 @@
 import atexit
 import multiprocessing
 import signal
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from comet.core.models import settings
 
@@ -12,6 +12,7 @@ except ValueError:
     _mp_context = multiprocessing.get_context("spawn")
 
 app_executor = None
+parse_executor = None
 max_workers = settings.EXECUTOR_MAX_WORKERS
 # if max_workers is None:
 #     cpu_count = os.cpu_count() or 1
@@ -31,10 +32,13 @@ def setup_executor():
 
 
 def shutdown_executor():
-    global app_executor
+    global app_executor, parse_executor
     if app_executor:
         app_executor.shutdown(wait=True, cancel_futures=True)
         app_executor = None
+    if parse_executor:
+        parse_executor.shutdown(wait=True, cancel_futures=True)
+        parse_executor = None
 
 
 atexit.register(shutdown_executor)
@@ -42,3 +46,15 @@ atexit.register(shutdown_executor)
 
 def get_executor():
     return app_executor
+
+
+def get_parse_executor():
+    # Page parsing stays in threads: payloads are large relative to the work,
+    # and the process pool is reserved for filtering and ranking.
+    global parse_executor
+    if parse_executor is None:
+        parse_executor = ThreadPoolExecutor(
+            max_workers=settings.SCRAPER_PARSE_WORKERS,
+            thread_name_prefix="comet-parse",
+        )
+    return parse_executor
@@ -222,6 +222,9 @@ def log_startup_info(settings):
         "COMET",
         f"ProcessPoolExecutor: {max_workers} workers",
     )
+    logger.log(
+        "COMET", f"Scraper Parse Threads: {settings.SCRAPER_PARSE_WORKERS} workers"
+    )
     logger.log(
         "COMET",
         f"HTTP Client Pool: limit={settings.HTTP_CLIENT_LIMIT} "
@@ -324,7 +327,7 @@ def log_startup_info(settings):
 
     logger.log(
         "COMET",
-        f"Database ({settings.DATABASE_TYPE}): {settings.DATABASE_PATH if IS_SQLITE else censor_url(settings.DATABASE_URL)} - Batch Size: {settings.DATABASE_BATCH_SIZE} - TTL: metadata={settings.METADATA_CACHE_TTL}s, torrents={settings.TORRENT_CACHE_TTL}s, live_torrents={settings.LIVE_TORRENT_CACHE_TTL}s, debrid={settings.DEBRID_CACHE_TTL}s, metrics={settings.METRICS_CACHE_TTL}s - Debrid Ratio: {settings.DEBRID_CACHE_CHECK_RATIO} - Startup Cleanup Interval: {settings.DATABASE_STARTUP_CLEANUP_INTERVAL}s - Memory Trim Interval: {memory_trim_value}{force_ipv4_info}{replicas}",
+        f"Database ({settings.DATABASE_TYPE}): {settings.DATABASE_PATH if IS_SQLITE else censor_url(settings.DATABASE_URL)} - Batch Size: {settings.DATABASE_BATCH_SIZE} - TTL: metadata={settings.METADATA_CACHE_TTL}s, metadata_negative={settings.METADATA_NEGATIVE_CACHE_TTL}s, torrents={settings.TORRENT_CACHE_TTL}s, live_torrents={settings.LIVE_TORRENT_CACHE_TTL}s, debrid={settings.DEBRID_CACHE_TTL}s, debrid_negative={settings.DEBRID_NEGATIVE_CACHE_TTL}s, metrics={settings.METRICS_CACHE_TTL}s - Debrid Ratio: {settings.DEBRID_CACHE_CHECK_RATIO} - Startup Cleanup Interval: {settings.DATABASE_STARTUP_CLEANUP_INTERVAL}s - Memory Trim Interval: {memory_trim_value}{force_ipv4_info}{replicas}",
     )
 
     if IS_SQLITE:
@@ -353,6 +356,7 @@ def log_startup_info(settings):
 
     anime_mapping_refresh = (
         f" - Refresh Interval: {settings.ANIME_MAPPING_REFRESH_INTERVAL}s"
+        f" - Snapshot: {settings.ANIME_MAPPING_SNAPSHOT_PATH or 'disabled'}"
         if settings.ANIME_MAPPING_ENABLED
         else ""
     )
@@ -414,6 +418,12 @@ def log_startup_info(settings):
         f"INDEXER_LANGUAGES={indexer_languages}",
     )
     logger.log("COMET", f"Get Torrent Timeout: {settings.GET_TORRENT_TIMEOUT}s")
+    logger.log(
+        "COMET",
+        "Torrent Link Cache: "
+        f"ttl={settings.TORRENT_LINK_CACHE_TTL}s, "
+        f"negative={settings.TORRENT_LINK_NEGATIVE_CACHE_TTL}s",
+    )
     logger.log("COMET", f"Magnet Resolve Timeout: {settings.MAGNET_RESOLVE_TIMEOUT}s")
     logger.log("COMET", f"Catalog Timeout: {settings.CATALOG_TIMEOUT}s")
     logger.log("COMET", f"Scrape Lock TTL: {settings.SCRAPE_LOCK_TTL}s")
@@ -429,6 +439,52 @@ def log_startup_info(settings):
             for selector, timeout in sorted(settings.SCRAPER_TIMEOUT_OVERRIDES.items())
         )
         logger.log("COMET", f"Scraper Timeout Overrides: {overrides}")
+    if settings.SCRAPER_ADAPTIVE_TIMEOUTS:
+        logger.log(
+            "COMET",
+            "Adaptive Scraper Timeouts: "
+            f"window={settings.SCRAPER_ADAPTIVE_TIMEOUT_WINDOW}, "
+            f"min_samples={settings.SCRAPER_ADAPTIVE_TIMEOUT_MIN_SAMPLES}, "
+            f"floor={settings.SCRAPER_ADAPTIVE_TIMEOUT_FLOOR:g}s, "
+            f"max_factor={settings.SCRAPER_ADAPTIVE_TIMEOUT_MAX_FACTOR:g}, "
+            f"yield={settings.SCRAPER_ADAPTIVE_LOW_YIELD_RATIO:g}"
+            f"-{settings.SCRAPER_ADAPTIVE_HIGH_YIELD_RATIO:g}",
+        )
+    else:
+        logger.log("COMET", "Adaptive Scraper Timeouts: False")
+    if settings.SCRAPER_CIRCUIT_BREAKER_ENABLED:
+        logger.log(
+            "COMET",
+            "Scraper Circuit Breakers: "
+            f"window={settings.SCRAPER_CIRCUIT_BREAKER_WINDOW}, "
+            f"min_requests={settings.SCRAPER_CIRCUIT_BREAKER_MIN_REQUESTS}, "
+            f"error_ratio={settings.SCRAPER_CIRCUIT_BREAKER_ERROR_RATIO:g}, "
+            "consecutive_timeouts="
+            f"{settings.SCRAPER_CIRCUIT_BREAKER_CONSECUTIVE_TIMEOUTS}, "
+            f"cooldown={settings.SCRAPER_CIRCUIT_BREAKER_COOLDOWN}s",
+        )
+    else:
+        logger.log("COMET", "Scraper Circuit Breakers: False")
+    if settings.SCRAPER_HEDGED_SCRAPERS:
+        logger.log(
+            "COMET",
+            "Hedged Scrapers: "
+            f"{', '.join(settings.SCRAPER_HEDGED_SCRAPERS)} "
+            f"(delay={settings.SCRAPER_HEDGE_DELAY:g}s until p90 is known)",
+        )
+    else:
+        logger.log("COMET", "Hedged Scrapers: False")
+    if settings.SCRAPER_RESPONSE_CACHE_ENABLED:
+        logger.log(
+            "COMET",
+            "Scraper Response Cache: "
+            f"ttl={settings.SCRAPER_RESPONSE_CACHE_TTL}s, "
+            f"stale={settings.SCRAPER_RESPONSE_CACHE_STALE_TTL}s, "
+            f"max={settings.SCRAPER_RESPONSE_CACHE_MAX_BYTES} bytes, "
+            f"shared={settings.SCRAPER_RESPONSE_CACHE_SHARED}",
+        )
+    else:
+        logger.log("COMET", "Scraper Response Cache: False")
     logger.log("COMET", f"Download Torrent Files: {settings.DOWNLOAD_TORRENT_FILES}")
 
     comet_url = (
@@ -609,11 +665,24 @@ def log_startup_info(settings):
         f"Debrid Stream Proxy: {settings.PROXY_DEBRID_STREAM}{debrid_stream_proxy_display}",
     )
 
-    logger.log("COMET", f"StremThru URL: {settings.STREMTHRU_URL}")
+    logger.log(
+        "COMET",
+        f"StremThru URL: {settings.STREMTHRU_URL} - Availability Batch Window: {settings.STREMTHRU_AVAILABILITY_BATCH_WINDOW}s - Availability Concurrency: {settings.STREMTHRU_AVAILABILITY_MIN_CONCURRENCY}-{settings.STREMTHRU_AVAILABILITY_MAX_CONCURRENCY}",
+    )
+    link_prefetch_display = (
+        f" - Top: {settings.DEBRID_LINK_PREFETCH_TOP_N} - Max In-Flight: {settings.DEBRID_LINK_PREFETCH_MAX_INFLIGHT} - Account Limit: {settings.DEBRID_LINK_PREFETCH_ACCOUNT_LIMIT}/{settings.DEBRID_LINK_PREFETCH_ACCOUNT_WINDOW}s"
+        if settings.DEBRID_LINK_PREFETCH_ENABLED
+        else ""
+    )
+    logger.log(
+        "COMET",
+        f"Debrid Link Prefetch: {settings.DEBRID_LINK_PREFETCH_ENABLED}{link_prefetch_display}",
+    )
     logger.log(
         "COMET",
         "Debrid Account Scrape: "
         f"refresh={settings.DEBRID_ACCOUNT_SCRAPE_REFRESH_INTERVAL}s "
+        f"full_sync={settings.DEBRID_ACCOUNT_SCRAPE_FULL_SYNC_INTERVAL}s "
         f"ttl={settings.DEBRID_ACCOUNT_SCRAPE_CACHE_TTL}s "
         f"max_snapshot={settings.DEBRID_ACCOUNT_SCRAPE_MAX_SNAPSHOT_ITEMS} "
         f"max_match={settings.DEBRID_ACCOUNT_SCRAPE_MAX_MATCH_ITEMS} "
@@ -630,6 +699,9 @@ def log_startup_info(settings):
         f"Disable Torrent Streams: {settings.DISABLE_TORRENT_STREAMS}{disabled_streams_info}",
     )
 
+    logger.log("COMET", f"Torznab Recent Feed TTL: {settings.TORZNAB_RECENT_FEED_TTL}s")
+    logger.log("COMET", f"Torznab Item Cache Size: {settings.TORZNAB_ITEM_CACHE_SIZE}")
+
     logger.log("COMET", f"Remove Adult Content: {settings.REMOVE_ADULT_CONTENT}")
     logger.log(
         "COMET", f"Smart Language Detection: {settings.SMART_LANGUAGE_DETECTION}"
@@ -27,7 +27,10 @@ from RTN.models import (
 
 from comet.core.db_router import ReplicaAwareDatabase
 from comet.core.logger import logger
-from comet.core.scrape import normalize_scraper_timeout_selector
+from comet.core.scrape import (
+    normalize_scraper_name,
+    normalize_scraper_timeout_selector,
+)
 from comet.core.server_settings import ServerSettings
 
 _comet_fk_enabled = False
@@ -63,6 +66,7 @@ _SCRAPER_MODE_FIELDS = (
 )
 _POSITIVE_WORK_COUNT_FIELDS = (
     "EXECUTOR_MAX_WORKERS",
+    "SCRAPER_PARSE_WORKERS",
     "DATABASE_BATCH_SIZE",
     "NYAA_MAX_CONCURRENT_PAGES",
     "ANIMETOSHO_MAX_CONCURRENT_PAGES",
@@ -71,10 +75,24 @@ _POSITIVE_WORK_COUNT_FIELDS = (
     "BITMAGNET_MAX_CONCURRENT_PAGES",
     "BACKGROUND_SCRAPER_CONCURRENT_WORKERS",
     "FILTER_PARSE_CACHE_SHARDS",
+    "SCRAPER_ADAPTIVE_TIMEOUT_WINDOW",
+    "SCRAPER_ADAPTIVE_TIMEOUT_MIN_SAMPLES",
+    "SCRAPER_CIRCUIT_BREAKER_WINDOW",
+    "SCRAPER_CIRCUIT_BREAKER_MIN_REQUESTS",
+    "SCRAPER_CIRCUIT_BREAKER_CONSECUTIVE_TIMEOUTS",
+    "SCRAPER_CIRCUIT_BREAKER_COOLDOWN",
+    "STREMTHRU_AVAILABILITY_MIN_CONCURRENCY",
+    "STREMTHRU_AVAILABILITY_MAX_CONCURRENCY",
+    "DEBRID_LINK_PREFETCH_TOP_N",
+    "DEBRID_LINK_PREFETCH_MAX_INFLIGHT",
+    "DEBRID_LINK_PREFETCH_ACCOUNT_LIMIT",
+    "DEBRID_LINK_PREFETCH_ACCOUNT_WINDOW",
 )
 _SCRAPE_TIMEOUT_FIELDS = (
     "LIVE_SCRAPE_TIMEOUT",
     "BACKGROUND_SCRAPE_TIMEOUT",
+    "SCRAPER_ADAPTIVE_TIMEOUT_FLOOR",
+    "SCRAPER_HEDGE_DELAY",
 )
 _POSITIVE_COMETNET_OPERATION_FIELDS = (
     "COMETNET_MAX_PEERS",
@@ -107,6 +125,18 @@ _NONNEGATIVE_HTTP_OPERATION_FIELDS = (
     "HTTP_CACHE_STALE_WHILE_REVALIDATE",
     "HTTP_CACHE_MANIFEST_TTL",
     "HTTP_CACHE_CONFIGURE_TTL",
+    "SCRAPER_RESPONSE_CACHE_TTL",
+    "SCRAPER_RESPONSE_CACHE_STALE_TTL",
+    "TORRENT_LINK_CACHE_TTL",
+    "TORRENT_LINK_NEGATIVE_CACHE_TTL",
+    "DEBRID_NEGATIVE_CACHE_TTL",
+    "METADATA_NEGATIVE_CACHE_TTL",
+    "METADATA_MEMORY_CACHE_SIZE",
+    "ANIME_ENTRY_CACHE_SIZE",
+    "STREMTHRU_AVAILABILITY_BATCH_WINDOW",
+    "DEBRID_ACCOUNT_SCRAPE_FULL_SYNC_INTERVAL",
+    "TORZNAB_RECENT_FEED_TTL",
+    "TORZNAB_ITEM_CACHE_SIZE",
 )
 _POSITIVE_HTTP_OPERATION_FIELDS = (
     "RATELIMIT_RETRY_BASE_DELAY",
@@ -114,6 +144,7 @@ _POSITIVE_HTTP_OPERATION_FIELDS = (
     "HTTP_CLIENT_LIMIT_PER_HOST",
     "HTTP_CLIENT_KEEPALIVE_TIMEOUT",
     "HTTP_CLIENT_TIMEOUT_TOTAL",
+    "SCRAPER_RESPONSE_CACHE_MAX_BYTES",
 )
 
 
@@ -150,6 +181,7 @@ class AppSettings(ServerSettings):
     ADDON_ID: str | None = "stremio.comet.fast"
     ADDON_NAME: str | None = "Comet"
     EXECUTOR_MAX_WORKERS: int | None = 1
+    SCRAPER_PARSE_WORKERS: int = 2
     ADMIN_DASHBOARD_PASSWORD: str | None = Field(default_factory=_generate_secret)
     ADMIN_DASHBOARD_SESSION_TTL: int | None = 86400
     CONFIGURE_PAGE_PASSWORD: str | None = None
@@ -171,15 +203,33 @@ class AppSettings(ServerSettings):
     MEMORY_TRIM_INTERVAL: int | None = 300
     DATABASE_FORCE_IPV4_RESOLUTION: bool | None = False
     METADATA_CACHE_TTL: int | None = 2592000  # 30 days
+    METADATA_NEGATIVE_CACHE_TTL: int | None = 60  # 1 minute
+    METADATA_MEMORY_CACHE_SIZE: int | None = 10000
     TORRENT_CACHE_TTL: int | None = 2592000  # 30 days
     LIVE_TORRENT_CACHE_TTL: int | None = 604800  # 7 days
     DEBRID_CACHE_TTL: int | None = 86400  # 1 day
+    DEBRID_NEGATIVE_CACHE_TTL: int | None = 900  # 15 minutes
     METRICS_CACHE_TTL: int | None = 60  # 1 minute
     DEBRID_CACHE_CHECK_RATIO: float | None = 0.0  # 0.0 to 1.0
     SCRAPE_LOCK_TTL: int | None = 300  # 5 minutes
     LIVE_SCRAPE_TIMEOUT: float = 30.0
     BACKGROUND_SCRAPE_TIMEOUT: float = 30.0
     SCRAPER_TIMEOUT_OVERRIDES: dict[str, float] = Field(default_factory=dict)
+    SCRAPER_ADAPTIVE_TIMEOUTS: bool = False
+    SCRAPER_ADAPTIVE_TIMEOUT_WINDOW: int = 100
+    SCRAPER_ADAPTIVE_TIMEOUT_MIN_SAMPLES: int = 20
+    SCRAPER_ADAPTIVE_TIMEOUT_FLOOR: float = 3.0
+    SCRAPER_ADAPTIVE_TIMEOUT_MAX_FACTOR: float = 2.0
+    SCRAPER_ADAPTIVE_LOW_YIELD_RATIO: float = 0.05
+    SCRAPER_ADAPTIVE_HIGH_YIELD_RATIO: float = 0.5
+    SCRAPER_CIRCUIT_BREAKER_ENABLED: bool = False
+    SCRAPER_CIRCUIT_BREAKER_WINDOW: int = 20
+    SCRAPER_CIRCUIT_BREAKER_MIN_REQUESTS: int = 10
+    SCRAPER_CIRCUIT_BREAKER_ERROR_RATIO: float = 0.5
+    SCRAPER_CIRCUIT_BREAKER_CONSECUTIVE_TIMEOUTS: int = 3
+    SCRAPER_CIRCUIT_BREAKER_COOLDOWN: int = 60
+    SCRAPER_HEDGED_SCRAPERS: list[str] = Field(default_factory=list)
+    SCRAPER_HEDGE_DELAY: float = 2.0
     INDEXER_MANAGER_TYPE: str | None = None
     INDEXER_MANAGER_URL: str | None = "http://127.0.0.1:9117"
     INDEXER_MANAGER_API_KEY: str | None = None
@@ -200,6 +250,8 @@ class AppSettings(ServerSettings):
     PROWLARR_API_KEY: str | None = None
     PROWLARR_INDEXERS: list[str] = Field(default_factory=list)
     GET_TORRENT_TIMEOUT: int | None = 5
+    TORRENT_LINK_CACHE_TTL: int | None = 604800  # 7 days
+    TORRENT_LINK_NEGATIVE_CACHE_TTL: int | None = 3600
     MAGNET_RESOLVE_TIMEOUT: int | None = 60
     CATALOG_TIMEOUT: int | None = 30
     DOWNLOAD_TORRENT_FILES: bool | None = False
@@ -256,17 +308,28 @@ class AppSettings(ServerSettings):
     PROXY_DEBRID_STREAM_DEBRID_DEFAULT_APIKEY: str | None = None
     PROXY_DEBRID_STREAM_INACTIVITY_THRESHOLD: int | None = 300
     DEBRID_ACCOUNT_SCRAPE_REFRESH_INTERVAL: int = 900
+    DEBRID_ACCOUNT_SCRAPE_FULL_SYNC_INTERVAL: int = 21600
     DEBRID_ACCOUNT_SCRAPE_CACHE_TTL: int = 86400
     DEBRID_ACCOUNT_SCRAPE_MAX_SNAPSHOT_ITEMS: int = 5000
     DEBRID_ACCOUNT_SCRAPE_MAX_MATCH_ITEMS: int = 1500
     DEBRID_ACCOUNT_SCRAPE_INITIAL_WARM_TIMEOUT: float = 5.0
     STREMTHRU_URL: str | None = "https://stremthru.13377001.xyz"
+    STREMTHRU_AVAILABILITY_BATCH_WINDOW: float = 0.005
+    STREMTHRU_AVAILABILITY_MIN_CONCURRENCY: int = 1
+    STREMTHRU_AVAILABILITY_MAX_CONCURRENCY: int = 8
+    DEBRID_LINK_PREFETCH_ENABLED: bool = False
+    DEBRID_LINK_PREFETCH_TOP_N: int = 2
+    DEBRID_LINK_PREFETCH_MAX_INFLIGHT: int = 4
+    DEBRID_LINK_PREFETCH_ACCOUNT_LIMIT: int = 20
+    DEBRID_LINK_PREFETCH_ACCOUNT_WINDOW: int = 3600
     DISABLE_TORRENT_STREAMS: bool | None = False
     TORRENT_DISABLED_STREAM_NAME: str | None = "[INFO] Comet"
     TORRENT_DISABLED_STREAM_DESCRIPTION: str | None = (
         "Direct torrent playback is disabled on this server."
     )
     TORRENT_DISABLED_STREAM_URL: str | None = "https://comet.feels.legal"
+    TORZNAB_RECENT_FEED_TTL: int | None = 60
+    TORZNAB_ITEM_CACHE_SIZE: int | None = 2048
     PUBLIC_BASE_URL: str | None = None
     REMOVE_ADULT_CONTENT: bool | None = False
     BACKGROUND_SCRAPER_ENABLED: bool | None = False
@@ -295,6 +358,8 @@ class AppSettings(ServerSettings):
     BACKGROUND_SCRAPER_RUN_RETENTION_DAYS: int | None = 30
     ANIME_MAPPING_ENABLED: bool | None = True
     ANIME_MAPPING_REFRESH_INTERVAL: int | None = 432000
+    ANIME_MAPPING_SNAPSHOT_PATH: str | None = "data/anime_mapping.bin"
+    ANIME_ENTRY_CACHE_SIZE: int | None = 10000
     DIGITAL_RELEASE_FILTER: bool | None = False
     TMDB_READ_ACCESS_TOKEN: str | None = None
     GLOBAL_PROXY_URL: str | None = None
@@ -315,6 +380,12 @@ class AppSettings(ServerSettings):
     HTTP_CACHE_STALE_WHILE_REVALIDATE: int | None = 60
     HTTP_CACHE_MANIFEST_TTL: int | None = 86400
     HTTP_CACHE_CONFIGURE_TTL: int | None = 86400
+    SCRAPER_RESPONSE_CACHE_ENABLED: bool | None = False
+    SCRAPER_RESPONSE_CACHE_TTL: int | None = 300
+    SCRAPER_RESPONSE_CACHE_STALE_TTL: int | None = 600
+    SCRAPER_RESPONSE_CACHE_TTL_OVERRIDES: dict[str, int] = Field(default_factory=dict)
+    SCRAPER_RESPONSE_CACHE_MAX_BYTES: int | None = 67108864  # 64 MiB
+    SCRAPER_RESPONSE_CACHE_SHARED: bool | None = False
     DOWNLOAD_GENERIC_TRACKERS: bool | None = False
     SMART_LANGUAGE_DETECTION: bool | None = False
 
@@ -477,6 +548,67 @@ class AppSettings(ServerSettings):
             normalized[normalized_selector] = cls._normalize_scrape_timeout(timeout)
         return normalized
 
+    @field_validator("SCRAPER_ADAPTIVE_TIMEOUT_MAX_FACTOR", mode="before")
+    def validate_adaptive_timeout_factor(cls, value):
+        if isinstance(value, bool):
+            raise ValueError("SCRAPER_ADAPTIVE_TIMEOUT_MAX_FACTOR must be a number")
+        try:
+            normalized = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(
+                "SCRAPER_ADAPTIVE_TIMEOUT_MAX_FACTOR must be a number"
+            ) from None
+        if not math.isfinite(normalized) or normalized < 1:
+            raise ValueError("SCRAPER_ADAPTIVE_TIMEOUT_MAX_FACTOR must be at least 1")
+        return normalized
+
+    @field_validator(
+        "SCRAPER_ADAPTIVE_LOW_YIELD_RATIO",
+        "SCRAPER_ADAPTIVE_HIGH_YIELD_RATIO",
+        "SCRAPER_CIRCUIT_BREAKER_ERROR_RATIO",
+        mode="before",
+    )
+    def validate_scraper_ratio(cls, value):
+        if isinstance(value, bool):
+            raise ValueError("scraper ratios must be numbers")
+        try:
+            normalized = float(value)
+        except (TypeError, ValueError):
+            raise ValueError("scraper ratios must be numbers") from None
+        if not math.isfinite(normalized) or not 0 <= normalized <= 1:
+            raise ValueError("scraper ratios must be between 0 and 1")
+        return normalized
+
+    @field_validator("SCRAPER_HEDGED_SCRAPERS", mode="before")
+    def normalize_hedged_scrapers(cls, value):
+        if isinstance(value, str):
+            value = [value]
+        if not isinstance(value, list):
+            raise ValueError("SCRAPER_HEDGED_SCRAPERS must be a JSON list")
+        return list(dict.fromkeys(normalize_scraper_name(name) for name in value))
+
+    @field_validator("SCRAPER_RESPONSE_CACHE_TTL_OVERRIDES", mode="before")
+    def normalize_scraper_response_cache_ttl_overrides(cls, value):
+        if not isinstance(value, dict):
+            raise ValueError(
+                "SCRAPER_RESPONSE_CACHE_TTL_OVERRIDES must be a JSON object"
+            )
+
+        normalized = {}
+        for scraper_name, ttl in value.items():
+            normalized_name = normalize_scraper_name(scraper_name)
+            if normalized_name in normalized:
+                raise ValueError(
+                    "SCRAPER_RESPONSE_CACHE_TTL_OVERRIDES contains duplicate "
+                    f"normalized scraper {normalized_name!r}"
+                )
+            if isinstance(ttl, bool) or not isinstance(ttl, int) or ttl < 0:
+                raise ValueError(
+                    "scraper response cache TTLs must be non-negative integers"
+                )
+            normalized[normalized_name] = ttl
+        return normalized
+
     @field_validator(
         *_POSITIVE_WORK_COUNT_FIELDS,
         *_POSITIVE_COMETNET_OPERATION_FIELDS,
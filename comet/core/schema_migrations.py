@@ -20,6 +20,7 @@ from comet.core.schema_specs import (
     DEBRID_ACCOUNT_MAGNETS_TABLE_SPEC,
     DEBRID_ACCOUNT_SYNC_STATE_TABLE_SPEC,
     DEBRID_AVAILABILITY_TABLE_SPEC,
+    DEBRID_NEGATIVE_AVAILABILITY_TABLE_SPEC,
     DMM_ENTRIES_TABLE_SPEC,
     DMM_INGESTED_FILES_TABLE_SPEC,
     DOWNLOAD_LINKS_CACHE_TABLE_SPEC,
@@ -32,9 +33,12 @@ from comet.core.schema_specs import (
     MEDIA_METADATA_CACHE_TABLE_SPEC,
     METRICS_CACHE_TABLE_SPEC,
     NULL_SCOPE_SENTINEL,
+    RESOLVED_MAGNETS_TABLE_SPEC,
     SCRAPE_LOCKS_TABLE_SPEC,
+    SCRAPER_RESPONSE_CACHE_TABLE_SPEC,
     SERIES_EPISODE_INDEX_REFRESH_TABLE_SPEC,
     SERIES_EPISODE_INDEX_TABLE_SPEC,
+    TORRENT_LINK_CACHE_TABLE_SPEC,
     TORRENTS_TABLE_SPEC,
     UNIQUE_INDEX_SPECS,
     LegacyColumnMigration,
@@ -957,6 +961,42 @@ async def _migration_imdb_title_lookup(ctx: MigrationContext):
     return True
 
 
+async def _migration_scraper_response_cache(ctx: MigrationContext):
+    await _ensure_managed_table(ctx, SCRAPER_RESPONSE_CACHE_TABLE_SPEC)
+    return True
+
+
+async def _migration_torrent_link_cache(ctx: MigrationContext):
+    await _ensure_managed_table(ctx, TORRENT_LINK_CACHE_TABLE_SPEC)
+    return True
+
+
+async def _migration_resolved_magnets(ctx: MigrationContext):
+    await _ensure_managed_table(ctx, RESOLVED_MAGNETS_TABLE_SPEC)
+    return True
+
+
+async def _migration_debrid_negative_availability(ctx: MigrationContext):
+    await _ensure_managed_table(ctx, DEBRID_NEGATIVE_AVAILABILITY_TABLE_SPEC)
+    return True
+
+
+async def _migration_debrid_account_title_index(ctx: MigrationContext):
+    await _ensure_managed_table(ctx, DEBRID_ACCOUNT_MAGNETS_TABLE_SPEC)
+    return True
+
+
+async def _migration_debrid_account_full_sync_state(ctx: MigrationContext):
+    await _ensure_managed_table(ctx, DEBRID_ACCOUNT_SYNC_STATE_TABLE_SPEC)
+    return True
+
+
+async def _migration_anime_mapping_diff_refresh(ctx: MigrationContext):
+    await _ensure_managed_table(ctx, ANIME_ENTRIES_TABLE_SPEC)
+    await _ensure_managed_table(ctx, ANIME_MAPPING_STATE_TABLE_SPEC)
+    return True
+
+
 async def _migration_tmdb_title_aliases(ctx: MigrationContext):
     await _ensure_managed_table(ctx, MEDIA_METADATA_CACHE_TABLE_SPEC)
     await ctx.database.execute(
@@ -1018,4 +1058,23 @@ MIGRATIONS = [
         _migration_media_demand_scrape_coverage,
     ),
     ("2026072701_imdb_title_lookup", _migration_imdb_title_lookup),
+    ("2026101901_scraper_response_cache", _migration_scraper_response_cache),
+    ("2026101902_torrent_link_cache", _migration_torrent_link_cache),
+    ("2026101903_resolved_magnets", _migration_resolved_magnets),
+    (
+        "2026101904_debrid_negative_availability",
+        _migration_debrid_negative_availability,
+    ),
+    (
+        "2026101905_debrid_account_title_index",
+        _migration_debrid_account_title_index,
+    ),
+    (
+        "2026101906_debrid_account_full_sync_state",
+        _migration_debrid_account_full_sync_state,
+    ),
+    (
+        "2026101907_anime_mapping_diff_refresh",
+        _migration_anime_mapping_diff_refresh,
+    ),
 ]
@@ -235,6 +235,65 @@ IMDB_TITLE_LOOKUP_TABLE_SPEC = ManagedTableSpec(
     ),
 )
 
+SCRAPER_RESPONSE_CACHE_TABLE_SPEC = ManagedTableSpec(
+    table_name="scraper_response_cache",
+    create_sql="""
+        CREATE TABLE {table_name} (
+            cache_key TEXT PRIMARY KEY,
+            status INTEGER NOT NULL,
+            body TEXT NOT NULL,
+            encoding TEXT,
+            content_type TEXT,
+            stored_at REAL NOT NULL,
+            fresh_until REAL NOT NULL,
+            expires_at REAL NOT NULL
+        )
+    """,
+    index_sql=(
+        """
+            CREATE INDEX IF NOT EXISTS idx_scraper_response_cache_expires_v1
+            ON {table_name} (expires_at)
+        """,
+    ),
+)
+
+TORRENT_LINK_CACHE_TABLE_SPEC = ManagedTableSpec(
+    table_name="torrent_link_cache",
+    create_sql="""
+        CREATE TABLE {table_name} (
+            link_key TEXT PRIMARY KEY,
+            info_hash TEXT,
+            metadata_json TEXT,
+            magnet_url TEXT,
+            updated_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        )
+    """,
+    index_sql=(
+        """
+            CREATE INDEX IF NOT EXISTS idx_torrent_link_cache_expires_v1
+            ON {table_name} (expires_at)
+        """,
+    ),
+)
+
+RESOLVED_MAGNETS_TABLE_SPEC = ManagedTableSpec(
+    table_name="resolved_magnets",
+    create_sql="""
+        CREATE TABLE {table_name} (
+            info_hash TEXT PRIMARY KEY,
+            metadata_json TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )
+    """,
+    index_sql=(
+        """
+            CREATE INDEX IF NOT EXISTS idx_resolved_magnets_updated_v1
+            ON {table_name} (updated_at)
+        """,
+    ),
+)
+
 SERIES_EPISODE_INDEX_TABLE_SPEC = ManagedTableSpec(
     table_name="series_episode_index",
     create_sql="""
@@ -409,6 +468,29 @@ DEBRID_AVAILABILITY_TABLE_SPEC = ManagedTableSpec(
     ),
 )
 
+DEBRID_NEGATIVE_AVAILABILITY_TABLE_SPEC = ManagedTableSpec(
+    table_name="debrid_negative_availability",
+    create_sql="""
+        CREATE TABLE {table_name} (
+            debrid_service TEXT NOT NULL,
+            info_hash TEXT NOT NULL,
+            media_scope TEXT NOT NULL,
+            season_norm INTEGER NOT NULL DEFAULT -1,
+            episode_norm INTEGER NOT NULL DEFAULT -1,
+            expires_at REAL NOT NULL,
+            PRIMARY KEY (
+                debrid_service, info_hash, media_scope, season_norm, episode_norm
+            )
+        )
+    """,
+    index_sql=(
+        """
+            CREATE INDEX IF NOT EXISTS idx_debrid_negative_expires_v1
+            ON {table_name} (expires_at)
+        """,
+    ),
+)
+
 DOWNLOAD_LINKS_CACHE_TABLE_SPEC = ManagedTableSpec(
     table_name="download_links_cache",
     create_sql="""
@@ -447,6 +529,9 @@ DEBRID_ACCOUNT_MAGNETS_TABLE_SPEC = ManagedTableSpec(
             status TEXT NOT NULL,
             added_at REAL NOT NULL,
             synced_at REAL NOT NULL,
+            parsed_title TEXT,
+            parsed_year INTEGER,
+            parsed_json TEXT,
             PRIMARY KEY (debrid_service, account_key_hash, magnet_id)
         )
     """,
@@ -457,12 +542,28 @@ DEBRID_ACCOUNT_MAGNETS_TABLE_SPEC = ManagedTableSpec(
             legacy_name="timestamp",
             backfill_expression="COALESCE(synced_at, timestamp)",
         ),
+        LegacyColumnMigration(
+            column_name="parsed_title",
+            column_sql="parsed_title TEXT",
+        ),
+        LegacyColumnMigration(
+            column_name="parsed_year",
+            column_sql="parsed_year INTEGER",
+        ),
+        LegacyColumnMigration(
+            column_name="parsed_json",
+            column_sql="parsed_json TEXT",
+        ),
     ),
     index_sql=(
         """
             CREATE INDEX IF NOT EXISTS idx_debrid_account_lookup_v2
             ON {table_name} (debrid_service, account_key_hash, synced_at, added_at)
         """,
+        """
+            CREATE INDEX IF NOT EXISTS idx_debrid_account_title_v1
+            ON {table_name} (debrid_service, account_key_hash, parsed_title)
+        """,
         """
             CREATE INDEX IF NOT EXISTS idx_debrid_account_synced_at_v1
             ON {table_name} (synced_at)
@@ -477,6 +578,7 @@ DEBRID_ACCOUNT_SYNC_STATE_TABLE_SPEC = ManagedTableSpec(
             debrid_service TEXT NOT NULL,
             account_key_hash TEXT NOT NULL,
             last_sync_at REAL NOT NULL,
+            last_full_sync_at REAL,
             PRIMARY KEY (debrid_service, account_key_hash)
         )
     """,
@@ -487,6 +589,10 @@ DEBRID_ACCOUNT_SYNC_STATE_TABLE_SPEC = ManagedTableSpec(
             legacy_name="last_sync",
             backfill_expression="COALESCE(last_sync_at, last_sync)",
         ),
+        LegacyColumnMigration(
+            column_name="last_full_sync_at",
+            column_sql="last_full_sync_at REAL",
+        ),
     ),
 )
 
@@ -603,7 +709,8 @@ ANIME_ENTRIES_TABLE_SPEC = ManagedTableSpec(
     create_sql="""
         CREATE TABLE {table_name} (
             id INTEGER PRIMARY KEY,
-            data_json TEXT NOT NULL
+            data_json TEXT NOT NULL,
+            content_hash TEXT
         )
     """,
     legacy_columns=(
@@ -613,6 +720,10 @@ ANIME_ENTRIES_TABLE_SPEC = ManagedTableSpec(
             legacy_name="data",
             backfill_expression="COALESCE(data_json, data)",
         ),
+        LegacyColumnMigration(
+            column_name="content_hash",
+            column_sql="content_hash TEXT",
+        ),
     ),
 )
 
@@ -621,9 +732,21 @@ ANIME_MAPPING_STATE_TABLE_SPEC = ManagedTableSpec(
     create_sql="""
         CREATE TABLE {table_name} (
             id INTEGER PRIMARY KEY CHECK (id = 1),
-            refreshed_at REAL NOT NULL
+            refreshed_at REAL NOT NULL,
+            checked_at REAL,
+            sources_json TEXT
         )
     """,
+    legacy_columns=(
+        LegacyColumnMigration(
+            column_name="checked_at",
+            column_sql="checked_at REAL",
+        ),
+        LegacyColumnMigration(
+            column_name="sources_json",
+            column_sql="sources_json TEXT",
+        ),
+    ),
 )
 
 ANIME_PROVIDER_OVERRIDES_TABLE_SPEC = ManagedTableSpec(
@@ -845,11 +968,15 @@ CURRENT_NON_UNIQUE_INDEX_SPECS = (
     KODI_SETUP_CODES_TABLE_SPEC,
     MEDIA_METADATA_CACHE_TABLE_SPEC,
     IMDB_TITLE_LOOKUP_TABLE_SPEC,
+    SCRAPER_RESPONSE_CACHE_TABLE_SPEC,
+    TORRENT_LINK_CACHE_TABLE_SPEC,
+    RESOLVED_MAGNETS_TABLE_SPEC,
     SERIES_EPISODE_INDEX_TABLE_SPEC,
     SERIES_EPISODE_INDEX_REFRESH_TABLE_SPEC,
     MEDIA_DEMAND_TABLE_SPEC,
     TORRENTS_TABLE_SPEC,
     DEBRID_AVAILABILITY_TABLE_SPEC,
+    DEBRID_NEGATIVE_AVAILABILITY_TABLE_SPEC,
     DOWNLOAD_LINKS_CACHE_TABLE_SPEC,
     DEBRID_ACCOUNT_MAGNETS_TABLE_SPEC,
     ACTIVE_CONNECTIONS_TABLE_SPEC,
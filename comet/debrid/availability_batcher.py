@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from comet.core.logger import logger
+from comet.core.models import settings
+from comet.observability import metrics
+
+MAX_BATCH_HASHES = 500
+
+InstantFetcher = Callable[[list[str], str | None], Awaitable[dict | None]]
+
+
+@dataclass(slots=True)
+class _PendingBatch:
+    service: str
+    fetch: InstantFetcher
+    hashes: dict[str, None] = field(default_factory=dict)
+    sids: set[str] = field(default_factory=set)
+    waiters: list[tuple[list[str], asyncio.Future]] = field(default_factory=list)
+    flush_handle: asyncio.TimerHandle | None = None
+
+
+def _filter_response(response, hashes: list[str]):
+    if not isinstance(response, dict):
+        return response
+    data = response.get("data")
+    if not isinstance(data, dict) or not isinstance(data.get("items"), list):
+        return response
+
+    wanted = {info_hash.lower() for info_hash in hashes}
+    items = [
+        item
+        for item in data["items"]
+        if isinstance(item, dict)
+        and isinstance(item.get("hash"), str)
+        and item["hash"].lower() in wanted
+    ]
+    return {**response, "data": {**data, "items": items}}
+
+
+class InstantAvailabilityBatcher:
+    """
+    Coalesces concurrent StremThru magnet checks for the same store account.
+
+    Calls arriving within `STREMTHRU_AVAILABILITY_BATCH_WINDOW` share one
+    upstream request of at most 500 hashes, and each caller receives the
+    response filtered down to the hashes it asked for.
+    """
+
+    def __init__(self):
+        self._pending: dict[tuple, _PendingBatch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def check(
+        self,
+        key: tuple,
+        service: str,
+        hashes: list[str],
+        sid: str | None,
+        fetch: InstantFetcher,
+    ):
+        window = settings.STREMTHRU_AVAILABILITY_BATCH_WINDOW
+        if window <= 0 or len(hashes) >= MAX_BATCH_HASHES:
+            return await fetch(hashes, sid)
+
+        batch = self._pending.get(key)
+        if batch is not None:
+            new_hashes = sum(1 for info_hash in hashes if info_hash not in batch.hashes)
+            if len(batch.hashes) + new_hashes > MAX_BATCH_HASHES:
+                self._flush(key, batch)
+                batch = None
+        if batch is None:
+            batch = _PendingBatch(service, fetch)
+            batch.flush_handle = asyncio.get_running_loop().call_later(
+                window, self._flush, key, batch
+            )
+            self._pending[key] = batch
+
+        batch.hashes.update(dict.fromkeys(hashes))
+        if sid:
+            batch.sids.add(sid)
+        future = asyncio.get_running_loop().create_future()
+        batch.waiters.append((hashes, future))
+        if len(batch.hashes) >= MAX_BATCH_HASHES:
+            self._flush(key, batch)
+
+        return await future
+
+    def _flush(self, key: tuple, batch: _PendingBatch) -> None:
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+        if batch.flush_handle is not None:
+            batch.flush_handle.cancel()
+            batch.flush_handle = None
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _run(batch: _PendingBatch) -> None:
+        # The stream id is only forwarded when every caller shares it.
+        sid = next(iter(batch.sids)) if len(batch.sids) == 1 else None
+        try:
+            response = await batch.fetch(list(batch.hashes), sid)
+        except Exception as e:
+            logger.warning(
+                f"Exception while checking batched availability on {batch.service}: {e}"
+            )
+            response = None
+
+        metrics.observe_debrid_availability_batch(batch.service, len(batch.waiters))
+        single_caller = len(batch.waiters) == 1
+        for hashes, future in batch.waiters:
+            if future.done():
+                continue
+            future.set_result(
+                response if single_caller else _filter_response(response, hashes)
+            )
+
+
+instant_availability_batcher = InstantAvailabilityBatcher()
@@ -0,0 +1,87 @@
+import asyncio
+from collections import deque
+
+from comet.core.models import settings
+from comet.observability import metrics
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for upstream requests to one debrid store.
+
+    Each successful request raises the limit by `1 / limit` (about one slot
+    per round of requests) and a throttled request (429 or 5xx) halves it.
+    Outcomes of requests already in flight when the limit was halved are not
+    counted again, so a burst of concurrent failures backs off only once.
+    """
+
+    def __init__(self, service: str, minimum: int, maximum: int):
+        self.service = service
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(maximum)
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._recovering = 0
+        metrics.observe_debrid_concurrency_limit(service, self.maximum)
+
+    async def acquire(self) -> None:
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation.
+                self.in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(future)
+            raise
+
+    def release(self, *, throttled: bool = False, succeeded: bool = True) -> None:
+        self.in_flight -= 1
+        recovering = self._recovering > 0
+        if recovering:
+            self._recovering -= 1
+
+        if throttled and not recovering:
+            self.limit = max(float(self.minimum), self.limit / 2)
+            # Requests already in flight were sent under the old limit, so
+            # their outcomes do not trigger another decrease.
+            self._recovering = self.in_flight
+            metrics.observe_debrid_concurrency_limit(self.service, int(self.limit))
+        elif succeeded and not throttled and self.limit < self.maximum:
+            previous = int(self.limit)
+            self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+            if int(self.limit) != previous:
+                metrics.observe_debrid_concurrency_limit(self.service, int(self.limit))
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            future = self._waiters.popleft()
+            if future.done():
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+
+
+_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_availability_limiter(service: str) -> AdaptiveConcurrencyLimiter:
+    limiter = _limiters.get(service)
+    if limiter is None:
+        minimum = settings.STREMTHRU_AVAILABILITY_MIN_CONCURRENCY
+        limiter = AdaptiveConcurrencyLimiter(
+            service,
+            minimum,
+            max(minimum, settings.STREMTHRU_AVAILABILITY_MAX_CONCURRENCY),
+        )
+        _limiters[service] = limiter
+    return limiter
@@ -96,6 +96,7 @@ async def retrieve_debrid_availability(
     tracker_map: dict,
     sources_map: dict,
     target_air_date: str | None = None,
+    checked_hashes: set | None = None,
 ):
     return await get_debrid(
         session, video_id, media_only_id, debrid_service, debrid_api_key, ip
@@ -105,4 +106,5 @@ async def retrieve_debrid_availability(
         tracker_map,
         sources_map,
         target_air_date=target_air_date,
+        checked_hashes=checked_hashes,
     )
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from urllib.parse import quote, unquote
 
 import aiohttp
@@ -7,8 +8,11 @@ from RTN import normalize_title, parse, title_match
 from comet.core.execution import get_executor
 from comet.core.logger import logger
 from comet.core.models import settings
+from comet.debrid.availability_batcher import instant_availability_batcher
+from comet.debrid.concurrency import get_availability_limiter
 from comet.debrid.exceptions import DebridAuthError, DebridLinkGenerationError
 from comet.metadata.episode_index import EpisodeIndexService
+from comet.observability import metrics
 from comet.services.debrid_cache import schedule_cache_availability
 from comet.services.filtering import exact_alias_match
 from comet.services.torrent_manager import torrent_update_queue
@@ -246,14 +250,46 @@ class StremThru:
             )
 
     async def get_instant(self, magnets: list):
+        return await instant_availability_batcher.check(
+            (self.store_name, self.store_token, self.client_ip),
+            self.store_name,
+            magnets,
+            self.sid,
+            self._fetch_instant,
+        )
+
+    async def _fetch_instant(self, magnets: list, sid: str | None):
+        limiter = get_availability_limiter(self.store_name)
+        await limiter.acquire()
+        started_at = time.perf_counter()
+        outcome = "error"
         try:
-            url = f"{self.base_url}/magnets/check?magnet={','.join(magnets)}&client_ip={self.client_ip}&sid={self.sid}"
+            url = f"{self.base_url}/magnets/check?magnet={','.join(magnets)}&client_ip={self.client_ip}"
+            if sid:
+                url += f"&sid={sid}"
             async with self.session.get(url, headers=self._headers()) as response:
-                return await response.json()
+                status = response.status
+                if status == 429 or status >= 500:
+                    outcome = "throttled"
+                payload = await response.json()
+            if outcome != "throttled":
+                outcome = "success"
+            return payload
         except Exception as e:
             logger.warning(
                 f"Exception while checking hash instant availability on {self.store_name}: {e}"
             )
+        finally:
+            limiter.release(
+                throttled=outcome == "throttled", succeeded=outcome == "success"
+            )
+            metrics.observe_debrid(
+                self.store_name,
+                "instant_check",
+                outcome,
+                time.perf_counter() - started_at,
+                0,
+            )
 
     async def list_magnets(self, limit: int = 500, offset: int = 0):
         try:
@@ -277,6 +313,7 @@ class StremThru:
         tracker_map: dict,
         sources_map: dict,
         target_air_date: str | None = None,
+        checked_hashes: set | None = None,
     ):
         await self.check_premium()
 
@@ -291,6 +328,14 @@ class StremThru:
             tasks.append(self.get_instant(chunk))
 
         responses = await asyncio.gather(*tasks)
+        if checked_hashes is not None:
+            # Only chunks the store actually answered count as checked, so a
+            # failed request is never mistaken for an uncached result.
+            for chunk, response in zip(chunks, responses):
+                if isinstance(response, dict) and isinstance(
+                    response.get("data"), dict
+                ):
+                    checked_hashes.update(chunk)
 
         is_offcloud = self.store_name == "offcloud"
         cached_torrents, filenames_to_parse = _prepare_cached_torrents(
@@ -321,6 +366,7 @@ class StremThru:
             parsed_iter = iter(parsed_results)
 
         files = []
+        torrent_updates = []
         for torrent in cached_torrents:
             info_hash = torrent["info_hash"]
             seeders = seeders_map.get(info_hash, 0)
@@ -390,9 +436,12 @@ class StremThru:
                 }
 
                 files.append(file_info)
-                await torrent_update_queue.add_torrent_info(
-                    file_info, self.media_only_id
-                )
+                torrent_updates.append(file_info)
+
+        # One enqueue per response keeps queue backpressure out of the file loop.
+        await torrent_update_queue.add_torrent_infos(
+            torrent_updates, self.media_only_id
+        )
 
         logger.log(
             "SCRAPER",
@@ -1,5 +1,8 @@
+import bisect
 import math
 import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import date
 
 import aiohttp
@@ -10,35 +13,19 @@ from comet.metadata.tmdb import TMDBApi
 
 _CINEMETA_SERIES_META_URL = "https://v3-cinemeta.strem.io/meta/series/{series_id}.json"
 
-_TARGET_EPISODE_AIR_DATE_QUERY = """
-    SELECT air_date
-    FROM series_episode_index
-    WHERE series_id = :series_id
-      AND season = CAST(:season AS INTEGER)
-      AND episode = CAST(:episode AS INTEGER)
-      AND (
-          CAST(:min_timestamp AS REAL) IS NULL
-          OR updated_at >= CAST(:min_timestamp AS REAL)
-      )
-"""
-
-_EPISODE_BY_AIR_DATE_QUERY = """
-    SELECT season, episode
-    FROM series_episode_index
-    WHERE series_id = :series_id
-      AND air_date = :air_date
-      AND (
-          CAST(:min_timestamp AS REAL) IS NULL
-          OR updated_at >= CAST(:min_timestamp AS REAL)
-      )
-    ORDER BY season, episode
-    LIMIT 1
-"""
+# Loaded series indexes are shared by every request in the process. Entries
+# are reloaded after a short TTL so refreshes made by other workers show up.
+_SERIES_INDEX_CACHE_MAX_ENTRIES = 4096
+_SERIES_INDEX_CACHE_TTL = 300
 
-_SERIES_INDEX_LAST_REFRESH_QUERY = """
-    SELECT refreshed_at
+_SERIES_EPISODE_INDEX_QUERY = """
+    SELECT NULL AS season, NULL AS episode, NULL AS air_date, refreshed_at AS updated_at
     FROM series_episode_index_refresh
     WHERE series_id = :series_id
+    UNION ALL
+    SELECT season, episode, air_date, updated_at
+    FROM series_episode_index
+    WHERE series_id = :series_id
 """
 
 _UPSERT_SERIES_EPISODE_INDEX_QUERY = """
@@ -92,10 +79,119 @@ def _normalize_air_date(raw_value) -> str | None:
     return candidate
 
 
+def _coerce_timestamp(raw_value) -> float | None:
+    if isinstance(raw_value, bool):
+        return None
+    try:
+        timestamp = float(raw_value)
+    except (TypeError, ValueError):
+        return None
+    return timestamp if math.isfinite(timestamp) else None
+
+
+@dataclass(slots=True)
+class _SeriesEpisodeIndex:
+    loaded_at: float
+    refreshed_at: float | None = None
+    air_dates: dict[tuple[int, int], tuple[str, float]] = field(default_factory=dict)
+    episodes_by_air_date: dict[str, list[tuple[int, int, float]]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def from_rows(cls, rows, refreshed_at: float | None = None):
+        index = cls(loaded_at=time.monotonic(), refreshed_at=refreshed_at)
+        for row in rows:
+            if row["season"] is None:
+                index.refreshed_at = _coerce_timestamp(row["updated_at"])
+                continue
+            updated_at = _coerce_timestamp(row["updated_at"])
+            if updated_at is not None:
+                index.add(row["season"], row["episode"], row["air_date"], updated_at)
+        return index
+
+    def add(self, season, episode, raw_air_date, updated_at: float) -> None:
+        air_date = _normalize_air_date(raw_air_date)
+        if air_date is None:
+            return
+        key = (int(season), int(episode))
+        previous = self.air_dates.get(key)
+        if previous is not None:
+            episodes = self.episodes_by_air_date[previous[0]]
+            episodes.remove((*key, previous[1]))
+            if not episodes:
+                del self.episodes_by_air_date[previous[0]]
+        self.air_dates[key] = (air_date, updated_at)
+        bisect.insort(
+            self.episodes_by_air_date.setdefault(air_date, []), (*key, updated_at)
+        )
+
+    def get_air_date(
+        self, season: int, episode: int, min_timestamp: float | None
+    ) -> str | None:
+        entry = self.air_dates.get((season, episode))
+        if entry is None:
+            return None
+        air_date, updated_at = entry
+        if min_timestamp is not None and updated_at < min_timestamp:
+            return None
+        return air_date
+
+    def get_episode(
+        self, air_date: str, min_timestamp: float | None
+    ) -> tuple[int, int] | None:
+        for season, episode, updated_at in self.episodes_by_air_date.get(air_date, ()):
+            if min_timestamp is None or updated_at >= min_timestamp:
+                return season, episode
+        return None
+
+    def is_fresh(self, min_timestamp: float) -> bool:
+        return self.refreshed_at is not None and self.refreshed_at >= min_timestamp
+
+
+class _SeriesIndexCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _SeriesEpisodeIndex] = OrderedDict()
+
+    def get(self, series_id: str) -> _SeriesEpisodeIndex | None:
+        index = self._entries.get(series_id)
+        if index is None:
+            return None
+        if time.monotonic() - index.loaded_at >= _SERIES_INDEX_CACHE_TTL:
+            del self._entries[series_id]
+            return None
+        self._entries.move_to_end(series_id)
+        return index
+
+    def put(self, series_id: str, index: _SeriesEpisodeIndex) -> None:
+        self._entries[series_id] = index
+        self._entries.move_to_end(series_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_series_index_cache = _SeriesIndexCache(_SERIES_INDEX_CACHE_MAX_ENTRIES)
+
+
 class EpisodeIndexService:
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
 
+    async def _get_series_index(self, series_id: str) -> _SeriesEpisodeIndex:
+        index = _series_index_cache.get(series_id)
+        if index is None:
+            rows = await database.fetch_all(
+                _SERIES_EPISODE_INDEX_QUERY,
+                {"series_id": series_id},
+            )
+            index = _SeriesEpisodeIndex.from_rows(rows)
+            _series_index_cache.put(series_id, index)
+        return index
+
     async def _get_cached_air_date(
         self,
         series_id: str,
@@ -103,18 +199,8 @@ class EpisodeIndexService:
         episode: int,
         min_timestamp: float | None,
     ) -> str | None:
-        row = await database.fetch_one(
-            _TARGET_EPISODE_AIR_DATE_QUERY,
-            {
-                "series_id": series_id,
-                "season": season,
-                "episode": episode,
-                "min_timestamp": min_timestamp,
-            },
-        )
-        if row is None:
-            return None
-        return _normalize_air_date(row["air_date"])
+        index = await self._get_series_index(series_id)
+        return index.get_air_date(season, episode, min_timestamp)
 
     async def _get_cached_episode(
         self,
@@ -122,32 +208,14 @@ class EpisodeIndexService:
         air_date: str,
         min_timestamp: float | None,
     ) -> tuple[int, int] | None:
-        row = await database.fetch_one(
-            _EPISODE_BY_AIR_DATE_QUERY,
-            {
-                "series_id": series_id,
-                "air_date": air_date,
-                "min_timestamp": min_timestamp,
-            },
-        )
-        if row is None:
-            return None
-        return int(row["season"]), int(row["episode"])
+        index = await self._get_series_index(series_id)
+        return index.get_episode(air_date, min_timestamp)
 
     async def _is_series_index_fresh(
         self, series_id: str, min_timestamp: float
     ) -> bool:
-        last_refreshed = await database.fetch_val(
-            _SERIES_INDEX_LAST_REFRESH_QUERY,
-            {"series_id": series_id},
-        )
-        if isinstance(last_refreshed, bool):
-            return False
-        try:
-            refreshed_at = float(last_refreshed)
-        except (TypeError, ValueError):
-            return False
-        return math.isfinite(refreshed_at) and refreshed_at >= min_timestamp
+        index = await self._get_series_index(series_id)
+        return index.is_fresh(min_timestamp)
 
     async def _upsert_series_air_dates(self, rows: list[dict]) -> None:
         if not rows:
@@ -176,6 +244,9 @@ class EpisodeIndexService:
             await self._delete_series_air_dates(series_id)
             await self._upsert_series_air_dates(rows)
             await self._upsert_series_refresh(series_id, refreshed_at)
+        _series_index_cache.put(
+            series_id, _SeriesEpisodeIndex.from_rows(rows, refreshed_at)
+        )
 
     async def _refresh_from_cinemeta(self, series_id: str) -> None:
         try:
@@ -183,7 +254,14 @@ class EpisodeIndexService:
                 _CINEMETA_SERIES_META_URL.format(series_id=series_id)
             ) as response:
                 if response.status == 404:
-                    await self._upsert_series_refresh(series_id, time.time())
+                    refreshed_at = time.time()
+                    await self._upsert_series_refresh(series_id, refreshed_at)
+                    _series_index_cache.put(
+                        series_id,
+                        _SeriesEpisodeIndex(
+                            loaded_at=time.monotonic(), refreshed_at=refreshed_at
+                        ),
+                    )
                     return
                 response.raise_for_status()
                 payload = await response.json()
@@ -258,6 +336,7 @@ class EpisodeIndexService:
             if air_date is None:
                 return None
 
+            updated_at = time.time()
             await self._upsert_series_air_dates(
                 [
                     {
@@ -265,10 +344,13 @@ class EpisodeIndexService:
                         "season": season,
                         "episode": episode,
                         "air_date": air_date,
-                        "updated_at": time.time(),
+                        "updated_at": updated_at,
                     }
                 ]
             )
+            index = _series_index_cache.get(series_id)
+            if index is not None:
+                index.add(season, episode, air_date, updated_at)
             return air_date
         except Exception as exc:
             logger.warning(
@@ -344,3 +426,12 @@ class EpisodeIndexService:
                 return cached_episode
 
         return await self._get_cached_episode(series_id, normalized_air_date, None)
+
+    async def preload_series(self, series_id: str) -> None:
+        """Load a series index into memory, refreshing it from Cinemeta when stale."""
+        if not isinstance(series_id, str) or not series_id.startswith("tt"):
+            return
+
+        min_timestamp = time.time() - settings.METADATA_CACHE_TTL
+        if not await self._is_series_index_fresh(series_id, min_timestamp):
+            await self._refresh_from_cinemeta(series_id)
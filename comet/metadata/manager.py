@@ -1,5 +1,6 @@
 import asyncio
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from weakref import WeakValueDictionary
 
@@ -97,6 +98,81 @@ class _CacheEntry:
     aliases: dict | None
 
 
+@dataclass(frozen=True, slots=True)
+class _CachedRow:
+    title: str | None
+    year: int | None
+    year_end: int | None
+    aliases: dict | None
+    metadata_updated_at: float | None
+    aliases_updated_at: float | None
+
+
+class _MetadataMemoryCache:
+    """
+    Per-process LRU of decoded `media_metadata_cache` rows.
+
+    Rows keep their database timestamps, so freshness follows
+    `METADATA_CACHE_TTL` exactly as it does for rows read from the database.
+    Concurrent reads of one id share a single query, and ids whose provider
+    returned no metadata are not retried for `METADATA_NEGATIVE_CACHE_TTL`.
+    Cached alias dicts are shared between requests and must not be mutated.
+    """
+
+    def __init__(self):
+        self._rows: OrderedDict[str, _CachedRow] = OrderedDict()
+        self._failures: OrderedDict[str, float] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def get(self, cache_id: str) -> _CachedRow | None:
+        row = self._rows.get(cache_id)
+        if row is not None:
+            self._rows.move_to_end(cache_id)
+        return row
+
+    def put(self, cache_id: str, row: _CachedRow):
+        max_entries = settings.METADATA_MEMORY_CACHE_SIZE
+        if max_entries <= 0:
+            return
+        self._rows[cache_id] = row
+        self._rows.move_to_end(cache_id)
+        while len(self._rows) > max_entries:
+            self._rows.popitem(last=False)
+
+    async def load(self, cache_id: str, loader):
+        task = self._inflight.get(cache_id)
+        if task is None:
+            task = asyncio.ensure_future(loader(cache_id))
+            self._inflight[cache_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_id, None))
+        # One caller being cancelled must not cancel the shared read.
+        return await asyncio.shield(task)
+
+    def mark_failed(self, cache_id: str, current_time: float):
+        ttl = settings.METADATA_NEGATIVE_CACHE_TTL
+        if ttl <= 0:
+            return
+        self._failures[cache_id] = current_time + ttl
+        self._failures.move_to_end(cache_id)
+        while len(self._failures) > max(settings.METADATA_MEMORY_CACHE_SIZE, 1):
+            self._failures.popitem(last=False)
+
+    def recently_failed(self, cache_id: str, current_time: float) -> bool:
+        expires_at = self._failures.get(cache_id)
+        if expires_at is None:
+            return False
+        if expires_at <= current_time:
+            del self._failures[cache_id]
+            return False
+        return True
+
+    def clear(self):
+        self._rows.clear()
+        self._failures.clear()
+
+
+_metadata_memory_cache = _MetadataMemoryCache()
+
 _metadata_refresh_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
 
 
@@ -168,6 +244,20 @@ class MetadataScraper:
 
         return aliases if isinstance(aliases, dict) else None
 
+    @classmethod
+    def _decode_row(cls, row) -> _CachedRow:
+        aliases_json = row["aliases_json"]
+        return _CachedRow(
+            title=row["title"],
+            year=row["year"],
+            year_end=row["year_end"],
+            aliases=(
+                {} if aliases_json is None else cls._load_cached_aliases(aliases_json)
+            ),
+            metadata_updated_at=row["metadata_updated_at"],
+            aliases_updated_at=row["aliases_updated_at"],
+        )
+
     @staticmethod
     def _is_fresh(timestamp, current_time: float) -> bool:
         return isinstance(timestamp, (int, float)) and timestamp >= (
@@ -176,46 +266,60 @@ class MetadataScraper:
 
     def _build_cache_entry(
         self,
-        row,
+        row: _CachedRow,
         season: int | None,
         episode: int | None,
         current_time: float,
     ) -> _CacheEntry:
         metadata = None
-        if row["title"] is not None and self._is_fresh(
-            row["metadata_updated_at"], current_time
+        if row.title is not None and self._is_fresh(
+            row.metadata_updated_at, current_time
         ):
             metadata = {
-                "title": row["title"],
-                "year": row["year"],
-                "year_end": row["year_end"],
+                "title": row.title,
+                "year": row.year,
+                "year_end": row.year_end,
                 "season": season,
                 "episode": episode,
             }
 
         aliases = None
-        if self._is_fresh(row["aliases_updated_at"], current_time):
-            if row["aliases_json"] is None:
-                aliases = {}
-            else:
-                aliases = self._load_cached_aliases(row["aliases_json"])
+        if self._is_fresh(row.aliases_updated_at, current_time):
+            aliases = row.aliases
 
         return _CacheEntry(metadata=metadata, aliases=aliases)
 
+    async def _load_cached_row(self, media_id: str) -> _CachedRow | None:
+        row = await database.fetch_one(
+            _CACHE_SELECT_QUERY,
+            {"media_id": media_id},
+        )
+        if row is None:
+            return None
+
+        cached_row = self._decode_row(row)
+        _metadata_memory_cache.put(media_id, cached_row)
+        return cached_row
+
     async def get_cached(
         self,
         media_id: str,
         season: int | None,
         episode: int | None,
     ):
-        row = await database.fetch_one(
-            _CACHE_SELECT_QUERY,
-            {"media_id": media_id},
-        )
-        if row is None:
+        cached_row = _metadata_memory_cache.get(media_id)
+        if cached_row is not None:
+            cached = self._build_cache_entry(cached_row, season, episode, time.time())
+            if cached.metadata is not None and cached.aliases is not None:
+                return cached
+
+        # Partial or stale memory entries are re-read, as another worker may
+        # have refreshed the row since.
+        cached_row = await _metadata_memory_cache.load(media_id, self._load_cached_row)
+        if cached_row is None:
             return _CacheEntry(metadata=None, aliases=None)
 
-        return self._build_cache_entry(row, season, episode, time.time())
+        return self._build_cache_entry(cached_row, season, episode, time.time())
 
     async def cache_metadata(
         self,
@@ -257,7 +361,9 @@ class MetadataScraper:
                 metadata=metadata,
                 aliases=aliases if aliases is not None else {},
             )
-        return self._build_cache_entry(row, season, episode, current_time)
+        cached_row = self._decode_row(row)
+        _metadata_memory_cache.put(media_id, cached_row)
+        return self._build_cache_entry(cached_row, season, episode, current_time)
 
     async def _fetch_cached(
         self,
@@ -273,6 +379,13 @@ class MetadataScraper:
         cached = await self.get_cached(cache_id, season, episode)
         if cached.metadata is not None and cached.aliases is not None:
             return cached.metadata, cached.aliases
+        if (
+            cached.metadata is None
+            and cached.aliases is not None
+            and provided_metadata is None
+            and _metadata_memory_cache.recently_failed(cache_id, time.time())
+        ):
+            return None, cached.aliases
 
         async with _get_metadata_refresh_lock(cache_id):
             cached = await self.get_cached(cache_id, season, episode)
@@ -288,7 +401,7 @@ class MetadataScraper:
                 if provided_metadata is not None:
                     metadata = provided_metadata
                     update_metadata = True
-                else:
+                elif not _metadata_memory_cache.recently_failed(cache_id, time.time()):
                     pending["metadata"] = asyncio.create_task(
                         self.get_metadata(
                             media_id,
@@ -308,6 +421,8 @@ class MetadataScraper:
             if metadata_task := pending.get("metadata"):
                 metadata = metadata_task.result()
                 update_metadata = metadata is not None
+                if metadata is None:
+                    _metadata_memory_cache.mark_failed(cache_id, time.time())
             if aliases_task := pending.get("aliases"):
                 aliases = aliases_task.result()
 
@@ -0,0 +1,329 @@
+import asyncio
+import re
+import time
+import unicodedata
+from dataclasses import dataclass
+
+import orjson
+
+from comet.core.logger import logger
+from comet.core.models import database, settings
+from comet.metadata.imdb import ImdbTitleMatch
+from comet.services.anime import _ANIME_MEDIA_TYPES
+from comet.utils.year import parse_year
+
+_TITLE_INDEX_REFRESH_INTERVAL = 900
+_IMDB_ID = re.compile(r"tt[0-9]{7,10}")
+_TOKEN_SEPARATOR = re.compile(r"[\W_]+")
+
+_METADATA_TITLES_QUERY = """
+    SELECT media_id, title, year, aliases_json
+    FROM media_metadata_cache
+    WHERE media_id LIKE :imdb_prefix
+      AND title IS NOT NULL
+"""
+_RESOLVED_TITLES_QUERY = """
+    SELECT query_key, imdb_id, media_type, year
+    FROM imdb_title_lookup
+    WHERE updated_at >= CAST(:min_timestamp AS REAL)
+"""
+_SCRAPER_ITEM_TYPES_QUERY = """
+    SELECT media_id, media_type
+    FROM background_scraper_items
+"""
+_INDEXED_SERIES_QUERY = """
+    SELECT series_id
+    FROM series_episode_index_refresh
+"""
+_ANIME_TITLES_QUERY = """
+    SELECT i.provider_id, e.data_json
+    FROM anime_ids i
+    INNER JOIN anime_entries e ON e.id = i.entry_id
+    WHERE i.provider = 'imdb'
+"""
+
+
+def normalize_title_sequence(title: str) -> tuple[str, ...]:
+    """Casefold, strip accents and split a title into its ordered word tokens."""
+    decomposed = unicodedata.normalize("NFKD", title.casefold())
+    stripped = "".join(
+        character for character in decomposed if not unicodedata.combining(character)
+    )
+    return tuple(token for token in _TOKEN_SEPARATOR.split(stripped) if token)
+
+
+@dataclass(frozen=True, slots=True)
+class _TitleCandidate:
+    imdb_id: str
+    media_type: str | None
+    year: int | None
+    token_count: int
+    # Type filter ("*" for any) of the year-less network query this title
+    # answered; None for titles that were not resolved over the network.
+    answers_yearless: str | None = None
+    # Ordered tokens of that query, which a year-less query must repeat.
+    sequence: tuple[str, ...] = ()
+
+
+class _TitleIndexData:
+    def __init__(self):
+        self.candidates: list[_TitleCandidate] = []
+        self.postings: dict[str, list[int]] = {}
+        self._seen: set[tuple] = set()
+
+    def add(
+        self,
+        imdb_id: str,
+        title,
+        media_type: str | None,
+        year: int | None,
+        answers_yearless: str | None = None,
+    ) -> None:
+        if not isinstance(title, str):
+            return
+        sequence = normalize_title_sequence(title)
+        tokens = frozenset(sequence)
+        if answers_yearless is None:
+            sequence = ()
+        seen_key = (imdb_id, tokens, answers_yearless, sequence)
+        if not tokens or seen_key in self._seen:
+            return
+        self._seen.add(seen_key)
+
+        candidate_id = len(self.candidates)
+        self.candidates.append(
+            _TitleCandidate(
+                imdb_id, media_type, year, len(tokens), answers_yearless, sequence
+            )
+        )
+        for token in tokens:
+            self.postings.setdefault(token, []).append(candidate_id)
+
+    def lookup(self, tokens: frozenset[str]) -> list[_TitleCandidate]:
+        postings = []
+        for token in tokens:
+            candidate_ids = self.postings.get(token)
+            if candidate_ids is None:
+                return []
+            postings.append(candidate_ids)
+        postings.sort(key=len)
+
+        matching = set(postings[0])
+        for candidate_ids in postings[1:]:
+            matching.intersection_update(candidate_ids)
+            if not matching:
+                return []
+        return [
+            self.candidates[candidate_id]
+            for candidate_id in sorted(matching)
+            if self.candidates[candidate_id].token_count == len(tokens)
+        ]
+
+
+def _iter_alias_titles(aliases_json):
+    try:
+        aliases = orjson.loads(aliases_json) if aliases_json else None
+    except (TypeError, orjson.JSONDecodeError):
+        return
+    if not isinstance(aliases, dict):
+        return
+    for titles in aliases.values():
+        if isinstance(titles, list):
+            yield from titles
+
+
+def _build_index(
+    metadata_rows, resolved_rows, item_rows, series_rows, anime_rows
+) -> _TitleIndexData:
+    media_types = {}
+    for row in resolved_rows:
+        if row["media_type"] in ("movie", "series"):
+            media_types.setdefault(row["imdb_id"], row["media_type"])
+    for row in item_rows:
+        if row["media_type"] in ("movie", "series"):
+            media_types.setdefault(row["media_id"], row["media_type"])
+    for row in series_rows:
+        media_types.setdefault(row["series_id"], "series")
+
+    anime_entries = []
+    for row in anime_rows:
+        imdb_id = row["provider_id"]
+        if not isinstance(imdb_id, str) or _IMDB_ID.fullmatch(imdb_id) is None:
+            continue
+        try:
+            entry = orjson.loads(row["data_json"])
+        except (TypeError, orjson.JSONDecodeError):
+            continue
+        if not isinstance(entry, dict):
+            continue
+        raw_type = entry.get("type")
+        if isinstance(raw_type, str) and raw_type.upper() in _ANIME_MEDIA_TYPES:
+            media_types.setdefault(imdb_id, _ANIME_MEDIA_TYPES[raw_type.upper()])
+        anime_entries.append((imdb_id, entry))
+
+    index = _TitleIndexData()
+    for row in metadata_rows:
+        imdb_id = row["media_id"].partition(":")[2]
+        media_type = media_types.get(imdb_id)
+        year = row["year"]
+        index.add(imdb_id, row["title"], media_type, year)
+        for alias in _iter_alias_titles(row["aliases_json"]):
+            index.add(imdb_id, alias, media_type, year)
+
+    for row in resolved_rows:
+        # Keys are `<type>:<year>:<casefolded query>` as written by the
+        # network resolver.
+        query_type, query_year, title = row["query_key"].split(":", 2)
+        year = row["year"]
+        index.add(
+            row["imdb_id"],
+            title,
+            row["media_type"],
+            int(year) if year is not None else None,
+            query_type if query_year == "*" else None,
+        )
+
+    for imdb_id, entry in anime_entries:
+        anime_season = entry.get("animeSeason")
+        year = (
+            parse_year(anime_season.get("year"))
+            if isinstance(anime_season, dict)
+            else None
+        )
+        media_type = media_types.get(imdb_id)
+        index.add(imdb_id, entry.get("title"), media_type, year)
+        synonyms = entry.get("synonyms")
+        for synonym in synonyms if isinstance(synonyms, list) else ():
+            index.add(imdb_id, synonym, media_type, year)
+
+    del index._seen
+    return index
+
+
+def _select_match(
+    candidates: list[_TitleCandidate],
+    sequence: tuple[str, ...],
+    media_type: str | None,
+    year: int | None,
+) -> ImdbTitleMatch | None:
+    matches: dict[str, ImdbTitleMatch] = {}
+    for candidate in candidates:
+        # An untyped title could be either kind, so it never resolves offline.
+        if candidate.media_type is None or (
+            media_type is not None and candidate.media_type != media_type
+        ):
+            continue
+        # Without a year only an earlier network answer to the same kind of
+        # query, word for word, is trusted; metadata titles alone cannot tell
+        # remakes apart.
+        if year is None and (
+            candidate.answers_yearless not in ("*", media_type or "*")
+            or candidate.sequence != sequence
+        ):
+            continue
+        match = ImdbTitleMatch(candidate.imdb_id, candidate.media_type, candidate.year)
+        matches.setdefault(candidate.imdb_id, match)
+
+    if year is not None:
+        exact = [match for match in matches.values() if match.year == year]
+        if exact:
+            return exact[0] if len(exact) == 1 else None
+        nearby = [
+            match
+            for match in matches.values()
+            if match.year is not None and abs(match.year - year) <= 1
+        ]
+        return nearby[0] if len(nearby) == 1 else None
+
+    return next(iter(matches.values())) if len(matches) == 1 else None
+
+
+class LocalTitleIndex:
+    """
+    Offline title -> IMDb resolver built from cached metadata.
+
+    Titles and aliases from `media_metadata_cache`, earlier network
+    resolutions in `imdb_title_lookup` and anime entries are indexed by
+    normalized token. A query resolves only when its tokens name a single
+    typed title (after type and year filtering); a query without a year only
+    resolves from an earlier network answer. Anything else falls back to the
+    network resolver. The index is rebuilt in the background.
+    """
+
+    def __init__(self):
+        self._index: _TitleIndexData | None = None
+        self._built_at = 0.0
+        self._build_task: asyncio.Task | None = None
+
+    def resolve(
+        self,
+        query: str,
+        media_type: str | None = None,
+        year: int | None = None,
+    ) -> ImdbTitleMatch | None:
+        if time.monotonic() - self._built_at >= _TITLE_INDEX_REFRESH_INTERVAL:
+            self._schedule_build()
+
+        index = self._index
+        if index is None:
+            return None
+        sequence = normalize_title_sequence(query)
+        if not sequence:
+            return None
+        return _select_match(
+            index.lookup(frozenset(sequence)), sequence, media_type, year
+        )
+
+    def _schedule_build(self) -> None:
+        if self._build_task is not None and not self._build_task.done():
+            return
+        # A failed build is not retried before the next interval.
+        self._built_at = time.monotonic()
+        self._build_task = asyncio.create_task(
+            self._build(), name="torznab-title-index"
+        )
+
+    async def _build(self) -> None:
+        try:
+            metadata_rows = await database.fetch_all(
+                _METADATA_TITLES_QUERY, {"imdb_prefix": "imdb:tt%"}
+            )
+            # Expired resolutions are ignored, as in the network resolver.
+            resolved_rows = await database.fetch_all(
+                _RESOLVED_TITLES_QUERY,
+                {"min_timestamp": time.time() - settings.METADATA_CACHE_TTL},
+            )
+            item_rows = await database.fetch_all(_SCRAPER_ITEM_TYPES_QUERY)
+            series_rows = await database.fetch_all(_INDEXED_SERIES_QUERY)
+            anime_rows = (
+                await database.fetch_all(_ANIME_TITLES_QUERY)
+                if settings.ANIME_MAPPING_ENABLED
+                else []
+            )
+            self._index = await asyncio.to_thread(
+                _build_index,
+                metadata_rows,
+                resolved_rows,
+                item_rows,
+                series_rows,
+                anime_rows,
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to build local title index: {exc}")
+            return
+
+        logger.log(
+            "COMET",
+            f"Local title index built: {len(self._index.candidates)} titles",
+        )
+
+    async def stop(self) -> None:
+        task = self._build_task
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+local_title_index = LocalTitleIndex()
@@ -116,6 +116,12 @@ class CometMetrics:
             ("media_type",),
             buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000),
         )
+        self.stream_stage_duration = Histogram(
+            "comet_stream_stage_duration_seconds",
+            "Pre-scrape lookup stage duration of a media search.",
+            ("stage",),
+            buckets=db_buckets,
+        )
 
         self.scraper_requests = Counter(
             "comet_scraper_requests_total",
@@ -133,6 +139,36 @@ class CometMetrics:
             "Torrent candidates returned by scrapers.",
             ("scraper", "context"),
         )
+        self.scraper_circuit_transitions = Counter(
+            "comet_scraper_circuit_transitions_total",
+            "Scraper circuit breaker state transitions.",
+            ("scraper", "state"),
+        )
+        self.scraper_circuit_skips = Counter(
+            "comet_scraper_circuit_skips_total",
+            "Scraper runs skipped because their circuit was open.",
+            ("scraper",),
+        )
+        self.scraper_hedges = Counter(
+            "comet_scraper_hedge_total",
+            "Hedged scraper group events.",
+            ("scraper", "event"),
+        )
+        self.scraper_response_cache = Counter(
+            "comet_scraper_response_cache_total",
+            "Upstream scraper response cache lookups by result.",
+            ("scraper", "result"),
+        )
+        self.magnet_resolutions = Counter(
+            "comet_magnet_resolutions_total",
+            "Magnet metadata lookups by source: memory_hit, store_hit, resolved, failed.",
+            ("result",),
+        )
+        self.torrent_link_cache = Counter(
+            "comet_torrent_link_cache_total",
+            "Indexer download link cache lookups by result.",
+            ("result",),
+        )
 
         self.debrid_requests = Counter(
             "comet_debrid_requests_total",
@@ -150,6 +186,27 @@ class CometMetrics:
             "Availability entries returned by debrid operations.",
             ("service", "operation"),
         )
+        self.debrid_availability_batches = Counter(
+            "comet_debrid_availability_batches_total",
+            "Upstream StremThru availability checks sent by the batcher.",
+            ("service",),
+        )
+        self.debrid_availability_batch_callers = Counter(
+            "comet_debrid_availability_batch_callers_total",
+            "Availability check calls served by batched upstream checks.",
+            ("service",),
+        )
+        self.debrid_link_prefetch = Counter(
+            "comet_debrid_link_prefetch_total",
+            "Speculative download link prefetches by result.",
+            ("result",),
+        )
+        self.debrid_concurrency_limit = Gauge(
+            "comet_debrid_availability_concurrency_limit",
+            "Adaptive concurrency limit for StremThru availability checks.",
+            ("service",),
+            multiprocess_mode="livemax",
+        )
 
         self.database_operations = Counter(
             "comet_database_operations_total",
@@ -271,6 +328,10 @@ class CometMetrics:
         self._child("torrent_cache_lookups", media_type, result).inc()
         self._child("torrent_cache_results", media_type).observe(result_count)
 
+    def observe_stream_stage(self, stage: str, duration: float) -> None:
+        if self.enabled:
+            self._child("stream_stage_duration", stage).observe(duration)
+
     def observe_scraper(
         self,
         scraper: str,
@@ -287,6 +348,34 @@ class CometMetrics:
         if result_count:
             self._child("scraper_results", scraper, context).inc(result_count)
 
+    def observe_scraper_circuit(self, scraper: str, state: str) -> None:
+        if self.enabled:
+            scraper = _normalize_scraper_label(scraper)
+            self._child("scraper_circuit_transitions", scraper, state).inc()
+
+    def observe_scraper_circuit_skip(self, scraper: str) -> None:
+        if self.enabled:
+            self._child(
+                "scraper_circuit_skips", _normalize_scraper_label(scraper)
+            ).inc()
+
+    def observe_scraper_hedge(self, scraper: str, event: str) -> None:
+        if self.enabled:
+            self._child("scraper_hedges", scraper, event).inc()
+
+    def observe_scraper_response_cache(self, scraper: str, result: str) -> None:
+        if self.enabled:
+            scraper = _normalize_scraper_label(scraper)
+            self._child("scraper_response_cache", scraper, result).inc()
+
+    def observe_magnet_resolution(self, result: str) -> None:
+        if self.enabled:
+            self._child("magnet_resolutions", result).inc()
+
+    def observe_torrent_link_cache(self, result: str) -> None:
+        if self.enabled:
+            self._child("torrent_link_cache", result).inc()
+
     def observe_debrid(
         self,
         service: str,
@@ -303,6 +392,21 @@ class CometMetrics:
         if result_count:
             self._child("debrid_results", service, operation).inc(result_count)
 
+    def observe_debrid_availability_batch(self, service: str, callers: int) -> None:
+        if not self.enabled:
+            return
+        service = service.casefold()
+        self._child("debrid_availability_batches", service).inc()
+        self._child("debrid_availability_batch_callers", service).inc(callers)
+
+    def observe_link_prefetch(self, result: str) -> None:
+        if self.enabled:
+            self._child("debrid_link_prefetch", result).inc()
+
+    def observe_debrid_concurrency_limit(self, service: str, limit: int) -> None:
+        if self.enabled:
+            self._child("debrid_concurrency_limit", service.casefold()).set(limit)
+
     def observe_database(
         self, operation: str, target: str, outcome: str, duration: float
     ) -> None:
@@ -8,62 +8,78 @@ from comet.scrapers.base import (
     BaseScraper,
     deduplicate_torrents,
     gather_with_error_logging,
+    parse_pages,
 )
 from comet.scrapers.models import ScrapeRequest
 from comet.services.torrent_manager import extract_trackers_from_magnet
 
+TORZNAB_ATTR_TAG = "{http://torznab.com/schemas/2015/feed}attr"
+NEWZNAB_RESPONSE_TAG = "{http://www.newznab.com/DTD/2010/feeds/attributes/}response"
+
+
+def parse_items(root):
+    torrents = []
+    for item in root.iter("item"):
+        try:
+            title = item.find("title").text
+
+            size = None
+            info_hash = None
+            seeders = None
+            magnet = None
+
+            for attr in item.iter(TORZNAB_ATTR_TAG):
+                attr_name = attr.get("name")
+                attr_value = attr.get("value")
+
+                if attr_name == "size":
+                    size = int(attr_value)
+                elif attr_name == "infohash":
+                    info_hash = attr_value
+                elif attr_name == "seeders":
+                    seeders = int(attr_value)
+                elif attr_name == "magneturl":
+                    magnet = attr_value
+
+            if info_hash is None:
+                continue
+
+            torrents.append(
+                {
+                    "title": title,
+                    "infoHash": info_hash,
+                    "fileIndex": None,
+                    "seeders": seeders,
+                    "size": size,
+                    "tracker": "AnimeTosho",
+                    "sources": extract_trackers_from_magnet(magnet),
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Error parsing torrent item from AnimeTosho: {e}")
+            continue
+    return torrents
+
+
+def parse_feed(content: str):
+    if not content.strip():
+        return [], 0
+
+    try:
+        root = ET.fromstring(content)
+        response_node = next(root.iter(NEWZNAB_RESPONSE_TAG))
+        total = int(response_node.get("total", 0))
+        return parse_items(root), total
+    except Exception as e:
+        logger.warning(f"Error parsing AnimeTosho page: {e}")
+        return [], 0
+
 
 class AnimeToshoScraper(BaseScraper):
     def __init__(self, manager, session):
         super().__init__(manager, session)
 
-    def parse_items(self, root):
-        torrents = []
-        for item in root.findall(".//item"):
-            try:
-                title = item.find("title").text
-
-                size = None
-                info_hash = None
-                seeders = None
-                magnet = None
-
-                for attr in item.findall(
-                    ".//torznab:attr",
-                    {"torznab": "http://torznab.com/schemas/2015/feed"},
-                ):
-                    attr_name = attr.get("name")
-                    attr_value = attr.get("value")
-
-                    if attr_name == "size":
-                        size = int(attr_value)
-                    elif attr_name == "infohash":
-                        info_hash = attr_value
-                    elif attr_name == "seeders":
-                        seeders = int(attr_value)
-                    elif attr_name == "magneturl":
-                        magnet = attr_value
-
-                if info_hash is None:
-                    continue
-
-                torrents.append(
-                    {
-                        "title": title,
-                        "infoHash": info_hash,
-                        "fileIndex": None,
-                        "seeders": seeders,
-                        "size": size,
-                        "tracker": "AnimeTosho",
-                        "sources": extract_trackers_from_magnet(magnet),
-                    }
-                )
-            except Exception as e:
-                logger.warning(f"Error parsing torrent item from AnimeTosho: {e}")
-                continue
-        return torrents
-
-    async def _scrape_page(self, query, offset, limit):
+    async def _fetch_page(self, query, offset, limit):
         try:
             async with self.session.get(
                 "https://feed.animetosho.org/api"
@@ -73,36 +89,25 @@ class AnimeToshoScraper(BaseScraper):
                     logger.warning(
                         f"Failed to scrape AnimeTosho offset={offset}: HTTP {response.status}"
                     )
-                    return [], 0
-
-                content = await response.text()
-                if not content.strip():
-                    return [], 0
-
-                root = ET.fromstring(content)
+                    return ""
 
-                response_node = root.find(
-                    ".//newznab:response",
-                    {"newznab": "http://www.newznab.com/DTD/2010/feeds/attributes/"},
-                )
-                total = int(response_node.get("total", 0))
-                items = self.parse_items(root)
-                return items, total
+                return await response.text()
         except Exception as e:
             logger.warning(f"Error scraping AnimeTosho offset={offset}: {e}")
-            return [], 0
+            return ""
 
-    async def scrape_page(self, query, offset, limit, semaphore=None):
+    async def fetch_page(self, query, offset, limit, semaphore=None):
         if semaphore is None:
-            return await self._scrape_page(query, offset, limit)
+            return await self._fetch_page(query, offset, limit)
         async with semaphore:
-            return await self._scrape_page(query, offset, limit)
+            return await self._fetch_page(query, offset, limit)
 
     async def _scrape_query(self, query: str, semaphore: asyncio.Semaphore):
         torrents = []
         limit = 150
 
-        initial_items, total = await self.scrape_page(query, 0, limit, semaphore)
+        first_page = await self.fetch_page(query, 0, limit, semaphore)
+        [(initial_items, total)] = await parse_pages(parse_feed, [first_page])
         torrents.extend(initial_items)
 
         if total > limit:
@@ -118,14 +123,14 @@ class AnimeToshoScraper(BaseScraper):
                     tasks.append(
                         (
                             f"AnimeTosho query {query!r} offset {current_offset}",
-                            self.scrape_page(query, current_offset, limit, semaphore),
+                            self.fetch_page(query, current_offset, limit, semaphore),
                         )
                     )
                     current_offset += limit
 
                 if tasks:
-                    results = await gather_with_error_logging(tasks)
-                    for batch_items, _ in results:
+                    pages = await gather_with_error_logging(tasks)
+                    for batch_items, _ in await parse_pages(parse_feed, pages):
                         torrents.extend(batch_items)
 
         return torrents
@@ -1,8 +1,9 @@
 import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Iterable
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from typing import TypeVar
 
+from comet.core.execution import get_parse_executor
 from comet.core.logger import logger
 from comet.scrapers.models import ScrapeRequest
 from comet.utils.network_manager import AsyncClientWrapper
@@ -57,6 +58,21 @@ async def gather_with_error_logging[T](
     return successful
 
 
+def _parse_each[T](parser: Callable[[str], T], pages: Sequence[str]) -> list[T]:
+    return [parser(page) for page in pages]
+
+
+async def parse_pages[T](parser: Callable[[str], T], pages: Sequence[str]) -> list[T]:
+    """Parse fetched pages in one job on the scraper parse pool, off the loop."""
+
+    if not pages:
+        return []
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_parse_executor(), _parse_each, parser, tuple(pages)
+    )
+
+
 class BaseScraper(ABC):
     impersonate: str | None = None
 
@@ -3,58 +3,69 @@ import xml.etree.ElementTree as ET
 
 from comet.core.logger import logger
 from comet.core.models import settings
-from comet.scrapers.base import BaseScraper
+from comet.scrapers.base import BaseScraper, parse_pages
 from comet.scrapers.models import ScrapeRequest
 
+TORZNAB_ATTR_TAG = "{http://torznab.com/schemas/2015/feed}attr"
+
+
+def parse_items(root):
+    torrents = []
+    for item in root.iter("item"):
+        try:
+            title = item.find("title").text
+
+            size = None
+            info_hash = None
+            seeders = None
+
+            for attr in item.iter(TORZNAB_ATTR_TAG):
+                attr_name = attr.get("name")
+                attr_value = attr.get("value")
+
+                if attr_name == "size":
+                    size = int(attr_value)
+                elif attr_name == "infohash":
+                    info_hash = attr_value
+                elif attr_name == "seeders":
+                    seeders = int(attr_value)
+
+            if info_hash is None:
+                continue
+
+            torrents.append(
+                {
+                    "title": title,
+                    "infoHash": info_hash,
+                    "fileIndex": None,
+                    "seeders": seeders,
+                    "size": size,
+                    "tracker": "BitMagnet",
+                    "sources": [],
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Error parsing torrent item from BitMagnet: {e}")
+            continue
+    return torrents
+
+
+def parse_feed(content: str):
+    if not content.strip():
+        return []
+
+    try:
+        return parse_items(ET.fromstring(content))
+    except ET.ParseError as e:
+        logger.warning(f"Error parsing BitMagnet page: {e}")
+        return []
+
 
 class BitmagnetScraper(BaseScraper):
     def __init__(self, manager, session, url: str):
         super().__init__(manager, session, url)
 
-    def parse_items(self, root):
-        torrents = []
-        for item in root.findall(".//item"):
-            try:
-                title = item.find("title").text
-
-                size = None
-                info_hash = None
-                seeders = None
-
-                for attr in item.findall(
-                    ".//torznab:attr",
-                    {"torznab": "http://torznab.com/schemas/2015/feed"},
-                ):
-                    attr_name = attr.get("name")
-                    attr_value = attr.get("value")
-
-                    if attr_name == "size":
-                        size = int(attr_value)
-                    elif attr_name == "infohash":
-                        info_hash = attr_value
-                    elif attr_name == "seeders":
-                        seeders = int(attr_value)
-
-                if info_hash is None:
-                    continue
-
-                torrents.append(
-                    {
-                        "title": title,
-                        "infoHash": info_hash,
-                        "fileIndex": None,
-                        "seeders": seeders,
-                        "size": size,
-                        "tracker": "BitMagnet",
-                        "sources": [],
-                    }
-                )
-            except Exception as e:
-                logger.warning(f"Error parsing torrent item from BitMagnet: {e}")
-                continue
-        return torrents
-
-    async def scrape_page(
+    async def fetch_page(
         self, imdb_id, scrape_type, offset, limit, season=None, episode=None
     ):
         try:
@@ -71,17 +82,10 @@ class BitmagnetScraper(BaseScraper):
             async with self.session.get(
                 f"{self.url}/torznab/api", params=params
             ) as response:
-                data_text = await response.text()
-                if not data_text.strip():
-                    return []
-                root = ET.fromstring(data_text)
-                return self.parse_items(root)
-        except ET.ParseError as e:
-            logger.warning(f"Error parsing BitMagnet page offset={offset}: {e}")
-            return []
+                return await response.text()
         except Exception as e:
             logger.warning(f"Error scraping BitMagnet page offset={offset}: {e}")
-            return []
+            return ""
 
     async def scrape(self, request: ScrapeRequest):
         torrents = []
@@ -104,7 +108,7 @@ class BitmagnetScraper(BaseScraper):
                 if current_offset >= settings.BITMAGNET_MAX_OFFSET:
                     break
                 tasks.append(
-                    self.scrape_page(
+                    self.fetch_page(
                         imdb_id, scrape_type, current_offset, limit, season, episode
                     )
                 )
@@ -112,7 +116,7 @@ class BitmagnetScraper(BaseScraper):
             if not tasks:
                 break
 
-            results = await asyncio.gather(*tasks)
+            results = await parse_pages(parse_feed, await asyncio.gather(*tasks))
 
             should_stop = False
             for batch_results in results:
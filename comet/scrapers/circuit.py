@@ -0,0 +1,171 @@
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from comet.core.logger import logger
+from comet.core.models import settings
+from comet.observability import metrics
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(slots=True)
+class ScraperCircuit:
+    failures: deque[bool] = field(default_factory=deque)
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_timeouts: int = 0
+    opened_at: float | None = None
+    probe_started_at: float | None = None
+    probe_token: int | None = None
+    skipped: int = 0
+
+    def failure_ratio(self) -> float:
+        if not self.failures:
+            return 0.0
+        return sum(self.failures) / len(self.failures)
+
+
+class ScraperCircuitBreakers:
+    """
+    Closed/open/half-open circuit per scraper instance.
+
+    A circuit opens on a high error ratio over its recent window or on
+    consecutive timeouts. After the cooldown one probe run is admitted; its
+    outcome either closes the circuit or reopens it for another cooldown.
+
+    Admitted runs receive a token to pass back to `record`. While half-open
+    only the probe's token may change the state, so runs that started before
+    the circuit opened cannot close or reopen it.
+    """
+
+    def __init__(self):
+        self._circuits: dict[str, ScraperCircuit] = {}
+        self._tokens = itertools.count(1)
+
+    def _circuit(self, name: str) -> ScraperCircuit:
+        circuit = self._circuits.get(name)
+        if circuit is None:
+            circuit = ScraperCircuit(
+                failures=deque(maxlen=settings.SCRAPER_CIRCUIT_BREAKER_WINDOW)
+            )
+            self._circuits[name] = circuit
+        return circuit
+
+    def _transition(self, name: str, circuit: ScraperCircuit, state: CircuitState):
+        if circuit.state is state:
+            return
+        circuit.state = state
+        metrics.observe_scraper_circuit(name, state.value)
+        if state is CircuitState.OPEN:
+            logger.warning(
+                f"Scraper {name} circuit opened "
+                f"(failure_ratio={circuit.failure_ratio():.2f}, "
+                f"consecutive_timeouts={circuit.consecutive_timeouts})"
+            )
+        elif state is CircuitState.CLOSED:
+            logger.log("SCRAPER", f"Scraper {name} circuit closed")
+
+    def allow(self, name: str) -> int | None:
+        """Return an admission token, or None when the run must be skipped."""
+        if not settings.SCRAPER_CIRCUIT_BREAKER_ENABLED:
+            return next(self._tokens)
+
+        circuit = self._circuits.get(name)
+        if circuit is None or circuit.state is CircuitState.CLOSED:
+            return next(self._tokens)
+
+        current_time = time.monotonic()
+        cooldown = settings.SCRAPER_CIRCUIT_BREAKER_COOLDOWN
+        if circuit.state is CircuitState.OPEN:
+            if current_time - circuit.opened_at < cooldown:
+                self._skip(name, circuit)
+                return None
+            self._transition(name, circuit, CircuitState.HALF_OPEN)
+        elif (
+            circuit.probe_started_at is not None
+            and current_time - circuit.probe_started_at < cooldown
+        ):
+            # A probe that never reports back (cancelled request) expires
+            # after one cooldown so the circuit cannot stay half-open forever.
+            self._skip(name, circuit)
+            return None
+
+        circuit.probe_started_at = current_time
+        circuit.probe_token = next(self._tokens)
+        return circuit.probe_token
+
+    def _skip(self, name: str, circuit: ScraperCircuit) -> None:
+        circuit.skipped += 1
+        metrics.observe_scraper_circuit_skip(name)
+
+    def record(self, name: str, outcome: str, token: int | None = None) -> None:
+        if not settings.SCRAPER_CIRCUIT_BREAKER_ENABLED:
+            return
+
+        circuit = self._circuit(name)
+        failed = outcome != "success"
+        if circuit.state is CircuitState.HALF_OPEN:
+            if token != circuit.probe_token:
+                return
+            circuit.probe_started_at = None
+            circuit.probe_token = None
+            if failed:
+                self._open(name, circuit)
+                return
+            circuit.failures.clear()
+            circuit.consecutive_timeouts = 0
+            self._transition(name, circuit, CircuitState.CLOSED)
+            return
+        if circuit.state is CircuitState.OPEN:
+            return
+
+        circuit.failures.append(failed)
+        if outcome == "timeout":
+            circuit.consecutive_timeouts += 1
+        else:
+            circuit.consecutive_timeouts = 0
+
+        if circuit.consecutive_timeouts >= (
+            settings.SCRAPER_CIRCUIT_BREAKER_CONSECUTIVE_TIMEOUTS
+        ) or (
+            len(circuit.failures) >= settings.SCRAPER_CIRCUIT_BREAKER_MIN_REQUESTS
+            and circuit.failure_ratio() >= settings.SCRAPER_CIRCUIT_BREAKER_ERROR_RATIO
+        ):
+            self._open(name, circuit)
+
+    def _open(self, name: str, circuit: ScraperCircuit):
+        circuit.opened_at = time.monotonic()
+        self._transition(name, circuit, CircuitState.OPEN)
+
+    def snapshot(self) -> list[dict]:
+        current_time = time.monotonic()
+        cooldown = settings.SCRAPER_CIRCUIT_BREAKER_COOLDOWN
+        entries = []
+        for name, circuit in sorted(self._circuits.items()):
+            retry_in = None
+            if circuit.state is CircuitState.OPEN:
+                retry_in = max(0.0, cooldown - (current_time - circuit.opened_at))
+            entries.append(
+                {
+                    "scraper": name,
+                    "state": circuit.state.value,
+                    "failure_ratio": round(circuit.failure_ratio(), 4),
+                    "samples": len(circuit.failures),
+                    "consecutive_timeouts": circuit.consecutive_timeouts,
+                    "skipped": circuit.skipped,
+                    "retry_in": round(retry_in, 1) if retry_in is not None else None,
+                }
+            )
+        return entries
+
+    def reset(self) -> None:
+        self._circuits.clear()
+
+
+scraper_circuits = ScraperCircuitBreakers()
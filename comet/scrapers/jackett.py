@@ -10,10 +10,9 @@ from comet.scrapers.base import (
 )
 from comet.scrapers.models import ScrapeRequest, ScrapeResult
 from comet.services.indexer_manager import indexer_manager
+from comet.services.torrent_links import torrent_link_cache
 from comet.services.torrent_manager import (
     add_torrent_queue,
-    download_torrent,
-    extract_torrent_metadata,
     extract_trackers_from_magnet,
 )
 
@@ -38,22 +37,20 @@ class JackettScraper(BaseScraper):
         torrents = []
 
         if result["Link"] is not None:
-            content, magnet_hash, magnet_url = await download_torrent(
+            metadata, magnet_hash, magnet_url = await torrent_link_cache.resolve(
                 self.session, result["Link"]
             )
 
-            if content:
-                metadata = await asyncio.to_thread(extract_torrent_metadata, content)
-                if metadata:
-                    for file in metadata["files"]:
-                        torrent = base_torrent.copy()
-                        torrent["title"] = file["title"]
-                        torrent["infoHash"] = metadata["info_hash"].lower()
-                        torrent["fileIndex"] = file["index"]
-                        torrent["size"] = file["size"]
-                        torrent["sources"] = metadata["sources"]
-                        torrents.append(torrent)
-                    return torrents
+            if metadata:
+                for file in metadata["files"]:
+                    torrent = base_torrent.copy()
+                    torrent["title"] = file["title"]
+                    torrent["infoHash"] = metadata["info_hash"].lower()
+                    torrent["fileIndex"] = file["index"]
+                    torrent["size"] = file["size"]
+                    torrent["sources"] = metadata["sources"]
+                    torrents.append(torrent)
+                return torrents
 
             if magnet_hash:
                 base_torrent["infoHash"] = magnet_hash.lower()
@@ -0,0 +1,108 @@
+import math
+from collections import deque
+from dataclasses import dataclass, field
+
+from comet.core.models import settings
+
+
+def _percentile(samples, quantile: float) -> float:
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(quantile * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass(slots=True)
+class ScraperLatencyWindow:
+    durations: deque[float] = field(default_factory=deque)
+    yields: deque[int] = field(default_factory=deque)
+
+    @classmethod
+    def create(cls, size: int):
+        return cls(deque(maxlen=size), deque(maxlen=size))
+
+    def yield_ratio(self) -> float:
+        if not self.yields:
+            return 0.0
+        return sum(1 for count in self.yields if count) / len(self.yields)
+
+
+class ScraperLatencyTracker:
+    """
+    Rolling latency and yield samples per scraper instance and context.
+
+    Yield counts torrents an instance contributed that no earlier-finishing
+    scraper had already returned for the same request.
+    """
+
+    def __init__(self):
+        self._windows: dict[tuple[str, str], ScraperLatencyWindow] = {}
+
+    def _window(self, name: str, context: str) -> ScraperLatencyWindow:
+        key = (name, context)
+        window = self._windows.get(key)
+        if window is None:
+            window = ScraperLatencyWindow.create(
+                settings.SCRAPER_ADAPTIVE_TIMEOUT_WINDOW
+            )
+            self._windows[key] = window
+        return window
+
+    def record_latency(self, name: str, context: str, duration: float) -> None:
+        self._window(name, context).durations.append(duration)
+
+    def record_yield(self, name: str, context: str, unique_count: int) -> None:
+        self._window(name, context).yields.append(unique_count)
+
+    def percentile(self, name: str, context: str, quantile: float) -> float | None:
+        window = self._windows.get((name, context))
+        if (
+            window is None
+            or len(window.durations) < settings.SCRAPER_ADAPTIVE_TIMEOUT_MIN_SAMPLES
+        ):
+            return None
+        return _percentile(window.durations, quantile)
+
+    def resolve_timeout(self, name: str, context: str, base_timeout: float) -> float:
+        if not settings.SCRAPER_ADAPTIVE_TIMEOUTS:
+            return base_timeout
+
+        window = self._windows.get((name, context))
+        min_samples = settings.SCRAPER_ADAPTIVE_TIMEOUT_MIN_SAMPLES
+        if (
+            window is None
+            or len(window.durations) < min_samples
+            or len(window.yields) < min_samples
+        ):
+            return base_timeout
+
+        p95 = _percentile(window.durations, 0.95)
+        yield_ratio = window.yield_ratio()
+        if yield_ratio <= settings.SCRAPER_ADAPTIVE_LOW_YIELD_RATIO:
+            floor = min(base_timeout, settings.SCRAPER_ADAPTIVE_TIMEOUT_FLOOR)
+            return max(floor, min(base_timeout, p95))
+        if yield_ratio >= settings.SCRAPER_ADAPTIVE_HIGH_YIELD_RATIO:
+            factor = settings.SCRAPER_ADAPTIVE_TIMEOUT_MAX_FACTOR
+            return min(base_timeout * factor, max(base_timeout, p95 * factor))
+        return base_timeout
+
+    def snapshot(self) -> list[dict]:
+        entries = []
+        for (name, context), window in sorted(self._windows.items()):
+            durations = window.durations
+            entries.append(
+                {
+                    "scraper": name,
+                    "context": context,
+                    "samples": len(durations),
+                    "p50": _percentile(durations, 0.5) if durations else None,
+                    "p95": _percentile(durations, 0.95) if durations else None,
+                    "yield_ratio": round(window.yield_ratio(), 4),
+                }
+            )
+        return entries
+
+    def reset(self) -> None:
+        self._windows.clear()
+
+
+scraper_latency = ScraperLatencyTracker()
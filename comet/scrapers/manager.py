@@ -4,12 +4,17 @@ import inspect
 import os
 import pkgutil
 import time
+from collections import deque
+from dataclasses import dataclass, replace
+from urllib.parse import urlsplit
 
 from comet.core.logger import logger
 from comet.core.models import settings
 from comet.core.scrape import ScrapeContext, normalize_scraper_name
 from comet.observability import metrics
 from comet.scrapers.base import BaseScraper
+from comet.scrapers.circuit import scraper_circuits
+from comet.scrapers.latency import scraper_latency
 from comet.scrapers.models import ScrapeRequest
 from comet.services.anime import anime_mapper
 from comet.utils.network_manager import network_manager
@@ -26,13 +31,62 @@ ANIME_ONLY_SETTING_BY_SCRAPER = {
     "NekoBTScraper": "NEKOBT_ANIME_ONLY",
 }
 INDEXER_MANAGER_SCRAPERS = frozenset({"jackett", "prowlarr"})
+NON_SCRAPER_MODULES = frozenset({"base", "circuit", "latency", "manager", "models"})
+
+
+def _redact_url(url: str | None) -> str | None:
+    if url is None:
+        return None
+    parsed = urlsplit(url)
+    if not parsed.hostname:
+        return "<redacted>"
+    port = f":{parsed.port}" if parsed.port else ""
+    return f"{parsed.scheme}://{parsed.hostname}{port}"
+
+
+@dataclass(frozen=True, slots=True)
+class ScraperPlanEntry:
+    name: str
+    scraper: BaseScraper
+    timeout: float
+    anime_only: bool
+    url: str | None = None
+    hedge_group: str | None = None
+
+    def describe(self) -> dict:
+        return {
+            "name": self.name,
+            "scraper": type(self.scraper).__name__,
+            "timeout": self.timeout,
+            "anime_only": self.anime_only,
+            "url": _redact_url(self.url),
+            "hedge_group": self.hedge_group,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ScraperPlan:
+    """Scraper instances enabled for one context, compiled from settings."""
+
+    context: ScrapeContext
+    entries: tuple[ScraperPlanEntry, ...]
+    compiled_at: float
+
+    def describe(self) -> dict:
+        return {
+            "context": self.context.value,
+            "compiled_at": self.compiled_at,
+            "entries": [entry.describe() for entry in self.entries],
+        }
 
 
 class ScraperManager:
     def __init__(self):
         self.scrapers: dict[str, type[BaseScraper]] = {}
+        self._plans: dict[ScrapeContext, ScraperPlan] = {}
         self.discover_scrapers()
         self._validate_timeout_overrides()
+        self._validate_hedged_scrapers()
 
     def discover_scrapers(self):
         """
@@ -42,7 +96,7 @@ class ScraperManager:
         path = os.path.dirname(__file__)
 
         for _, name, _ in pkgutil.iter_modules([path]):
-            if name in ["base", "manager", "models"]:  # Skip base, manager, and models
+            if name in NON_SCRAPER_MODULES:
                 continue
 
             module = importlib.import_module(f"{package}.{name}")
@@ -69,6 +123,15 @@ class ScraperManager:
                 + ", ".join(unknown)
             )
 
+    def _validate_hedged_scrapers(self) -> None:
+        available = {normalize_scraper_name(name) for name in self.scrapers}
+        unknown = sorted(set(settings.SCRAPER_HEDGED_SCRAPERS) - available)
+        if unknown:
+            raise ValueError(
+                "SCRAPER_HEDGED_SCRAPERS contains unknown scrapers: "
+                + ", ".join(unknown)
+            )
+
     @staticmethod
     def _resolve_timeout(scraper_name: str, context: ScrapeContext) -> float:
         normalized_name = normalize_scraper_name(scraper_name)
@@ -94,33 +157,200 @@ class ScraperManager:
         scraper: BaseScraper,
         request: ScrapeRequest,
         timeout: float,
+        timed_out: set[str] | None = None,
+        deadline: float | None = None,
+        circuit_token: int | None = None,
     ):
+        context = request.context.value
+        base_timeout = timeout
+        timeout = scraper_latency.resolve_timeout(name, context, base_timeout)
+        capped = False
+        if deadline is not None:
+            remaining = deadline - asyncio.get_running_loop().time()
+            capped = remaining < timeout
+            timeout = min(timeout, remaining)
         started_at = time.perf_counter()
         outcome = "success"
         try:
             async with asyncio.timeout(timeout):
                 results = await scraper.scrape(request)
         except TimeoutError:
-            outcome = "timeout"
-            logger.warning(
-                f"Scraper {name} timed out "
-                f"(context={request.context.value}, budget={timeout:g}s)"
-            )
             results = []
+            if capped:
+                # Cut off by its hedge group's deadline rather than its own
+                # budget, so the run says nothing about this instance's health.
+                outcome = "cancelled"
+                logger.log(
+                    "SCRAPER",
+                    f"Scraper {name} stopped at its hedge group deadline "
+                    f"(context={context}, budget={timeout:g}s)",
+                )
+            else:
+                outcome = "timeout"
+                if timed_out is not None:
+                    timed_out.add(name)
+                logger.warning(
+                    f"Scraper {name} timed out (context={context}, budget={timeout:g}s)"
+                )
         except Exception as e:
             outcome = "error"
             logger.warning(f"Scraper {name} failed: {e}")  # todo: better error handling
             results = []
         duration = time.perf_counter() - started_at
+        if outcome != "cancelled":
+            scraper_circuits.record(name, outcome, circuit_token)
+        if outcome == "success":
+            scraper_latency.record_latency(name, context, duration)
+        elif outcome == "timeout":
+            # Censored at the configured budget: recording the adaptive cut-off
+            # would let p95 only fall, ratcheting the timeout to its floor.
+            scraper_latency.record_latency(name, context, base_timeout)
         metrics.observe_scraper(
             name,
-            request.context.value,
+            context,
             outcome,
             duration,
             len(results) if isinstance(results, list) else 0,
         )
         return name, results, duration
 
+    @staticmethod
+    def _admit(name: str) -> int | None:
+        token = scraper_circuits.allow(name)
+        if token is None:
+            logger.log("SCRAPER", f"Skipping {name}: circuit open")
+        return token
+
+    def _add_scrape_task(
+        self,
+        tasks: list,
+        name: str,
+        scraper: BaseScraper,
+        request: ScrapeRequest,
+        timeout: float,
+        timed_out: set[str] | None = None,
+    ) -> None:
+        token = self._admit(name)
+        if token is not None:
+            tasks.append(
+                self._scrape_wrapper(
+                    name, scraper, request, timeout, timed_out, circuit_token=token
+                )
+            )
+
+    async def _hedged_scrape(
+        self,
+        group: str,
+        entries: list[ScraperPlanEntry],
+        request: ScrapeRequest,
+        timed_out: set[str] | None = None,
+    ):
+        """
+        Query the historically fastest instance of a redundant group first.
+
+        A backup starts once the running instance exceeds its p90 latency, or
+        immediately when an instance finishes without results. The first
+        instance to return results wins and the others are cancelled. The
+        group shares the primary's budget: backups only get what is left of it.
+        """
+        context = request.context.value
+        loop = asyncio.get_running_loop()
+        queue = deque(
+            sorted(
+                entries,
+                key=lambda entry: (
+                    scraper_latency.percentile(entry.name, context, 0.5) or 0.0
+                ),
+            )
+        )
+        primary = None
+        deadline = None
+        pending = set()
+        last_launched = None
+        result = None
+
+        def launch() -> bool:
+            nonlocal primary, deadline, last_launched
+            while queue:
+                if deadline is not None and loop.time() >= deadline:
+                    queue.clear()
+                    break
+                entry = queue.popleft()
+                # Admitted only when launched, so unused backups keep their
+                # circuit's half-open probe.
+                token = self._admit(entry.name)
+                if token is None:
+                    continue
+                # The primary runs on its own budget, which sets the deadline.
+                entry_deadline = deadline
+                if deadline is None:
+                    primary = entry.name
+                    deadline = loop.time() + scraper_latency.resolve_timeout(
+                        entry.name, context, entry.timeout
+                    )
+                last_launched = entry
+                pending.add(
+                    asyncio.create_task(
+                        self._scrape_wrapper(
+                            entry.name,
+                            entry.scraper,
+                            request,
+                            entry.timeout,
+                            timed_out,
+                            entry_deadline,
+                            token,
+                        )
+                    )
+                )
+                return True
+            return False
+
+        try:
+            while pending or launch():
+                hedge_delay = None
+                if queue:
+                    hedge_delay = (
+                        scraper_latency.percentile(last_launched.name, context, 0.9)
+                        or settings.SCRAPER_HEDGE_DELAY
+                    )
+                done, _ = await asyncio.wait(
+                    pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if launch():
+                        metrics.observe_scraper_hedge(group, "backup_launched")
+                    continue
+
+                pending.difference_update(done)
+                for task in done:
+                    result = task.result()
+                    if result[1]:
+                        metrics.observe_scraper_hedge(
+                            group,
+                            "primary_won" if result[0] == primary else "backup_won",
+                        )
+                        return result
+            return result
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    @staticmethod
+    def _count_new_hashes(results, seen_hashes: set[str]) -> int:
+        if not isinstance(results, list):
+            return 0
+        new_count = 0
+        for torrent in results:
+            info_hash = torrent.get("infoHash") if isinstance(torrent, dict) else None
+            if not info_hash:
+                continue
+            info_hash = info_hash.lower()
+            if info_hash not in seen_hashes:
+                seen_hashes.add(info_hash)
+                new_count += 1
+        return new_count
+
     @staticmethod
     def _resolve_url_for_context(url: str, context: str):
         parsed_url, mode = parse_url_scrape_mode(url)
@@ -128,9 +358,8 @@ class ScraperManager:
             return None
         return parsed_url
 
-    async def scrape_all(self, request: ScrapeRequest):
-        tasks = []
-        is_anime_content = None
+    def compile_plan(self, context: ScrapeContext) -> ScraperPlan:
+        entries = []
         for scraper_name, scraper_class in self.scrapers.items():
             # Determine if scraper should be enabled
             # Convention: Scraper class name "NyaaScraper" -> settings.SCRAPE_NYAA
@@ -140,22 +369,17 @@ class ScraperManager:
 
             if hasattr(settings, setting_key):
                 if not settings.is_scraper_enabled(
-                    getattr(settings, setting_key), request.context
+                    getattr(settings, setting_key), context
                 ):
                     continue
             else:
                 continue
 
             anime_only_setting = ANIME_ONLY_SETTING_BY_SCRAPER.get(scraper_name)
-            if anime_only_setting and getattr(settings, anime_only_setting, False):
-                if is_anime_content is None:
-                    is_anime_content = anime_mapper.is_anime_content(
-                        request.media_id, request.media_only_id
-                    )
-                if not is_anime_content:
-                    continue
-
-            scrape_timeout = self._resolve_timeout(scraper_name_clean, request.context)
+            anime_only = bool(
+                anime_only_setting and getattr(settings, anime_only_setting, False)
+            )
+            scrape_timeout = self._resolve_timeout(scraper_name_clean, context)
 
             # Get client wrapper
             client = network_manager.get_client(
@@ -169,17 +393,17 @@ class ScraperManager:
                 if url_credentials_pairs:
                     active_instance_count = 0
                     for url, password in url_credentials_pairs:
-                        parsed_url = self._resolve_url_for_context(url, request.context)
+                        parsed_url = self._resolve_url_for_context(url, context)
                         if parsed_url is None:
                             continue
                         active_instance_count += 1
-                        scraper = scraper_class(self, client, parsed_url, password)
-                        tasks.append(
-                            self._scrape_wrapper(
+                        entries.append(
+                            ScraperPlanEntry(
                                 f"{scraper_name_clean} #{active_instance_count}",
-                                scraper,
-                                request,
+                                scraper_class(self, client, parsed_url, password),
                                 scrape_timeout,
+                                anime_only,
+                                parsed_url,
                             )
                         )
 
@@ -190,17 +414,17 @@ class ScraperManager:
                 if url_credentials_pairs:
                     active_instance_count = 0
                     for url, credentials in url_credentials_pairs:
-                        parsed_url = self._resolve_url_for_context(url, request.context)
+                        parsed_url = self._resolve_url_for_context(url, context)
                         if parsed_url is None:
                             continue
                         active_instance_count += 1
-                        scraper = scraper_class(self, client, parsed_url, credentials)
-                        tasks.append(
-                            self._scrape_wrapper(
+                        entries.append(
+                            ScraperPlanEntry(
                                 f"{scraper_name_clean} #{active_instance_count}",
-                                scraper,
-                                request,
+                                scraper_class(self, client, parsed_url, credentials),
                                 scrape_timeout,
+                                anime_only,
+                                parsed_url,
                             )
                         )
 
@@ -216,39 +440,121 @@ class ScraperManager:
                 if urls:
                     active_instance_count = 0
                     for url in urls:
-                        parsed_url = self._resolve_url_for_context(url, request.context)
+                        parsed_url = self._resolve_url_for_context(url, context)
                         if parsed_url is None:
                             continue
                         active_instance_count += 1
-                        scraper = scraper_class(self, client, parsed_url)
-                        tasks.append(
-                            self._scrape_wrapper(
+                        entries.append(
+                            ScraperPlanEntry(
                                 f"{scraper_name_clean} #{active_instance_count}",
-                                scraper,
-                                request,
+                                scraper_class(self, client, parsed_url),
                                 scrape_timeout,
+                                anime_only,
+                                parsed_url,
                             )
                         )
                 else:
-                    scraper = scraper_class(self, client)
-                    tasks.append(
-                        self._scrape_wrapper(
+                    entries.append(
+                        ScraperPlanEntry(
                             scraper_name_clean,
-                            scraper,
-                            request,
+                            scraper_class(self, client),
                             scrape_timeout,
+                            anime_only,
                         )
                     )
 
+        return ScraperPlan(context, self._assign_hedge_groups(entries), time.time())
+
+    @staticmethod
+    def _assign_hedge_groups(entries: list[ScraperPlanEntry]):
+        hedged = settings.SCRAPER_HEDGED_SCRAPERS
+        if not hedged:
+            return tuple(entries)
+
+        group_sizes = {}
+        for entry in entries:
+            group = normalize_scraper_name(type(entry.scraper).__name__)
+            group_sizes[group] = group_sizes.get(group, 0) + 1
+
+        grouped = []
+        for entry in entries:
+            group = normalize_scraper_name(type(entry.scraper).__name__)
+            if group in hedged and group_sizes[group] > 1:
+                entry = replace(entry, hedge_group=group)
+            grouped.append(entry)
+        return tuple(grouped)
+
+    def get_plan(self, context: ScrapeContext) -> ScraperPlan:
+        plan = self._plans.get(context)
+        if plan is None:
+            plan = self._plans[context] = self.compile_plan(context)
+        return plan
+
+    def compile_plans(self) -> None:
+        self._plans = {context: self.compile_plan(context) for context in ScrapeContext}
+        for plan in self._plans.values():
+            names = ", ".join(entry.name for entry in plan.entries) or "none"
+            logger.log(
+                "COMET",
+                f"Scraper plan ({plan.context.value}): {names}",
+            )
+
+    def invalidate_plans(self) -> None:
+        """Drop compiled plans so the next request rebuilds them from settings."""
+        self._plans = {}
+
+    async def scrape_all(self, request: ScrapeRequest):
+        tasks = []
+        hedge_groups = {}
+        timed_out = set()
+        is_anime_content = None
+        for entry in self.get_plan(request.context).entries:
+            if entry.anime_only:
+                if is_anime_content is None:
+                    is_anime_content = anime_mapper.is_anime_content(
+                        request.media_id, request.media_only_id
+                    )
+                if not is_anime_content:
+                    continue
+
+            if entry.hedge_group is not None:
+                hedge_groups.setdefault(entry.hedge_group, []).append(entry)
+                continue
+
+            self._add_scrape_task(
+                tasks, entry.name, entry.scraper, request, entry.timeout, timed_out
+            )
+
+        for group, entries in hedge_groups.items():
+            if len(entries) == 1:
+                entry = entries[0]
+                self._add_scrape_task(
+                    tasks, entry.name, entry.scraper, request, entry.timeout, timed_out
+                )
+            else:
+                tasks.append(self._hedged_scrape(group, entries, request, timed_out))
+
         scraper_tasks = [asyncio.create_task(task) for task in tasks]
+        seen_hashes = set()
         try:
             for future in asyncio.as_completed(scraper_tasks):
                 try:
-                    yield await future
+                    result = await future
                 except Exception as e:
                     logger.error(
                         f"Error during scraping: {e}"
                     )  # todo: better error handling
+                    continue
+                if result is None:
+                    # Every instance of a hedged group was skipped.
+                    continue
+
+                name, results, _ = result
+                new_count = self._count_new_hashes(results, seen_hashes)
+                # A timed-out run says nothing about what the scraper yields.
+                if name not in timed_out:
+                    scraper_latency.record_yield(name, request.context.value, new_count)
+                yield result
         finally:
             for task in scraper_tasks:
                 if not task.done():
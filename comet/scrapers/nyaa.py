@@ -9,62 +9,78 @@ from comet.scrapers.base import (
     BaseScraper,
     deduplicate_torrents,
     gather_with_error_logging,
+    parse_pages,
 )
 from comet.scrapers.models import ScrapeRequest
 from comet.services.torrent_manager import extract_trackers_from_magnet
 from comet.utils.formatting import size_to_bytes
 
 PAGE_PATTERN = re.compile(r'(\d+)(?=">\d+<\/a><\/li><li class="next">)')
-MAGNET_PATTERN = re.compile(r'href="(magnet:[^"]+)"')
-SIZE_PATTERN = re.compile(r'<td class="text-center">([\d.]+ (?:KiB|MiB|GiB|TiB))</td>')
-SEEDERS_PATTERN = re.compile(
-    r'<td class="text-center">(\d+)</td>\s*<td class="text-center">(\d+)</td>\s*<td class="text-center">(\d+)</td>'
-)
-TITLE_PATTERN = re.compile(r'href="/view/\d+" title="([^"]+)"')
 INFO_HASH_PATTERN = re.compile(r"btih:([a-fA-F0-9]{40}|[a-zA-Z0-9]{32})")
-ROW_PATTERN = re.compile(r"<tr(?:\s[^>]*)?>.*?</tr>", re.IGNORECASE | re.DOTALL)
+TRACKER_PATTERN = re.compile(r"[&?]tr=")
+ROW_END_PATTERN = re.compile(r"</tr>", re.IGNORECASE)
+# All fields of a row in document order, matched in a single search per row.
+ROW_FIELDS_PATTERN = re.compile(
+    r'href="/view/\d+" title="([^"]+)"'
+    r'.*?href="(magnet:[^"]+)"'
+    r'.*?<td class="text-center">([\d.]+ (?:KiB|MiB|GiB|TiB))</td>'
+    r'.*?<td class="text-center">(\d+)</td>\s*'
+    r'<td class="text-center">\d+</td>\s*<td class="text-center">\d+</td>',
+    re.DOTALL,
+)
 
 NYAA_BASE_URL = "https://nyaa.si"
 
 
 def extract_torrent_data(html_content: str):
     torrents = []
-    for row in ROW_PATTERN.findall(html_content):
-        magnet_match = MAGNET_PATTERN.search(row)
-        size_match = SIZE_PATTERN.search(row)
-        seeders_match = SEEDERS_PATTERN.search(row)
-        title_match = TITLE_PATTERN.search(row)
-        if not magnet_match or not size_match or not seeders_match or not title_match:
+    # Nyaa magnets share their tracker list, so each distinct tail is decoded once.
+    trackers_by_tail = {}
+    for row in ROW_END_PATTERN.split(html_content):
+        fields_match = ROW_FIELDS_PATTERN.search(row)
+        if not fields_match:
             continue
 
-        magnet = html.unescape(magnet_match.group(1))
+        title, magnet, size, seeders = fields_match.groups()
+        magnet = html.unescape(magnet)
         info_hash_match = INFO_HASH_PATTERN.search(magnet)
         if not info_hash_match:
             continue
         try:
-            size_bytes = size_to_bytes(size_match.group(1).replace("iB", "B"))
-            seeders = int(seeders_match.group(1))
+            size_bytes = size_to_bytes(size.replace("iB", "B"))
+            seeders = int(seeders)
         except (TypeError, ValueError):
             continue
 
+        tracker_match = TRACKER_PATTERN.search(magnet)
+        tracker_tail = magnet[tracker_match.start() :] if tracker_match else ""
+        sources = trackers_by_tail.get(tracker_tail)
+        if sources is None:
+            sources = extract_trackers_from_magnet(tracker_tail)
+            trackers_by_tail[tracker_tail] = sources
+
         torrents.append(
             {
-                "title": html.unescape(title_match.group(1)),
+                "title": html.unescape(title),
                 "infoHash": info_hash_match.group(1),
                 "fileIndex": None,
                 "seeders": seeders,
                 "size": size_bytes,
                 "tracker": "Nyaa",
-                "sources": extract_trackers_from_magnet(magnet),
+                "sources": list(sources),
             }
         )
 
     return torrents
 
 
-async def scrape_nyaa_page(
-    session, semaphore: asyncio.Semaphore, query: str, page: int
-):
+def extract_first_page(html_content: str):
+    last_page_match = PAGE_PATTERN.search(html_content)
+    last_page = int(last_page_match.group(1)) if last_page_match else 1
+    return extract_torrent_data(html_content), last_page
+
+
+async def fetch_nyaa_page(session, semaphore: asyncio.Semaphore, query: str, page: int):
     async with semaphore:
         url = f"{NYAA_BASE_URL}/?q={quote_plus(query)}"
         if page > 1:
@@ -75,10 +91,9 @@ async def scrape_nyaa_page(
                 logger.warning(
                     f"Failed to scrape Nyaa page {page} (consider reducing NYAA_MAX_CONCURRENT_PAGES): HTTP {response.status}"
                 )
-                return []
+                return None
 
-            html_content = await response.text()
-            return extract_torrent_data(html_content)
+            return await response.text()
 
 
 async def get_all_nyaa_pages(
@@ -86,39 +101,30 @@ async def get_all_nyaa_pages(
     query: str,
     semaphore: asyncio.Semaphore | None = None,
 ):
-    all_torrents = []
-
     if semaphore is None:
         semaphore = asyncio.Semaphore(settings.NYAA_MAX_CONCURRENT_PAGES)
 
-    first_page_url = f"{NYAA_BASE_URL}/?q={quote_plus(query)}"
+    first_page_text = await fetch_nyaa_page(session, semaphore, query, 1)
+    if first_page_text is None:
+        return []
 
-    async with semaphore, session.get(first_page_url) as response:
-        if response.status != 200:
-            logger.warning(f"Failed to scrape Nyaa page 1: HTTP {response.status}")
-            return []
-
-        first_page_text = await response.text()
-
-    first_page_torrents = extract_torrent_data(first_page_text)
-    all_torrents.extend(first_page_torrents)
-
-    last_page_matches = PAGE_PATTERN.findall(first_page_text)
-    if len(last_page_matches) == 0:
+    [(all_torrents, last_page_number)] = await parse_pages(
+        extract_first_page, [first_page_text]
+    )
+    if last_page_number <= 1:
         return all_torrents
 
-    last_page_number = int(last_page_matches[0])
-
-    if last_page_number > 1:
-        page_results = await gather_with_error_logging(
-            (
-                f"Nyaa query {query!r} page {page_number}",
-                scrape_nyaa_page(session, semaphore, query, page_number),
-            )
-            for page_number in range(2, last_page_number + 1)
+    pages = await gather_with_error_logging(
+        (
+            f"Nyaa query {query!r} page {page_number}",
+            fetch_nyaa_page(session, semaphore, query, page_number),
         )
-        for result in page_results:
-            all_torrents.extend(result)
+        for page_number in range(2, last_page_number + 1)
+    )
+    for result in await parse_pages(
+        extract_torrent_data, [page for page in pages if page is not None]
+    ):
+        all_torrents.extend(result)
 
     return all_torrents
 
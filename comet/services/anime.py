@@ -1,14 +1,20 @@
 import asyncio
 import os
 import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
 
 import aiohttp
 import orjson
+import xxhash
 
 from comet.core.database import backend_lock, database
 from comet.core.logger import logger
 from comet.core.models import settings
+from comet.services.anime_snapshot import build_snapshot, open_snapshot
+from comet.utils.atomic_file import write_bytes_atomic
 from comet.utils.memory import trim_process_memory
 
 _PROVIDER_URL_PATTERNS = (
@@ -38,6 +44,8 @@ _FRIBB_PROVIDER_ORDER = (
 
 _DB_CHUNK_SIZE = 10000
 _ANIME_REFRESH_LOCK_ID = 0xA11E0001
+# Bounds how long a worker serves entries that another worker's refresh replaced.
+_ENTRY_CACHE_TTL = 3600
 _ANIME_MEDIA_TYPES = {
     "MOVIE": "movie",
     "ONA": "series",
@@ -47,6 +55,54 @@ _ANIME_MEDIA_TYPES = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class _AnimeEntry:
+    """The fields of an anime entry that lookups use, decoded once."""
+
+    title: str | None
+    synonyms: tuple[str, ...]
+    media_type: str | None
+    linked_ids: dict[str, str]
+
+
+def _decode_entry(rows) -> _AnimeEntry | None:
+    if not rows:
+        return None
+
+    try:
+        data = orjson.loads(rows[0]["data_json"])
+    except (TypeError, orjson.JSONDecodeError):
+        data = None
+    if not isinstance(data, dict):
+        data = {}
+
+    title = data.get("title")
+    if not isinstance(title, str) or not title:
+        title = None
+    raw_synonyms = data.get("synonyms")
+
+    synonyms = []
+    seen = set()
+    for value in raw_synonyms if isinstance(raw_synonyms, list) else []:
+        if not isinstance(value, str) or not value or value == title:
+            continue
+        if value not in seen:
+            seen.add(value)
+            synonyms.append(value)
+
+    raw_type = data.get("type")
+    media_type = (
+        _ANIME_MEDIA_TYPES.get(raw_type.upper()) if isinstance(raw_type, str) else None
+    )
+
+    linked_ids = {}
+    for row in rows:
+        if row["linked_provider"] and row["linked_id"]:
+            linked_ids.setdefault(row["linked_provider"], row["linked_id"])
+
+    return _AnimeEntry(title, tuple(synonyms), media_type, linked_ids)
+
+
 @asynccontextmanager
 async def _anime_refresh_lock():
     async with backend_lock(
@@ -66,6 +122,9 @@ class AnimeMapper:
         self.anime_imdb_ids = set()
         self._kitsu_mapping_cache = {}
         self._imdb_kitsu_mapping_cache = {}
+        self._entry_cache: OrderedDict[
+            tuple[str, str], tuple[float, _AnimeEntry | None]
+        ] = OrderedDict()
 
         self._aod_url = "https://github.com/manami-project/anime-offline-database/releases/latest/download/anime-offline-database-minified.json"
         self._fribb_url = "https://raw.githubusercontent.com/Fribb/anime-lists/refs/heads/master/anime-list-full.json"
@@ -106,86 +165,68 @@ class AnimeMapper:
 
         return media_only_id in self.anime_imdb_ids
 
-    async def _get_entry_data(self, media_id: str):
+    async def _get_entry(self, media_id: str) -> _AnimeEntry | None:
         provider, provider_id = self._parse_media_id(media_id)
         if provider is None:
             return None
+        return await self._lookup_entry(provider, str(provider_id))
 
-        row = await database.fetch_one(
+    async def _lookup_entry(
+        self, provider: str, provider_id: str
+    ) -> _AnimeEntry | None:
+        key = (provider, provider_id)
+        cached = self._entry_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _ENTRY_CACHE_TTL:
+            self._entry_cache.move_to_end(key)
+            return cached[1]
+
+        rows = await database.fetch_all(
             """
-            SELECT e.data_json 
-            FROM anime_entries e
-            INNER JOIN anime_ids i ON e.id = i.entry_id
-            WHERE i.provider = :provider AND i.provider_id = :provider_id
-            LIMIT 1
+            SELECT e.data_json, i2.provider AS linked_provider, i2.provider_id AS linked_id
+            FROM anime_ids i1
+            INNER JOIN anime_entries e ON e.id = i1.entry_id
+            LEFT JOIN anime_ids i2
+                ON i2.entry_id = i1.entry_id
+                AND i2.provider IN ('imdb', 'kitsu', 'anilist')
+            WHERE i1.provider = :provider AND i1.provider_id = :provider_id
             """,
             {"provider": provider, "provider_id": provider_id},
         )
-        if not row:
-            return None
+        entry = _decode_entry(rows)
 
-        try:
-            data = orjson.loads(row["data_json"])
-        except (TypeError, orjson.JSONDecodeError):
-            return None
-        return data if isinstance(data, dict) else None
+        max_entries = settings.ANIME_ENTRY_CACHE_SIZE
+        if max_entries > 0:
+            self._entry_cache[key] = (time.monotonic(), entry)
+            self._entry_cache.move_to_end(key)
+            while len(self._entry_cache) > max_entries:
+                self._entry_cache.popitem(last=False)
+        return entry
 
     async def get_aliases(self, media_id: str):
         if not self.loaded:
             return {}
 
-        data = await self._get_entry_data(media_id)
-        if not data:
-            return {}
-
-        title = data.get("title")
-        if not isinstance(title, str) or not title:
-            title = None
-        raw_synonyms = data.get("synonyms")
-
-        synonyms = []
-        seen = set()
-        for value in raw_synonyms if isinstance(raw_synonyms, list) else []:
-            if not isinstance(value, str) or not value or value == title:
-                continue
-            if value not in seen:
-                seen.add(value)
-                synonyms.append(value)
-
-        if not title and not synonyms:
+        entry = await self._get_entry(media_id)
+        if entry is None or (not entry.title and not entry.synonyms):
             return {}
 
         aliases = {}
-        if title:
-            aliases["original"] = [title]
-        if synonyms:
-            aliases["ez"] = synonyms
+        if entry.title:
+            aliases["original"] = [entry.title]
+        if entry.synonyms:
+            aliases["ez"] = list(entry.synonyms)
         return aliases
 
     async def get_media_type(self, media_id: str) -> str | None:
-        data = await self._get_entry_data(media_id)
-        if not data:
-            return None
-        raw_type = data.get("type")
-        if not isinstance(raw_type, str):
-            return None
-        return _ANIME_MEDIA_TYPES.get(raw_type.upper())
+        entry = await self._get_entry(media_id)
+        return entry.media_type if entry else None
 
     async def get_imdb_from_kitsu(self, kitsu_id: str | int):
         if not self.loaded:
             return None
 
-        imdb_id = await database.fetch_val(
-            """
-            SELECT i2.provider_id
-            FROM anime_ids i1
-            JOIN anime_ids i2 ON i1.entry_id = i2.entry_id
-            WHERE i1.provider = 'kitsu' AND i1.provider_id = :kitsu_id
-            AND i2.provider = 'imdb'
-            LIMIT 1
-            """,
-            {"kitsu_id": str(kitsu_id)},
-        )
+        entry = await self._lookup_entry("kitsu", str(kitsu_id))
+        imdb_id = entry.linked_ids.get("imdb") if entry else None
 
         if imdb_id:
             return imdb_id
@@ -200,17 +241,8 @@ class AnimeMapper:
         if not self.loaded:
             return None
 
-        kitsu_id = await database.fetch_val(
-            """
-            SELECT i2.provider_id
-            FROM anime_ids i1
-            JOIN anime_ids i2 ON i1.entry_id = i2.entry_id
-            WHERE i1.provider = 'imdb' AND i1.provider_id = :imdb_id
-            AND i2.provider = 'kitsu'
-            LIMIT 1
-            """,
-            {"imdb_id": str(imdb_id)},
-        )
+        entry = await self._lookup_entry("imdb", str(imdb_id))
+        kitsu_id = entry.linked_ids.get("kitsu") if entry else None
 
         if kitsu_id:
             return kitsu_id
@@ -229,23 +261,8 @@ class AnimeMapper:
         if not self.loaded:
             return None
 
-        provider, provider_id = self._parse_media_id(media_id)
-
-        if provider is None:
-            return None
-
-        query = """
-            SELECT i2.provider_id
-            FROM anime_ids i1
-            JOIN anime_ids i2 ON i1.entry_id = i2.entry_id
-            WHERE i1.provider = :provider AND i1.provider_id = :provider_id
-            AND i2.provider = 'anilist'
-            LIMIT 1
-        """
-
-        return await database.fetch_val(
-            query, {"provider": provider, "provider_id": provider_id}
-        )
+        entry = await self._get_entry(media_id)
+        return entry.linked_ids.get("anilist") if entry else None
 
     def get_kitsu_episode_mapping(self, kitsu_id: str | int):
         if not self.loaded:
@@ -278,13 +295,17 @@ class AnimeMapper:
             return False
 
         row = await database.fetch_one(
-            "SELECT refreshed_at FROM anime_mapping_state WHERE id = 1",
+            """
+            SELECT COALESCE(checked_at, refreshed_at) AS checked_at
+            FROM anime_mapping_state
+            WHERE id = 1
+            """,
         )
 
         if not row:
             return True
 
-        last_refresh = row["refreshed_at"]
+        last_refresh = row["checked_at"]
         if last_refresh is None:
             return True
 
@@ -325,7 +346,68 @@ class AnimeMapper:
 
         return kitsu_mapping_cache, imdb_kitsu_mapping_cache
 
+    async def _read_mapping_revision(self) -> tuple[float, int]:
+        row = await database.fetch_one(
+            """
+            SELECT
+                (SELECT refreshed_at FROM anime_mapping_state WHERE id = 1)
+                    AS refreshed_at,
+                (
+                    SELECT COUNT(*)
+                    FROM anime_provider_overrides
+                    WHERE source_provider = 'kitsu'
+                      AND target_provider = 'imdb'
+                ) AS override_count
+            """
+        )
+        refreshed_at = row["refreshed_at"] if row else None
+        override_count = row["override_count"] if row else 0
+        return float(refreshed_at or 0.0), int(override_count or 0)
+
+    async def _load_mapping_snapshot(self, path: Path) -> bool:
+        revision = await self._read_mapping_revision()
+        # A mapping that was never refreshed has no stable revision to match.
+        snapshot = (
+            await asyncio.to_thread(open_snapshot, path, revision)
+            if revision[0] > 0
+            else None
+        )
+        if snapshot is None:
+            anime_imdb_ids = await self._read_provider_ids()
+            (
+                kitsu_mapping_cache,
+                imdb_kitsu_mapping_cache,
+            ) = await self._read_kitsu_mapping_caches()
+            payload = await asyncio.to_thread(
+                build_snapshot,
+                revision,
+                anime_imdb_ids,
+                kitsu_mapping_cache,
+                imdb_kitsu_mapping_cache,
+            )
+            del anime_imdb_ids, kitsu_mapping_cache, imdb_kitsu_mapping_cache
+            try:
+                await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+                await write_bytes_atomic(path, payload)
+            except OSError as exc:
+                logger.warning(f"Failed to write anime mapping snapshot: {exc}")
+                return False
+            del payload
+            snapshot = await asyncio.to_thread(open_snapshot, path, revision)
+            if snapshot is None:
+                return False
+
+        self.anime_imdb_ids = snapshot.anime_imdb_ids
+        self._kitsu_mapping_cache = snapshot.kitsu_mapping
+        self._imdb_kitsu_mapping_cache = snapshot.imdb_kitsu_mapping
+        return True
+
     async def _load_mapping_caches(self):
+        self._entry_cache.clear()
+        snapshot_path = settings.ANIME_MAPPING_SNAPSHOT_PATH
+        if snapshot_path and await self._load_mapping_snapshot(Path(snapshot_path)):
+            return
+
         anime_imdb_ids = await self._read_provider_ids()
         (
             kitsu_mapping_cache,
@@ -429,24 +511,71 @@ class AnimeMapper:
                     ):
                         return True
 
-                    async def _download_json(url: str, label: str):
+                    state = await self._read_mapping_state()
+                    validators = state["sources"]
+
+                    async def _download_json(
+                        url: str, label: str, conditional: bool = True
+                    ):
+                        headers = {}
+                        source_validators = validators.get(url) if conditional else None
+                        if source_validators:
+                            if source_validators.get("etag"):
+                                headers["If-None-Match"] = source_validators["etag"]
+                            if source_validators.get("last_modified"):
+                                headers["If-Modified-Since"] = source_validators[
+                                    "last_modified"
+                                ]
+
                         logger.log("COMET", f"Downloading anime mapping ({label})...")
-                        async with session.get(url) as response:
-                            return response.status, await response.read()
+                        async with session.get(url, headers=headers) as response:
+                            if response.status == 304:
+                                return response.status, None
+                            payload = await response.read()
+                            if response.status == 200:
+                                validators[url] = {
+                                    "etag": response.headers.get("ETag"),
+                                    "last_modified": response.headers.get(
+                                        "Last-Modified"
+                                    ),
+                                }
+                            return response.status, payload
+
+                    sources = (
+                        (self._aod_url, "Source 1/3: Anime Offline Database"),
+                        (self._fribb_url, "Source 2/3: Fribb Anime List"),
+                        (self._kitsu_imdb_url, "Source 3/3: Kitsu-IMDB Mapping"),
+                    )
+                    downloads = await asyncio.gather(
+                        *(_download_json(url, label) for url, label in sources)
+                    )
+                    if (
+                        self.loaded
+                        and self._kitsu_mapping_cache
+                        and state["refreshed_at"] is not None
+                        and all(status == 304 for status, _ in downloads)
+                    ):
+                        await self._save_mapping_state(
+                            state["refreshed_at"], time.time(), validators
+                        )
+                        logger.log("COMET", "Anime mapping sources are unchanged")
+                        return True
 
+                    # Entries and IMDb links are rebuilt from all three lists,
+                    # so sources that did not change are fetched in full.
+                    downloads = [
+                        (
+                            await _download_json(url, label, conditional=False)
+                            if status == 304
+                            else (status, payload)
+                        )
+                        for (url, label), (status, payload) in zip(sources, downloads)
+                    ]
                     (
                         (aod_status, aod_payload),
                         (fribb_status, fribb_payload),
                         (kitsu_status, kitsu_payload),
-                    ) = await asyncio.gather(
-                        _download_json(
-                            self._aod_url, "Source 1/3: Anime Offline Database"
-                        ),
-                        _download_json(self._fribb_url, "Source 2/3: Fribb Anime List"),
-                        _download_json(
-                            self._kitsu_imdb_url, "Source 3/3: Kitsu-IMDB Mapping"
-                        ),
-                    )
+                    ) = downloads
 
                     if aod_status != 200:
                         logger.error(f"Failed to load AOD: HTTP {aod_status}")
@@ -479,6 +608,8 @@ class AnimeMapper:
                         anime_list,
                         data_fribb,
                         data_kitsu_imdb,
+                        previous_refreshed_at=state["refreshed_at"],
+                        source_validators=validators,
                     )
 
                     del data_aod
@@ -504,29 +635,104 @@ class AnimeMapper:
                 if own_session and session:
                     await session.close()
 
+    async def _read_mapping_state(self) -> dict:
+        row = await database.fetch_one(
+            """
+            SELECT refreshed_at, sources_json
+            FROM anime_mapping_state
+            WHERE id = 1
+            """
+        )
+        sources = {}
+        if row and row["sources_json"]:
+            try:
+                sources = orjson.loads(row["sources_json"])
+            except orjson.JSONDecodeError:
+                sources = {}
+        return {
+            "refreshed_at": row["refreshed_at"] if row else None,
+            "sources": sources if isinstance(sources, dict) else {},
+        }
+
+    async def _save_mapping_state(
+        self,
+        refreshed_at: float,
+        checked_at: float,
+        source_validators: dict,
+    ):
+        await database.execute(
+            """
+            INSERT INTO anime_mapping_state (
+                id,
+                refreshed_at,
+                checked_at,
+                sources_json
+            )
+            VALUES (1, :refreshed_at, :checked_at, :sources_json)
+            ON CONFLICT (id) DO UPDATE SET
+                refreshed_at = EXCLUDED.refreshed_at,
+                checked_at = EXCLUDED.checked_at,
+                sources_json = EXCLUDED.sources_json
+            """,
+            {
+                "refreshed_at": refreshed_at,
+                "checked_at": checked_at,
+                "sources_json": orjson.dumps(source_validators).decode("utf-8"),
+            },
+        )
+
     async def _persist_remote_mapping(
         self,
         anime_list: list,
         fribb_list: list,
         kitsu_imdb_data: list,
+        *,
+        previous_refreshed_at: float | None = None,
+        source_validators: dict | None = None,
     ) -> int:
         async with database.transaction():
-            total_entries = await self._persist_mapping(anime_list, fribb_list)
-            await self._persist_provider_overrides(kitsu_imdb_data)
-        return total_entries
-
-    async def _persist_mapping(self, anime_list: list, fribb_list: list):
-        timestamp = time.time()
-
-        entries_batch = []
-        ids_batch = []
-        lookup_map = {}
-        total_entries = 0
+            entries_changed = await self._persist_mapping(anime_list, fribb_list)
+            overrides_changed = await self._persist_provider_overrides(kitsu_imdb_data)
+            # `refreshed_at` is the content revision shared by every node, so
+            # it only moves when the mapping actually changed.
+            timestamp = time.time()
+            await self._save_mapping_state(
+                timestamp
+                if entries_changed or overrides_changed or not previous_refreshed_at
+                else previous_refreshed_at,
+                timestamp,
+                source_validators or {},
+            )
+        return len(anime_list)
 
+    @staticmethod
+    def _extract_provider_ids(entry: dict):
+        for source in entry.get("sources") or ():
+            for url_part, provider in _PROVIDER_URL_PATTERNS:
+                if url_part in source:
+                    try:
+                        if "id=" in source:
+                            provider_id = source.split("id=", 1)[1].split("&", 1)[0]
+                        else:
+                            provider_id = source.rstrip("/").rsplit("/", 1)[-1]
+                        yield provider, provider_id
+                    except (IndexError, ValueError):
+                        pass
+                    break
+
+    async def _persist_mapping(self, anime_list: list, fribb_list: list) -> int:
+        """Write the differences to `anime_entries` and `anime_ids`.
+
+        Entries are identified by a hash of their content, so an unchanged
+        entry keeps its id and only new, removed or edited entries are
+        written. Returns the number of changed rows.
+        """
         entries_query = """
-            INSERT INTO anime_entries (id, data_json)
-            VALUES (:id, :data_json)
-            ON CONFLICT (id) DO UPDATE SET data_json = EXCLUDED.data_json
+            INSERT INTO anime_entries (id, data_json, content_hash)
+            VALUES (:id, :data_json, :content_hash)
+            ON CONFLICT (id) DO UPDATE SET
+                data_json = EXCLUDED.data_json,
+                content_hash = EXCLUDED.content_hash
         """
         ids_query = """
             INSERT INTO anime_ids (provider, provider_id, entry_id) 
@@ -536,79 +742,44 @@ class AnimeMapper:
 
         try:
             async with database.transaction():
-                await database.execute("DELETE FROM anime_ids")
-                await database.execute("DELETE FROM anime_entries")
-
-                async def flush_entries(batch: list[dict]) -> int:
-                    if not batch:
-                        return 0
-
-                    await database.execute_many(entries_query, batch)
-                    flushed_count = len(batch)
-                    batch.clear()
-                    return flushed_count
-
-                async def flush_ids(batch: list[dict]):
-                    if not batch:
-                        return
-
-                    # `anime_ids.entry_id` now has a real FK to `anime_entries.id`,
-                    # so parent rows must exist before child rows are flushed.
-                    await database.execute_many(ids_query, batch)
-                    batch.clear()
-
-                for idx, entry in enumerate(anime_list):
-                    entry_id = idx + 1
-                    entries_batch.append(
-                        {
-                            "id": entry_id,
-                            "data_json": orjson.dumps(entry).decode("utf-8"),
-                        }
-                    )
+                existing_entries = {}
+                stale_entry_ids = []
+                next_entry_id = 1
+                for row in await database.fetch_all(
+                    "SELECT id, content_hash FROM anime_entries"
+                ):
+                    next_entry_id = max(next_entry_id, row["id"] + 1)
+                    content_hash = row["content_hash"]
+                    if content_hash is None or content_hash in existing_entries:
+                        stale_entry_ids.append(row["id"])
+                    else:
+                        existing_entries[content_hash] = row["id"]
+
+                new_entries = []
+                wanted_ids = {}
+                lookup_map = {}
+                for entry in anime_list:
+                    data_json = orjson.dumps(entry)
+                    content_hash = xxhash.xxh3_64_hexdigest(data_json)
+                    entry_id = existing_entries.pop(content_hash, None)
+                    if entry_id is None:
+                        entry_id = next_entry_id
+                        next_entry_id += 1
+                        new_entries.append(
+                            {
+                                "id": entry_id,
+                                "data_json": data_json.decode("utf-8"),
+                                "content_hash": content_hash,
+                            }
+                        )
+
+                    for provider, provider_id in self._extract_provider_ids(entry):
+                        wanted_ids.setdefault((provider, provider_id), entry_id)
+                        lookup_map[f"{provider}:{provider_id}"] = entry_id
+
+                stale_entry_ids.extend(existing_entries.values())
+                del existing_entries
 
-                    sources = entry.get("sources")
-                    if sources:
-                        for source in sources:
-                            for url_part, provider in _PROVIDER_URL_PATTERNS:
-                                if url_part in source:
-                                    try:
-                                        if "id=" in source:
-                                            provider_id = source.split("id=", 1)[
-                                                1
-                                            ].split("&", 1)[0]
-                                        else:
-                                            provider_id = source.rstrip("/").rsplit(
-                                                "/", 1
-                                            )[-1]
-
-                                        ids_batch.append(
-                                            {
-                                                "provider": provider,
-                                                "provider_id": provider_id,
-                                                "entry_id": entry_id,
-                                            }
-                                        )
-                                        lookup_map[f"{provider}:{provider_id}"] = (
-                                            entry_id
-                                        )
-                                    except (IndexError, ValueError):
-                                        pass
-                                    break
-
-                    if len(entries_batch) >= _DB_CHUNK_SIZE:
-                        total_entries += await flush_entries(entries_batch)
-
-                    if len(ids_batch) >= _DB_CHUNK_SIZE:
-                        total_entries += await flush_entries(entries_batch)
-                        await flush_ids(ids_batch)
-
-                total_entries += await flush_entries(entries_batch)
-                await flush_ids(ids_batch)
-
-                del entries_batch
-                del ids_batch
-
-                fribb_batch = []
                 for entry in fribb_list:
                     imdb_id = entry.get("imdb_id")
                     if not imdb_id:
@@ -626,54 +797,126 @@ class AnimeMapper:
                                 for single_imdb_id in imdb_ids:
                                     if not single_imdb_id:
                                         continue
-                                    fribb_batch.append(
-                                        {
-                                            "provider": "imdb",
-                                            "provider_id": str(single_imdb_id),
-                                            "entry_id": found_entry_id,
-                                        }
+                                    wanted_ids.setdefault(
+                                        ("imdb", str(single_imdb_id)), found_entry_id
                                     )
                                 break
 
-                    if len(fribb_batch) >= _DB_CHUNK_SIZE:
-                        await database.execute_many(ids_query, fribb_batch)
-                        fribb_batch.clear()
-
-                if fribb_batch:
-                    await database.execute_many(ids_query, fribb_batch)
-                    fribb_batch.clear()
-
-                del fribb_batch
                 del lookup_map
 
-                await database.execute(
-                    """
-                    INSERT INTO anime_mapping_state (id, refreshed_at)
-                    VALUES (1, :timestamp)
-                    ON CONFLICT (id) DO UPDATE SET refreshed_at = :timestamp
-                    """,
-                    {"timestamp": timestamp},
-                )
+                removed_ids = []
+                for row in await database.fetch_all(
+                    "SELECT provider, provider_id, entry_id FROM anime_ids"
+                ):
+                    key = (row["provider"], row["provider_id"])
+                    if wanted_ids.get(key) == row["entry_id"]:
+                        del wanted_ids[key]
+                    else:
+                        removed_ids.append({"provider": key[0], "provider_id": key[1]})
+
+                for start in range(0, len(removed_ids), _DB_CHUNK_SIZE):
+                    await database.execute_many(
+                        """
+                        DELETE FROM anime_ids
+                        WHERE provider = :provider AND provider_id = :provider_id
+                        """,
+                        removed_ids[start : start + _DB_CHUNK_SIZE],
+                    )
+                for start in range(0, len(stale_entry_ids), _DB_CHUNK_SIZE):
+                    await database.execute_many(
+                        "DELETE FROM anime_entries WHERE id = :id",
+                        [
+                            {"id": entry_id}
+                            for entry_id in stale_entry_ids[
+                                start : start + _DB_CHUNK_SIZE
+                            ]
+                        ],
+                    )
+                # `anime_ids.entry_id` now has a real FK to `anime_entries.id`,
+                # so parent rows must exist before child rows are flushed.
+                for start in range(0, len(new_entries), _DB_CHUNK_SIZE):
+                    await database.execute_many(
+                        entries_query, new_entries[start : start + _DB_CHUNK_SIZE]
+                    )
+                added_ids = [
+                    {
+                        "provider": provider,
+                        "provider_id": provider_id,
+                        "entry_id": entry_id,
+                    }
+                    for (provider, provider_id), entry_id in wanted_ids.items()
+                ]
+                for start in range(0, len(added_ids), _DB_CHUNK_SIZE):
+                    await database.execute_many(
+                        ids_query, added_ids[start : start + _DB_CHUNK_SIZE]
+                    )
 
-            return total_entries
+            logger.log(
+                "COMET",
+                "Anime mapping diff: "
+                f"{len(new_entries)} entries added, {len(stale_entry_ids)} removed, "
+                f"{len(added_ids)} ids added, {len(removed_ids)} removed",
+            )
+            return (
+                len(new_entries)
+                + len(stale_entry_ids)
+                + len(added_ids)
+                + len(removed_ids)
+            )
         except Exception as exc:
             logger.error(f"Failed to persist anime mapping cache: {exc}")
             raise
 
-    async def _persist_provider_overrides(self, kitsu_imdb_data: list):
-        total_count = 0
-        batch = []
+    async def _persist_provider_overrides(self, kitsu_imdb_data: list) -> int:
+        """Upsert changed Kitsu-IMDB overrides and delete removed ones."""
         batch_size = 1000
 
+        wanted = {}
+        for entry in kitsu_imdb_data:
+            kitsu_id = entry["kitsu_id"]
+
+            imdb_id = entry.get("imdb_id")
+            if not imdb_id:
+                continue
+
+            wanted[str(kitsu_id)] = (
+                imdb_id,
+                entry.get("fromSeason"),
+                entry.get("fromEpisode"),
+            )
+
         try:
             async with database.transaction():
-                await database.execute(
+                rows = await database.fetch_all(
                     """
-                    DELETE FROM anime_provider_overrides
+                    SELECT source_id, target_id, from_season, from_episode
+                    FROM anime_provider_overrides
                     WHERE source_provider = 'kitsu'
                       AND target_provider = 'imdb'
                     """
                 )
+                removed = []
+                for row in rows:
+                    current = (
+                        row["target_id"],
+                        row["from_season"],
+                        row["from_episode"],
+                    )
+                    if row["source_id"] not in wanted:
+                        removed.append({"source_id": row["source_id"]})
+                    elif wanted[row["source_id"]] == current:
+                        del wanted[row["source_id"]]
+
+                for start in range(0, len(removed), batch_size):
+                    await database.execute_many(
+                        """
+                        DELETE FROM anime_provider_overrides
+                        WHERE source_provider = 'kitsu'
+                          AND source_id = :source_id
+                          AND target_provider = 'imdb'
+                        """,
+                        removed[start : start + batch_size],
+                    )
 
                 insert_query = """
                     INSERT INTO anime_provider_overrides
@@ -698,37 +941,25 @@ class AnimeMapper:
                         from_season = :from_season,
                         from_episode = :from_episode
                 """
-
-                for entry in kitsu_imdb_data:
-                    kitsu_id = entry["kitsu_id"]
-
-                    imdb_id = entry.get("imdb_id")
-                    if not imdb_id:
-                        continue
-
-                    from_season = entry.get("fromSeason")
-                    from_episode = entry.get("fromEpisode")
-
-                    batch.append(
-                        {
-                            "source_id": str(kitsu_id),
-                            "target_id": imdb_id,
-                            "from_season": from_season,
-                            "from_episode": from_episode,
-                        }
+                changed = [
+                    {
+                        "source_id": source_id,
+                        "target_id": target_id,
+                        "from_season": from_season,
+                        "from_episode": from_episode,
+                    }
+                    for source_id, (
+                        target_id,
+                        from_season,
+                        from_episode,
+                    ) in wanted.items()
+                ]
+                for start in range(0, len(changed), batch_size):
+                    await database.execute_many(
+                        insert_query, changed[start : start + batch_size]
                     )
 
-                    if len(batch) >= batch_size:
-                        await database.execute_many(insert_query, batch)
-                        total_count += len(batch)
-                        batch.clear()
-
-                if batch:
-                    await database.execute_many(insert_query, batch)
-                    total_count += len(batch)
-                    batch.clear()
-
-            return total_count
+            return len(changed) + len(removed)
         except Exception as exc:
             logger.error(f"Failed to persist anime provider overrides: {exc}")
             raise
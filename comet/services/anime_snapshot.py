@@ -0,0 +1,266 @@
+import mmap
+import struct
+from array import array
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
+from pathlib import Path
+
+# Read-only, memory-mapped form of the anime mapping lookup tables.
+#
+# Every worker on a host maps the same file, so the pages are shared through
+# the page cache instead of being rebuilt as Python sets and dicts per worker.
+# The file is host-local (native byte order) and is replaced atomically, so a
+# worker keeps reading its current mapping until it opens the new one.
+#
+# Layout: header, then columns in `_COLUMNS` order. A string column is
+# `count`, `count + 1` uint32 offsets and the UTF-8 blob, padded to 4 bytes.
+# An int column is `count` followed by `count` int32 values.
+
+_MAGIC = b"CAMS"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("=4sIdq")
+_COUNT = struct.Struct("=I")
+_NONE_INT = -(2**31)
+
+_STRING = "string"
+_INT = "int"
+_COLUMNS = (
+    ("imdb_ids", _STRING),
+    ("kitsu_ids", _STRING),
+    ("kitsu_imdb_ids", _STRING),
+    ("kitsu_from_seasons", _INT),
+    ("kitsu_from_episodes", _INT),
+    ("reverse_imdb_ids", _STRING),
+    ("reverse_kitsu_ids", _STRING),
+)
+
+
+def _pad(buffer: bytearray) -> None:
+    buffer.extend(b"\0" * (-len(buffer) % 4))
+
+
+def _encode_strings(buffer: bytearray, values: list[bytes]) -> None:
+    offsets = array("I", [0])
+    for value in values:
+        offsets.append(offsets[-1] + len(value))
+    buffer.extend(_COUNT.pack(len(values)))
+    buffer.extend(offsets.tobytes())
+    buffer.extend(b"".join(values))
+    _pad(buffer)
+
+
+def _encode_ints(buffer: bytearray, values: list[int | None]) -> None:
+    buffer.extend(_COUNT.pack(len(values)))
+    buffer.extend(
+        array(
+            "i", [_NONE_INT if value is None else value for value in values]
+        ).tobytes()
+    )
+
+
+def build_snapshot(
+    revision: tuple[float, int],
+    anime_imdb_ids,
+    kitsu_mapping: dict,
+    imdb_kitsu_mapping: dict,
+) -> bytes:
+    """Encode the lookup tables loaded by `AnimeMapper` into snapshot bytes."""
+    kitsu_rows = sorted(
+        (str(kitsu_id).encode(), mapping) for kitsu_id, mapping in kitsu_mapping.items()
+    )
+    reverse_rows = sorted(
+        (
+            (str(imdb_id).encode(), position, str(kitsu_id).encode())
+            for imdb_id, kitsu_ids in imdb_kitsu_mapping.items()
+            for position, kitsu_id in enumerate(kitsu_ids)
+        ),
+    )
+    columns = {
+        "imdb_ids": sorted({str(imdb_id).encode() for imdb_id in anime_imdb_ids}),
+        "kitsu_ids": [kitsu_id for kitsu_id, _ in kitsu_rows],
+        "kitsu_imdb_ids": [
+            str(mapping["imdb_id"]).encode() for _, mapping in kitsu_rows
+        ],
+        "kitsu_from_seasons": [mapping["from_season"] for _, mapping in kitsu_rows],
+        "kitsu_from_episodes": [mapping["from_episode"] for _, mapping in kitsu_rows],
+        "reverse_imdb_ids": [row[0] for row in reverse_rows],
+        "reverse_kitsu_ids": [row[2] for row in reverse_rows],
+    }
+
+    refreshed_at, override_count = revision
+    buffer = bytearray(
+        _HEADER.pack(_MAGIC, _FORMAT_VERSION, refreshed_at, override_count)
+    )
+    for name, kind in _COLUMNS:
+        if kind == _STRING:
+            _encode_strings(buffer, columns[name])
+        else:
+            _encode_ints(buffer, columns[name])
+    return bytes(buffer)
+
+
+class _StringColumn:
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def raw(self, index: int) -> bytes:
+        return bytes(self._blob[self._offsets[index] : self._offsets[index + 1]])
+
+    def __getitem__(self, index: int) -> str:
+        return self.raw(index).decode()
+
+    def lower_bound(self, key: bytes) -> int:
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.raw(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find(self, key: bytes) -> int:
+        index = self.lower_bound(key)
+        if index < len(self) and self.raw(index) == key:
+            return index
+        return -1
+
+
+def _decode_columns(view: memoryview, position: int) -> dict:
+    columns = {}
+    for name, kind in _COLUMNS:
+        (count,) = _COUNT.unpack_from(view, position)
+        position += _COUNT.size
+        if kind == _INT:
+            end = position + count * 4
+            columns[name] = view[position:end].cast("i")
+            position = end
+            continue
+
+        offsets_end = position + (count + 1) * 4
+        offsets = view[position:offsets_end].cast("I")
+        blob_end = offsets_end + offsets[-1]
+        columns[name] = _StringColumn(offsets, view[offsets_end:blob_end])
+        position = blob_end + (-blob_end % 4)
+    return columns
+
+
+class AnimeMappingSnapshot:
+    """Lookup views over one memory-mapped snapshot file."""
+
+    def __init__(self, buffer, revision: tuple[float, int]):
+        view = memoryview(buffer)
+        columns = _decode_columns(view, _HEADER.size)
+        self.revision = revision
+        self.anime_imdb_ids = _AnimeImdbIds(columns["imdb_ids"])
+        self.kitsu_mapping = _KitsuMappingView(
+            columns["kitsu_ids"],
+            columns["kitsu_imdb_ids"],
+            columns["kitsu_from_seasons"],
+            columns["kitsu_from_episodes"],
+        )
+        self.imdb_kitsu_mapping = _ImdbKitsuMappingView(
+            columns["reverse_imdb_ids"], columns["reverse_kitsu_ids"]
+        )
+
+
+class _AnimeImdbIds(AbstractSet):
+    def __init__(self, ids: _StringColumn):
+        self._ids = ids
+
+    def __contains__(self, imdb_id):
+        return isinstance(imdb_id, str) and self._ids.find(imdb_id.encode()) >= 0
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        return (self._ids[index] for index in range(len(self._ids)))
+
+
+def _optional_int(value: int) -> int | None:
+    return None if value == _NONE_INT else value
+
+
+class _KitsuMappingView(Mapping):
+    def __init__(self, kitsu_ids, imdb_ids, from_seasons, from_episodes):
+        self._kitsu_ids = kitsu_ids
+        self._imdb_ids = imdb_ids
+        self._from_seasons = from_seasons
+        self._from_episodes = from_episodes
+
+    def __getitem__(self, kitsu_id):
+        if not isinstance(kitsu_id, str):
+            raise KeyError(kitsu_id)
+        index = self._kitsu_ids.find(kitsu_id.encode())
+        if index < 0:
+            raise KeyError(kitsu_id)
+        return {
+            "imdb_id": self._imdb_ids[index],
+            "from_season": _optional_int(self._from_seasons[index]),
+            "from_episode": _optional_int(self._from_episodes[index]),
+        }
+
+    def __len__(self):
+        return len(self._kitsu_ids)
+
+    def __iter__(self):
+        return (self._kitsu_ids[index] for index in range(len(self._kitsu_ids)))
+
+
+class _ImdbKitsuMappingView(Mapping):
+    def __init__(self, imdb_ids: _StringColumn, kitsu_ids: _StringColumn):
+        self._imdb_ids = imdb_ids
+        self._kitsu_ids = kitsu_ids
+
+    def __getitem__(self, imdb_id):
+        if not isinstance(imdb_id, str):
+            raise KeyError(imdb_id)
+        key = imdb_id.encode()
+        index = self._imdb_ids.lower_bound(key)
+        kitsu_ids = []
+        while index < len(self._imdb_ids) and self._imdb_ids.raw(index) == key:
+            kitsu_ids.append(self._kitsu_ids[index])
+            index += 1
+        if not kitsu_ids:
+            raise KeyError(imdb_id)
+        return kitsu_ids
+
+    def __len__(self):
+        return len(dict.fromkeys(self))
+
+    def __iter__(self):
+        previous = None
+        for index in range(len(self._imdb_ids)):
+            imdb_id = self._imdb_ids.raw(index)
+            if imdb_id != previous:
+                previous = imdb_id
+                yield imdb_id.decode()
+
+
+def open_snapshot(
+    path: Path, revision: tuple[float, int]
+) -> AnimeMappingSnapshot | None:
+    """Map the snapshot at `path` if it was built from `revision`."""
+    try:
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    if len(buffer) < _HEADER.size:
+        return None
+    magic, version, refreshed_at, override_count = _HEADER.unpack_from(buffer, 0)
+    if (
+        magic != _MAGIC
+        or version != _FORMAT_VERSION
+        or (refreshed_at, override_count) != revision
+    ):
+        return None
+    return AnimeMappingSnapshot(buffer, revision)
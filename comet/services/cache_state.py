@@ -172,7 +172,14 @@ class CacheStateManager:
             self._lock_acquired = False
 
     async def check_and_decide(self, torrent_count: int) -> CacheCheckResult:
-        last_scraped_at = await self.register_demand()
+        return await self.decide(torrent_count, await self.register_demand())
+
+    async def decide(
+        self,
+        torrent_count: int,
+        last_scraped_at: float | None,
+    ) -> CacheCheckResult:
+        """Decide from a `register_demand` result fetched ahead of time."""
         state = self._determine_state(torrent_count, last_scraped_at)
         lock_acquired = False
         if state in (CacheState.EMPTY, CacheState.FIRST_SEARCH):
@@ -1,14 +1,18 @@
+import asyncio
 import time
 
 from RTN import ParsedData
 
+from comet.core.models import settings
 from comet.debrid.exceptions import DebridAuthError
 from comet.debrid.manager import retrieve_debrid_availability
 from comet.observability import metrics
 from comet.services.debrid_cache import (
     get_cached_availability,
     get_cached_availability_any_service,
+    get_known_uncached,
     schedule_cache_availability,
+    schedule_cache_unavailability,
 )
 from comet.utils.parsing import MediaScope, ensure_multi_language, load_cached_parsed
 
@@ -121,6 +125,7 @@ class DebridService:
     ) -> tuple[set[str], dict[str, dict]]:
         started_at = time.perf_counter() if metrics.enabled else 0.0
         outcome = "success"
+        checked_hashes = set()
         try:
             availability = await retrieve_debrid_availability(
                 session,
@@ -134,6 +139,7 @@ class DebridService:
                 tracker_map,
                 sources_map,
                 target_air_date=target_air_date,
+                checked_hashes=checked_hashes,
             )
         except DebridAuthError:
             outcome = "auth_error"
@@ -151,9 +157,6 @@ class DebridService:
                     len(availability) if "availability" in locals() else 0,
                 )
 
-        if len(availability) == 0:
-            return set(), {}
-
         info_hash_set = set(info_hashes)
         cached_hashes = set()
         torrent_updates = {}
@@ -185,7 +188,13 @@ class DebridService:
                 if update:
                     torrent_updates.setdefault(info_hash, {}).update(update)
 
-        schedule_cache_availability(self.debrid_service, availability)
+        if availability:
+            schedule_cache_availability(self.debrid_service, availability)
+        uncached_hashes = (checked_hashes & info_hash_set) - cached_hashes
+        if uncached_hashes and settings.DEBRID_NEGATIVE_CACHE_TTL > 0:
+            schedule_cache_unavailability(
+                self.debrid_service, uncached_hashes, media_scope, season, episode
+            )
         return cached_hashes, torrent_updates
 
     async def check_existing_availability(
@@ -195,18 +204,34 @@ class DebridService:
         episode: int | None,
         media_scope: MediaScope,
         torrents: dict | None,
-    ) -> tuple[set[str], dict[str, dict]]:
+    ) -> tuple[set[str], set[str], dict[str, dict]]:
+        """
+        Return `(cached_hashes, uncached_hashes, torrent_updates)` from the
+        availability cache.
+
+        `uncached_hashes` are hashes the service recently reported as not
+        cached for this scope, so callers can skip re-checking them upstream.
+        """
         if len(info_hashes) == 0:
-            return set(), {}
+            return set(), set(), {}
 
         started_at = time.perf_counter() if metrics.enabled else 0.0
         try:
-            rows = await get_cached_availability(
-                self.debrid_service,
-                info_hashes,
-                media_scope,
-                season,
-                episode,
+            rows, uncached_hashes = await asyncio.gather(
+                get_cached_availability(
+                    self.debrid_service,
+                    info_hashes,
+                    media_scope,
+                    season,
+                    episode,
+                ),
+                get_known_uncached(
+                    self.debrid_service,
+                    info_hashes,
+                    media_scope,
+                    season,
+                    episode,
+                ),
             )
         except Exception:
             if metrics.enabled:
@@ -219,13 +244,21 @@ class DebridService:
                 )
             raise
         if metrics.enabled:
+            duration = time.perf_counter() - started_at
             metrics.observe_debrid(
                 self.debrid_service,
                 "cache_lookup",
                 "hit" if rows else "miss",
-                time.perf_counter() - started_at,
+                duration,
                 len(rows),
             )
+            metrics.observe_debrid(
+                self.debrid_service,
+                "negative_cache_lookup",
+                "hit" if uncached_hashes else "miss",
+                duration,
+                len(uncached_hashes),
+            )
 
         cached_hashes = set()
         torrent_updates = {}
@@ -247,7 +280,7 @@ class DebridService:
                 if update:
                     torrent_updates[info_hash] = update
 
-        return cached_hashes, torrent_updates
+        return cached_hashes, uncached_hashes - cached_hashes, torrent_updates
 
     @classmethod
     async def apply_cached_availability_any_service(
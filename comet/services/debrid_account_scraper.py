@@ -2,6 +2,8 @@ import asyncio
 import time
 from datetime import datetime
 
+from RTN import parse
+
 from comet.core.database import (
     _debrid_account_snapshot_ttl,
     build_json_list_membership_predicate,
@@ -13,10 +15,10 @@ from comet.core.logger import logger
 from comet.core.models import settings
 from comet.debrid.manager import build_account_key_hash
 from comet.debrid.stremthru import StremThru
-from comet.services.filtering import filter_worker
+from comet.services.filtering import TitleMatcher, filter_worker, scrub
 from comet.services.lock import DistributedLock
 from comet.services.torrent_manager import torrent_update_queue
-from comet.utils.parsing import MediaScope
+from comet.utils.parsing import MediaScope, default_dump, load_cached_parsed
 
 _SYNC_LOCK_PREFIX = "debrid-account-sync"
 _CACHED_STATUSES = frozenset({"cached", "downloaded"})
@@ -24,6 +26,12 @@ _background_tasks: dict[asyncio.Task, DistributedLock] = {}
 TORRENT_INFO_HASH_MEMBERSHIP_SQL = build_json_list_membership_predicate(
     "info_hash", "info_hashes"
 )
+PARSED_TITLE_MEMBERSHIP_SQL = build_json_list_membership_predicate(
+    "parsed_title", "parsed_titles"
+)
+MAGNET_ID_MEMBERSHIP_SQL = build_json_list_membership_predicate(
+    "magnet_id", "magnet_ids"
+)
 _UPSERT_ACCOUNT_MAGNET_QUERY = """
     INSERT INTO debrid_account_magnets (
         debrid_service,
@@ -34,7 +42,10 @@ _UPSERT_ACCOUNT_MAGNET_QUERY = """
         size,
         status,
         added_at,
-        synced_at
+        synced_at,
+        parsed_title,
+        parsed_year,
+        parsed_json
     ) VALUES (
         :debrid_service,
         :account_key_hash,
@@ -44,7 +55,10 @@ _UPSERT_ACCOUNT_MAGNET_QUERY = """
         :size,
         :status,
         :added_at,
-        :synced_at
+        :synced_at,
+        :parsed_title,
+        :parsed_year,
+        :parsed_json
     )
     ON CONFLICT (debrid_service, account_key_hash, magnet_id)
     DO UPDATE SET
@@ -53,20 +67,53 @@ _UPSERT_ACCOUNT_MAGNET_QUERY = """
         size = EXCLUDED.size,
         status = EXCLUDED.status,
         added_at = EXCLUDED.added_at,
-        synced_at = EXCLUDED.synced_at
+        synced_at = EXCLUDED.synced_at,
+        parsed_title = EXCLUDED.parsed_title,
+        parsed_year = EXCLUDED.parsed_year,
+        parsed_json = EXCLUDED.parsed_json
 """
 _UPSERT_ACCOUNT_SYNC_STATE_QUERY = """
     INSERT INTO debrid_account_sync_state (
         debrid_service,
         account_key_hash,
-        last_sync_at
+        last_sync_at,
+        last_full_sync_at
     ) VALUES (
         :debrid_service,
         :account_key_hash,
-        :last_sync_at
+        :last_sync_at,
+        :last_full_sync_at
     )
     ON CONFLICT (debrid_service, account_key_hash)
-    DO UPDATE SET last_sync_at = EXCLUDED.last_sync_at
+    DO UPDATE SET
+        last_sync_at = EXCLUDED.last_sync_at,
+        last_full_sync_at = COALESCE(
+            EXCLUDED.last_full_sync_at,
+            debrid_account_sync_state.last_full_sync_at
+        )
+"""
+_SYNC_WATERMARK_QUERY = """
+    SELECT
+        (
+            SELECT last_full_sync_at
+            FROM debrid_account_sync_state
+            WHERE debrid_service = :debrid_service
+              AND account_key_hash = :account_key_hash
+        ) AS last_full_sync_at,
+        (
+            SELECT MAX(added_at)
+            FROM debrid_account_magnets
+            WHERE debrid_service = :debrid_service
+              AND account_key_hash = :account_key_hash
+        ) AS newest_added_at,
+        (
+            SELECT MIN(added_at)
+            FROM debrid_account_magnets
+            WHERE debrid_service = :debrid_service
+              AND account_key_hash = :account_key_hash
+              AND status NOT IN ('cached', 'downloaded', 'failed', 'invalid')
+              AND added_at >= :pending_since
+        ) AS oldest_pending_added_at
 """
 
 
@@ -90,15 +137,86 @@ def _sync_lock_key(service: str, account_key_hash: str) -> str:
     return f"{_SYNC_LOCK_PREFIX}:{service}:{account_key_hash}"
 
 
-def _to_epoch(value) -> float:
+def _parse_added_at(value) -> float | None:
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str) and value:
         try:
             return datetime.fromisoformat(value).timestamp()
         except ValueError:
-            return time.time()
-    return time.time()
+            return None
+    return None
+
+
+def _to_epoch(value) -> float:
+    added_at = _parse_added_at(value)
+    return time.time() if added_at is None else added_at
+
+
+def _index_library_title(name: str) -> dict:
+    # An empty parsed title marks rows that can never match, as opposed to
+    # NULL for rows synced before titles were indexed.
+    unmatched = {"parsed_title": "", "parsed_year": None, "parsed_json": None}
+    if not name or "sample" in name.lower():
+        return unmatched
+    try:
+        parsed = parse(name)
+    except Exception:
+        return unmatched
+    if not parsed.parsed_title:
+        return unmatched
+    return {
+        "parsed_title": scrub(parsed.parsed_title),
+        "parsed_year": parsed.year,
+        "parsed_json": encode_json_param(parsed, default=default_dump),
+    }
+
+
+def _build_snapshot_rows(
+    service: str, account_key_hash: str, synced_at: float, magnets: list[dict]
+) -> list[dict]:
+    rows = []
+    for item in magnets:
+        info_hash = item["hash"].lower()
+        if not info_hash:
+            continue
+
+        rows.append(
+            {
+                "debrid_service": service,
+                "account_key_hash": account_key_hash,
+                "magnet_id": str(item["id"]),
+                "info_hash": info_hash,
+                "name": item["name"],
+                "size": item["size"],
+                "status": item["status"],
+                "added_at": _to_epoch(item.get("added_at")),
+                "synced_at": synced_at,
+                **_index_library_title(item["name"]),
+            }
+        )
+    return rows
+
+
+def _match_indexed_titles(
+    title_rows: list[dict],
+    title: str,
+    year: int | None,
+    year_end: int | None,
+    media_type: str,
+    aliases: dict,
+) -> list[str]:
+    matcher = TitleMatcher(title, year, year_end, media_type, aliases)
+    matched = set()
+    for row in title_rows:
+        parsed_title = row["parsed_title"]
+        if not parsed_title or parsed_title in matched:
+            continue
+        if matcher.matches(
+            row["multi_title_name"] or parsed_title, parsed_title, row["parsed_year"]
+        ):
+            matched.add(parsed_title)
+    return list(matched)
 
 
 def _should_force_requested_episode_scope(
@@ -129,7 +247,17 @@ def _resolve_cache_scope(
     )
 
 
-async def _fetch_all_magnets(client: StremThru, max_items: int):
+def _reached_watermark(items: list[dict], watermark: float) -> bool:
+    for item in items:
+        added_at = _parse_added_at(item.get("added_at"))
+        if added_at is not None and added_at < watermark:
+            return True
+    return False
+
+
+async def _fetch_all_magnets(
+    client: StremThru, max_items: int, watermark: float | None = None
+):
     limit = 500
     items_by_id = {}
     offset = 0
@@ -150,6 +278,10 @@ async def _fetch_all_magnets(client: StremThru, max_items: int):
         if len(items) < page_limit:
             break
 
+        # Magnets are listed newest first, so older pages are already stored.
+        if watermark is not None and _reached_watermark(items, watermark):
+            break
+
         offset += page_limit
         if total_items and offset >= total_items:
             break
@@ -164,17 +296,91 @@ async def _upsert_snapshot_rows(rows: list[dict]):
     await database.execute_many(_UPSERT_ACCOUNT_MAGNET_QUERY, rows)
 
 
-async def _set_last_sync(service: str, account_key_hash: str, last_sync: float):
+async def _set_last_sync(
+    service: str,
+    account_key_hash: str,
+    last_sync: float,
+    *,
+    full_sync: bool = True,
+):
     await database.execute(
         _UPSERT_ACCOUNT_SYNC_STATE_QUERY,
         {
             "debrid_service": service,
             "account_key_hash": account_key_hash,
             "last_sync_at": last_sync,
+            "last_full_sync_at": last_sync if full_sync else None,
         },
     )
 
 
+async def _get_sync_watermark(
+    service: str, account_key_hash: str, now: float
+) -> float | None:
+    full_sync_interval = min(
+        settings.DEBRID_ACCOUNT_SCRAPE_FULL_SYNC_INTERVAL,
+        # Rows untouched by incremental syncs must be refreshed before expiry.
+        _debrid_account_snapshot_ttl() / 2,
+    )
+    row = await database.fetch_one(
+        _SYNC_WATERMARK_QUERY,
+        {
+            "debrid_service": service,
+            "account_key_hash": account_key_hash,
+            # Older pending magnets are left to the next full sync so one that
+            # never settles cannot turn every delta sync into a full walk.
+            "pending_since": now - full_sync_interval,
+        },
+        force_primary=True,
+    )
+    if (
+        row is None
+        or row["last_full_sync_at"] is None
+        or row["newest_added_at"] is None
+        or now - row["last_full_sync_at"] >= full_sync_interval
+    ):
+        return None
+
+    # Magnets that were not cached yet are re-fetched until they settle;
+    # failed and invalid magnets count as settled.
+    if row["oldest_pending_added_at"] is not None:
+        return min(row["newest_added_at"], row["oldest_pending_added_at"])
+    return row["newest_added_at"]
+
+
+async def _filter_changed_magnets(
+    service: str, account_key_hash: str, magnets: list[dict]
+) -> list[dict]:
+    if not magnets:
+        return []
+
+    rows = await database.fetch_all(
+        f"""
+        SELECT magnet_id, info_hash, name, size, status
+        FROM debrid_account_magnets
+        WHERE debrid_service = :debrid_service
+          AND account_key_hash = :account_key_hash
+          AND {MAGNET_ID_MEMBERSHIP_SQL}
+        """,
+        {
+            "debrid_service": service,
+            "account_key_hash": account_key_hash,
+            "magnet_ids": encode_json_param([str(item["id"]) for item in magnets]),
+        },
+        force_primary=True,
+    )
+    stored = {
+        row["magnet_id"]: (row["info_hash"], row["name"], row["size"], row["status"])
+        for row in rows
+    }
+    return [
+        item
+        for item in magnets
+        if stored.get(str(item["id"]))
+        != (item["hash"].lower(), item["name"], item["size"], item["status"])
+    ]
+
+
 async def _replace_account_snapshot(
     service: str,
     account_key_hash: str,
@@ -199,6 +405,17 @@ async def _replace_account_snapshot(
         await _set_last_sync(service, account_key_hash, synced_at)
 
 
+async def _apply_account_delta(
+    service: str,
+    account_key_hash: str,
+    synced_at: float,
+    rows: list[dict],
+) -> None:
+    async with database.transaction():
+        await _upsert_snapshot_rows(rows)
+        await _set_last_sync(service, account_key_hash, synced_at, full_sync=False)
+
+
 async def _sync_single_account(
     session,
     service: str,
@@ -208,38 +425,39 @@ async def _sync_single_account(
 ):
     client = StremThru(session, "", "", f"{service}:{api_key}", ip)
     synced_at = time.time()
+    watermark = await _get_sync_watermark(service, account_key_hash, synced_at)
 
     magnets = await _fetch_all_magnets(
-        client, settings.DEBRID_ACCOUNT_SCRAPE_MAX_SNAPSHOT_ITEMS
+        client, settings.DEBRID_ACCOUNT_SCRAPE_MAX_SNAPSHOT_ITEMS, watermark
     )
     if magnets is None:
         return
 
-    rows = []
-    for item in magnets:
-        info_hash = item["hash"].lower()
-        if not info_hash:
-            continue
+    if watermark is not None:
+        magnets = await _filter_changed_magnets(service, account_key_hash, magnets)
 
-        rows.append(
-            {
-                "debrid_service": service,
-                "account_key_hash": account_key_hash,
-                "magnet_id": str(item["id"]),
-                "info_hash": info_hash,
-                "name": item["name"],
-                "size": item["size"],
-                "status": item["status"],
-                "added_at": _to_epoch(item.get("added_at")),
-                "synced_at": synced_at,
-            }
-        )
+    loop = asyncio.get_running_loop()
+    rows = await loop.run_in_executor(
+        get_executor(),
+        _build_snapshot_rows,
+        service,
+        account_key_hash,
+        synced_at,
+        magnets,
+    )
 
-    await _replace_account_snapshot(service, account_key_hash, synced_at, rows)
+    if watermark is None:
+        await _replace_account_snapshot(service, account_key_hash, synced_at, rows)
+        logger.log(
+            "SCRAPER",
+            f"{service}: Synced {len(rows)} account torrents",
+        )
+        return
 
+    await _apply_account_delta(service, account_key_hash, synced_at, rows)
     logger.log(
         "SCRAPER",
-        f"{service}: Synced {len(rows)} account torrents",
+        f"{service}: Synced {len(rows)} new or changed account torrents",
     )
 
 
@@ -596,22 +814,59 @@ async def get_account_torrents_for_media(
 
     min_timestamp = time.time() - _debrid_account_snapshot_ttl()
     aliases = aliases or {}
+    loop = asyncio.get_running_loop()
 
     async def fetch_rows(service: str, account_key_hash: str):
-        rows = await database.fetch_all(
+        scope = {
+            "debrid_service": service,
+            "account_key_hash": account_key_hash,
+            "min_timestamp": min_timestamp,
+        }
+        # Titles are matched once per distinct parsed title, then only the
+        # matching rows (plus rows synced before titles were indexed) are read.
+        title_rows = await database.fetch_all(
             """
-            SELECT info_hash, name, size, status
+            SELECT DISTINCT
+                parsed_title,
+                parsed_year,
+                CASE WHEN name LIKE :multi_title_pattern THEN name END
+                    AS multi_title_name
             FROM debrid_account_magnets
             WHERE debrid_service = :debrid_service
               AND account_key_hash = :account_key_hash
               AND synced_at >= :min_timestamp
+            """,
+            {**scope, "multi_title_pattern": "%/%"},
+            force_primary=True,
+        )
+        has_unindexed_rows = any(row["parsed_title"] is None for row in title_rows)
+        matched_titles = await loop.run_in_executor(
+            get_executor(),
+            _match_indexed_titles,
+            [dict(row) for row in title_rows if row["parsed_title"]],
+            title,
+            year,
+            year_end,
+            media_type,
+            aliases,
+        )
+        if not matched_titles and not has_unindexed_rows:
+            return service, []
+
+        rows = await database.fetch_all(
+            f"""
+            SELECT info_hash, name, size, status, parsed_json
+            FROM debrid_account_magnets
+            WHERE debrid_service = :debrid_service
+              AND account_key_hash = :account_key_hash
+              AND synced_at >= :min_timestamp
+              AND (parsed_title IS NULL OR {PARSED_TITLE_MEMBERSHIP_SQL})
             ORDER BY added_at DESC
             LIMIT :limit
             """,
             {
-                "debrid_service": service,
-                "account_key_hash": account_key_hash,
-                "min_timestamp": min_timestamp,
+                **scope,
+                "parsed_titles": encode_json_param(matched_titles),
                 "limit": settings.DEBRID_ACCOUNT_SCRAPE_MAX_MATCH_ITEMS,
             },
             force_primary=True,
@@ -655,13 +910,13 @@ async def get_account_torrents_for_media(
                     "size": row["size"],
                     "tracker": f"DebridAccount|{service}",
                     "sources": [],
+                    "parsed": load_cached_parsed(row["parsed_json"]),
                 }
             )
 
         if not candidate_torrents:
             continue
 
-        loop = asyncio.get_running_loop()
         filtered_torrents = await loop.run_in_executor(
             get_executor(),
             filter_worker,
@@ -57,6 +57,22 @@ def schedule_cache_availability(debrid_service: str, availability: list):
     return task
 
 
+def schedule_cache_unavailability(
+    debrid_service: str,
+    info_hashes: set[str],
+    media_scope: MediaScope,
+    season: int | None,
+    episode: int | None,
+):
+    task = asyncio.create_task(
+        cache_unavailability(debrid_service, info_hashes, media_scope, season, episode),
+        name=f"debrid-negative-cache:{debrid_service}",
+    )
+    _cache_write_tasks.add(task)
+    task.add_done_callback(_handle_cache_write_done)
+    return task
+
+
 async def shutdown_cache_writes() -> None:
     if not _cache_write_tasks:
         return
@@ -105,6 +121,36 @@ CACHE_AVAILABILITY_QUERY = f"""
     {CONDITIONAL_UPDATE_SQL}
 """
 
+NEGATIVE_AVAILABILITY_QUERY = """
+    INSERT INTO debrid_negative_availability (
+        debrid_service,
+        info_hash,
+        media_scope,
+        season_norm,
+        episode_norm,
+        expires_at
+    )
+    VALUES (
+        :debrid_service,
+        :info_hash,
+        :media_scope,
+        :season_norm,
+        :episode_norm,
+        :expires_at
+    )
+    ON CONFLICT (debrid_service, info_hash, media_scope, season_norm, episode_norm)
+    DO UPDATE SET expires_at = EXCLUDED.expires_at
+"""
+KNOWN_UNCACHED_QUERY = f"""
+    SELECT info_hash
+    FROM debrid_negative_availability
+    WHERE {INFO_HASH_MEMBERSHIP_SQL}
+    AND debrid_service = :debrid_service
+    AND media_scope = :media_scope
+    AND {EXACT_SCOPE_FILTER_SQL}
+    AND expires_at > :current_time
+"""
+
 
 def _build_scope_lookup(
     media_scope: MediaScope,
@@ -155,6 +201,57 @@ async def cache_availability(debrid_service: str, availability: list):
         )
 
 
+async def cache_unavailability(
+    debrid_service: str,
+    info_hashes: set[str],
+    media_scope: MediaScope,
+    season: int | None,
+    episode: int | None,
+):
+    ttl = settings.DEBRID_NEGATIVE_CACHE_TTL
+    if ttl <= 0 or not info_hashes:
+        return
+
+    scope = build_scope_lookup_params(season, episode)
+    expires_at = time.time() + ttl
+    await database.execute_many(
+        NEGATIVE_AVAILABILITY_QUERY,
+        [
+            {
+                "debrid_service": debrid_service,
+                "info_hash": info_hash,
+                "media_scope": media_scope.value,
+                **scope,
+                "expires_at": expires_at,
+            }
+            for info_hash in sorted(info_hashes)
+        ],
+    )
+
+
+async def get_known_uncached(
+    debrid_service: str,
+    info_hashes: list[str],
+    media_scope: MediaScope,
+    season: int | None = None,
+    episode: int | None = None,
+) -> set[str]:
+    if settings.DEBRID_NEGATIVE_CACHE_TTL <= 0 or not info_hashes:
+        return set()
+
+    rows = await database.fetch_all(
+        KNOWN_UNCACHED_QUERY,
+        {
+            "info_hashes": encode_json_param(info_hashes),
+            "debrid_service": debrid_service,
+            "media_scope": media_scope.value,
+            "current_time": time.time(),
+            **build_scope_lookup_params(season, episode),
+        },
+    )
+    return {row["info_hash"] for row in rows}
+
+
 async def get_cached_availability(
     debrid_service: str,
     info_hashes: list[str],
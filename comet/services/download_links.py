@@ -0,0 +1,260 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from comet.core.database import (
+    DOWNLOAD_LINK_CACHE_TTL,
+    build_scope_lookup_params,
+    build_scope_params,
+    database,
+)
+from comet.core.logger import logger
+from comet.core.models import settings
+from comet.debrid.manager import build_account_key_hash, get_debrid
+from comet.observability import metrics
+from comet.utils.http_client import http_client_manager
+
+DOWNLOAD_LINK_LOOKUP_QUERY = """
+    SELECT download_url
+    FROM download_links_cache
+    WHERE debrid_service = :debrid_service
+    AND account_key_hash = :account_key_hash
+    AND info_hash = :info_hash
+    AND season_norm = :season_norm
+    AND episode_norm = :episode_norm
+    AND updated_at >= :min_timestamp
+"""
+DOWNLOAD_LINK_UPSERT_QUERY = """
+    INSERT INTO download_links_cache (
+        debrid_service,
+        account_key_hash,
+        info_hash,
+        season,
+        episode,
+        season_norm,
+        episode_norm,
+        download_url,
+        updated_at
+    )
+    VALUES (
+        :debrid_service,
+        :account_key_hash,
+        :info_hash,
+        :season,
+        :episode,
+        :season_norm,
+        :episode_norm,
+        :download_url,
+        :updated_at
+    )
+    ON CONFLICT (
+        debrid_service,
+        account_key_hash,
+        info_hash,
+        season_norm,
+        episode_norm
+    ) DO UPDATE SET
+        download_url = EXCLUDED.download_url,
+        updated_at = EXCLUDED.updated_at
+"""
+
+
+async def get_cached_download_link(
+    *,
+    debrid_service: str,
+    account_key_hash: str,
+    info_hash: str,
+    season: int | None,
+    episode: int | None,
+) -> str | None:
+    row = await database.fetch_one(
+        DOWNLOAD_LINK_LOOKUP_QUERY,
+        {
+            "debrid_service": debrid_service,
+            "account_key_hash": account_key_hash,
+            "info_hash": info_hash,
+            "min_timestamp": time.time() - DOWNLOAD_LINK_CACHE_TTL,
+            **build_scope_lookup_params(season, episode),
+        },
+    )
+    return row["download_url"] if row else None
+
+
+async def cache_download_link(
+    *,
+    debrid_service: str,
+    account_key_hash: str,
+    info_hash: str,
+    season: int | None,
+    episode: int | None,
+    download_url: str,
+):
+    await database.execute(
+        DOWNLOAD_LINK_UPSERT_QUERY,
+        {
+            "debrid_service": debrid_service,
+            "account_key_hash": account_key_hash,
+            "info_hash": info_hash,
+            "download_url": download_url,
+            "updated_at": time.time(),
+            **build_scope_params(season, episode),
+        },
+    )
+
+
+@dataclass(slots=True)
+class LinkPrefetchCandidate:
+    debrid_service: str
+    debrid_api_key: str
+    info_hash: str
+    index: str
+    torrent_name: str
+    sources: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class LinkPrefetchContext:
+    media_id: str
+    media_only_id: str
+    title: str
+    season: int | None
+    episode: int | None
+    aliases: dict
+    ip: str
+
+
+class DownloadLinkPrefetcher:
+    """
+    Speculatively resolves download links for the top cached streams.
+
+    Links are written to `download_links_cache` so the first playback of a
+    stream is already a cache hit. Link generation is charged against a
+    per-account rate limit, and the number of prefetches in flight is capped
+    by a process-wide budget.
+    """
+
+    def __init__(self):
+        self._account_windows: dict[tuple[str, str], deque[float]] = {}
+        self._inflight: set[tuple] = set()
+
+    def schedule(
+        self,
+        add_background_task,
+        candidates: list[LinkPrefetchCandidate],
+        context: LinkPrefetchContext,
+    ) -> int:
+        if not settings.DEBRID_LINK_PREFETCH_ENABLED or not candidates:
+            return 0
+
+        selected = []
+        for candidate in candidates[: settings.DEBRID_LINK_PREFETCH_TOP_N]:
+            key = (
+                candidate.debrid_service,
+                build_account_key_hash(candidate.debrid_api_key),
+                candidate.info_hash,
+                context.season,
+                context.episode,
+            )
+            if key in self._inflight:
+                continue
+            if len(self._inflight) >= settings.DEBRID_LINK_PREFETCH_MAX_INFLIGHT:
+                metrics.observe_link_prefetch("over_budget")
+                break
+            self._inflight.add(key)
+            selected.append((key, candidate))
+
+        if selected:
+            add_background_task(self._prefetch_all, selected, context)
+        return len(selected)
+
+    async def _prefetch_all(self, selected: list, context: LinkPrefetchContext):
+        await asyncio.gather(
+            *(
+                self._prefetch_safely(key, candidate, context)
+                for key, candidate in selected
+            )
+        )
+
+    async def _prefetch_safely(
+        self, key: tuple, candidate: LinkPrefetchCandidate, context
+    ):
+        try:
+            result = await self._prefetch(key[1], candidate, context)
+        except Exception as exc:
+            result = "error"
+            logger.log(
+                "DEBRID",
+                f"Download link prefetch failed for {candidate.debrid_service}:"
+                f"{candidate.info_hash} ({type(exc).__name__})",
+            )
+        finally:
+            self._inflight.discard(key)
+        metrics.observe_link_prefetch(result)
+
+    async def _prefetch(
+        self,
+        account_key_hash: str,
+        candidate: LinkPrefetchCandidate,
+        context: LinkPrefetchContext,
+    ) -> str:
+        scope = {
+            "debrid_service": candidate.debrid_service,
+            "account_key_hash": account_key_hash,
+            "info_hash": candidate.info_hash,
+            "season": context.season,
+            "episode": context.episode,
+        }
+        if await get_cached_download_link(**scope):
+            return "cached"
+        if not self._consume_account_budget(
+            (candidate.debrid_service, account_key_hash)
+        ):
+            return "rate_limited"
+
+        session = await http_client_manager.get_session()
+        debrid = get_debrid(
+            session,
+            context.media_id,
+            context.media_only_id,
+            candidate.debrid_service,
+            candidate.debrid_api_key,
+            context.ip,
+        )
+        download_url = await debrid.generate_download_link(
+            candidate.info_hash,
+            candidate.index,
+            context.title,
+            candidate.torrent_name,
+            context.season,
+            context.episode,
+            candidate.sources,
+            context.aliases,
+        )
+        if not isinstance(download_url, str) or not download_url:
+            return "empty"
+
+        await cache_download_link(**scope, download_url=download_url)
+        return "prefetched"
+
+    def _consume_account_budget(self, account: tuple[str, str]) -> bool:
+        current_time = time.monotonic()
+        window_seconds = settings.DEBRID_LINK_PREFETCH_ACCOUNT_WINDOW
+        # Accounts without a recent prefetch are dropped, so the map only
+        # holds accounts that are still rate limited.
+        for key, window in list(self._account_windows.items()):
+            while window and current_time - window[0] >= window_seconds:
+                window.popleft()
+            if not window:
+                del self._account_windows[key]
+
+        if (
+            len(self._account_windows.get(account, ()))
+            >= settings.DEBRID_LINK_PREFETCH_ACCOUNT_LIMIT
+        ):
+            return False
+        self._account_windows.setdefault(account, deque()).append(current_time)
+        return True
+
+
+download_link_prefetcher = DownloadLinkPrefetcher()
@@ -340,12 +340,15 @@ def filter_worker(
             _log_exclusion(f"🚫 Rejected (Sample/Empty) | {torrent_title}")
             continue
 
-        # temp fix while waiting for RTN to fix their parsing
-        try:
-            parsed = _parse_with_cache(torrent_title)
-        except ValidationError:
-            _log_exclusion(f"❌ Rejected (Parse Error) | {torrent_title}")
-            continue
+        # Pre-parsed torrents (indexed account snapshots) skip re-parsing.
+        parsed = torrent.get("parsed")
+        if parsed is None:
+            # temp fix while waiting for RTN to fix their parsing
+            try:
+                parsed = _parse_with_cache(torrent_title)
+            except ValidationError:
+                _log_exclusion(f"❌ Rejected (Parse Error) | {torrent_title}")
+                continue
 
         if parsed.parsed_title and country_aliases:
             language = country_aliases.get(scrub(parsed.parsed_title))
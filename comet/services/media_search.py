@@ -1,4 +1,5 @@
 import asyncio
+import time
 from collections import defaultdict
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
@@ -195,12 +196,14 @@ async def check_multi_service_availability(
     async def check_service(entry):
         service = entry["service"]
         debrid_instance = DebridService(service, entry["apiKey"], "")
-        cached_hashes, torrent_updates = (
-            await debrid_instance.check_existing_availability(
-                info_hashes, season, episode, media_scope, torrents
-            )
+        (
+            cached_hashes,
+            uncached_hashes,
+            torrent_updates,
+        ) = await debrid_instance.check_existing_availability(
+            info_hashes, season, episode, media_scope, torrents
         )
-        return service, cached_hashes, torrent_updates
+        return service, cached_hashes, uncached_hashes, torrent_updates
 
     service_groups = group_debrid_entries_by_service(debrid_entries)
     results = await asyncio.gather(
@@ -213,7 +216,7 @@ async def check_multi_service_availability(
         if isinstance(result, Exception):
             logger.log("DEBRID", f"❌ Error checking availability: {result}")
             continue
-        service, cached_hashes, torrent_updates = result
+        service, cached_hashes, uncached_hashes, torrent_updates = result
         for info_hash, update in torrent_updates.items():
             if info_hash in enriched_hashes:
                 continue
@@ -223,6 +226,8 @@ async def check_multi_service_availability(
                 enriched_hashes.add(info_hash)
         for info_hash in cached_hashes:
             service_cache_status[info_hash][service] = True
+        for info_hash in uncached_hashes:
+            service_cache_status[info_hash][service] = False
 
     return service_cache_status
 
@@ -239,6 +244,7 @@ async def get_and_cache_multi_service_availability(
     ip: str,
     target_air_date: str | None = None,
     known_cache_status: dict | None = None,
+    verified_cache_status: dict | None = None,
 ):
     service_cache_status = defaultdict(dict)
     errors = {}
@@ -256,12 +262,16 @@ async def get_and_cache_multi_service_availability(
     }
     service_groups = group_debrid_entries_by_service(debrid_entries)
     known_cache_status = known_cache_status or {}
+    verified_cache_status = verified_cache_status or {}
 
     async def check_service(service, entries):
+        # Verified entries come from the availability cache, where `False`
+        # marks a recent negative result rather than an unready account torrent.
         service_info_hashes = [
             info_hash
             for info_hash in info_hashes
             if not known_cache_status.get(info_hash, {}).get(service, False)
+            and service not in verified_cache_status.get(info_hash, {})
         ]
         if not service_info_hashes:
             return service, set(), {}, None
@@ -332,6 +342,51 @@ async def get_and_cache_multi_service_availability(
     return service_cache_status, errors
 
 
+class _StageTimings:
+    """Wall time of the pre-scrape lookups of one search, by stage."""
+
+    def __init__(self):
+        self.durations: dict[str, float] = {}
+
+    async def run(self, stage: str, awaitable):
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            duration = time.perf_counter() - started
+            self.durations[stage] = duration
+            metrics.observe_stream_stage(stage, duration)
+
+    def report(self, log_title: str) -> None:
+        breakdown = ", ".join(
+            f"{stage}={duration * 1000:.1f}ms"
+            for stage, duration in self.durations.items()
+        )
+        logger.log("SCRAPER", f"⏱️ Pre-scrape lookups for {log_title}: {breakdown}")
+
+
+async def _resolve_cache_media_ids(
+    media_id: str, media_only_id: str, is_kitsu: bool
+) -> list[str]:
+    """Return the IDs whose cached torrents also answer this request."""
+    cache_media_ids = [media_only_id]
+    if not anime_mapper.is_loaded():
+        return cache_media_ids
+
+    if is_kitsu:
+        imdb_id = await anime_mapper.get_imdb_from_kitsu(media_only_id)
+        if imdb_id:
+            cache_media_ids.append(imdb_id)
+    elif anime_mapper.is_anime_content(media_id, media_only_id):
+        kitsu_ids = anime_mapper.get_kitsu_ids_from_imdb(media_only_id)
+        if kitsu_ids:
+            cache_media_ids.extend(kitsu_ids)
+        kitsu_id = await anime_mapper.get_kitsu_from_imdb(media_only_id)
+        if kitsu_id and kitsu_id not in cache_media_ids:
+            cache_media_ids.append(kitsu_id)
+    return cache_media_ids
+
+
 async def search_media(
     media_type: str,
     media_id: str,
@@ -380,8 +435,20 @@ async def search_media(
                 use_account_scrape=use_account_scrape,
             )
 
-    metadata, aliases = await metadata_scraper.fetch_metadata_and_aliases(
-        media_type, media_id, media_only_id, season, episode
+    is_kitsu = media_id.startswith("kitsu:")
+    timings = _StageTimings()
+    # Both only depend on the requested IDs, so their lookups run concurrently.
+    (metadata, aliases), cache_media_ids = await asyncio.gather(
+        timings.run(
+            "metadata",
+            metadata_scraper.fetch_metadata_and_aliases(
+                media_type, media_id, media_only_id, season, episode
+            ),
+        ),
+        timings.run(
+            "cache_ids",
+            _resolve_cache_media_ids(media_id, media_only_id, is_kitsu),
+        ),
     )
     if metadata is None:
         logger.log("SCRAPER", f"❌ Failed to fetch metadata for {media_id}")
@@ -406,7 +473,6 @@ async def search_media(
         log_title += f" S{season:02d}E{episode:02d}"
     logger.log("SCRAPER", f"🔍 Starting search for {log_title}")
 
-    is_kitsu = media_id.startswith("kitsu:")
     search_episode = episode
     search_season = season
 
@@ -439,20 +505,6 @@ async def search_media(
                         f"S{search_season:02d} instead of S{season:02d}",
                     )
 
-    cache_media_ids = [media_only_id]
-    if anime_mapper.is_loaded():
-        if is_kitsu:
-            imdb_id = await anime_mapper.get_imdb_from_kitsu(media_only_id)
-            if imdb_id:
-                cache_media_ids.append(imdb_id)
-        elif anime_mapper.is_anime_content(media_id, media_only_id):
-            kitsu_ids = anime_mapper.get_kitsu_ids_from_imdb(media_only_id)
-            if kitsu_ids:
-                cache_media_ids.extend(kitsu_ids)
-            kitsu_id = await anime_mapper.get_kitsu_from_imdb(media_only_id)
-            if kitsu_id and kitsu_id not in cache_media_ids:
-                cache_media_ids.append(kitsu_id)
-
     is_imdb_episode_request, reject_unknown_episode_files = episode_matching_policy(
         media_type,
         media_only_id,
@@ -462,26 +514,6 @@ async def search_media(
         has_debrid=bool(debrid_entries),
         enable_torrent=enable_torrent,
     )
-    target_air_date = None
-    if is_imdb_episode_request:
-        target_air_date = await EpisodeIndexService(session).get_target_air_date(
-            media_only_id,
-            search_season,
-            search_episode,
-        )
-        if target_air_date:
-            logger.log(
-                "SCRAPER",
-                f"📅 Episode target air date: {target_air_date} for "
-                f"{media_only_id} S{search_season:02d}E{search_episode:02d}",
-            )
-        else:
-            logger.log(
-                "SCRAPER",
-                f"📅 Episode target air date unavailable for {media_only_id} "
-                f"S{search_season:02d}E{search_episode:02d}",
-            )
-
     remove_adult_content = settings.REMOVE_ADULT_CONTENT and config["removeTrash"]
     torrent_manager = TorrentManager(
         media_type,
@@ -498,20 +530,56 @@ async def search_media(
         search_episode=search_episode,
         search_season=search_season,
         cache_media_ids=cache_media_ids,
-        target_air_date=target_air_date,
         reject_unknown_episode_files=reject_unknown_episode_files,
         media_scope=media_scope,
     )
+    cache_manager = CacheStateManager(media_id)
 
-    await torrent_manager.get_cached_torrents()
+    # The cached rows are only filtered once the air date is known, so the
+    # row fetch, the demand upsert and the episode index lookup run together.
+    lookups = [
+        timings.run("torrents", torrent_manager.fetch_cached_rows()),
+        timings.run("demand", cache_manager.register_demand()),
+    ]
+    if is_imdb_episode_request:
+        lookups.append(
+            timings.run(
+                "air_date",
+                EpisodeIndexService(session).get_target_air_date(
+                    media_only_id,
+                    search_season,
+                    search_episode,
+                ),
+            )
+        )
+    cache_row_groups, last_scraped_at, *air_date = await asyncio.gather(*lookups)
+    target_air_date = air_date[0] if air_date else None
+    if is_imdb_episode_request:
+        if target_air_date:
+            logger.log(
+                "SCRAPER",
+                f"📅 Episode target air date: {target_air_date} for "
+                f"{media_only_id} S{search_season:02d}E{search_episode:02d}",
+            )
+        else:
+            logger.log(
+                "SCRAPER",
+                f"📅 Episode target air date unavailable for {media_only_id} "
+                f"S{search_season:02d}E{search_episode:02d}",
+            )
+
+    torrent_manager.target_air_date = target_air_date
+    torrent_manager.load_cached_rows(cache_row_groups)
     torrent_count = len(torrent_manager.torrents)
     cache_state = "hit" if torrent_count else "miss"
     metrics.observe_torrent_cache(media_type, cache_state, torrent_count)
     initial_info_hashes = set(torrent_manager.torrents)
     logger.log("SCRAPER", f"📦 Found cached torrents: {torrent_count}")
 
-    cache_manager = CacheStateManager(media_id)
-    cache_result = await cache_manager.check_and_decide(torrent_count)
+    cache_result = await timings.run(
+        "decide", cache_manager.decide(torrent_count, last_scraped_at)
+    )
+    timings.report(log_title)
     force_scrape_now = not torrent_manager.primary_cached
     lock_acquired = cache_result.lock_acquired
     sort_mixed = is_torrent_only or config["sortCachedUncachedTogether"]
@@ -699,6 +767,7 @@ async def search_media(
                 ip,
                 target_air_date=target_air_date,
                 known_cache_status=service_cache_status,
+                verified_cache_status=verified_service_cache_status,
             )
         )
         merge_service_cache_status(
@@ -194,14 +194,24 @@ class TorrentManager:
         )
         return await database.fetch_all(query, params)
 
-    async def get_cached_torrents(self):
-        rows = []
-        cache_row_groups = await asyncio.gather(
+    async def fetch_cached_rows(self) -> list:
+        """Fetch the raw cache rows of every cache media ID concurrently.
+
+        Rows are filtered by `load_cached_rows`, which needs the final
+        `target_air_date`; the fetch itself does not.
+        """
+        return await asyncio.gather(
             *(
                 self._fetch_cached_rows(cache_media_id)
                 for cache_media_id in self.cache_media_ids
             )
         )
+
+    async def get_cached_torrents(self):
+        self.load_cached_rows(await self.fetch_cached_rows())
+
+    def load_cached_rows(self, cache_row_groups: list) -> None:
+        rows = []
         for cache_media_id, cache_rows in zip(self.cache_media_ids, cache_row_groups):
             if cache_rows and cache_media_id == self.media_only_id:
                 self.primary_cached = True
@@ -0,0 +1,73 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from comet.core.models import settings
+
+
+@dataclass(frozen=True, slots=True)
+class RecentFeed:
+    fragments: tuple[bytes, ...]
+    total: int
+    media_type: str | None
+    cache_state: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class _MaterializedFeed:
+    feed: RecentFeed
+    built_at: float
+
+
+class RecentFeedCache:
+    """
+    Materialized Torznab RSS feeds, one per category scope.
+
+    Feeds hold encoded `<item>` fragments, so a poll only adds the channel
+    header. A feed is reused for TORZNAB_RECENT_FEED_TTL seconds and is not
+    invalidated by torrent writes, which land on every scrape. Concurrent polls
+    of a stale scope share a single rebuild.
+    """
+
+    def __init__(self):
+        self._feeds: dict[str | None, _MaterializedFeed] = {}
+        self._locks: dict[str | None, asyncio.Lock] = {}
+
+    def _fresh(self, scope: str | None) -> RecentFeed | None:
+        materialized = self._feeds.get(scope)
+        if (
+            materialized is None
+            or time.monotonic() - materialized.built_at
+            >= settings.TORZNAB_RECENT_FEED_TTL
+        ):
+            return None
+        return materialized.feed
+
+    async def get(
+        self,
+        scope: str | None,
+        build: Callable[[], Awaitable[RecentFeed | None]],
+    ) -> RecentFeed | None:
+        """Return the feed for `scope`, rebuilding it when stale.
+
+        `build` may return None for a result that must not be materialized.
+        """
+        feed = self._fresh(scope)
+        if feed is not None:
+            return feed
+
+        lock = self._locks.setdefault(scope, asyncio.Lock())
+        async with lock:
+            feed = self._fresh(scope)
+            if feed is not None:
+                return feed
+
+            built_at = time.monotonic()
+            feed = await build()
+            if feed is not None and settings.TORZNAB_RECENT_FEED_TTL > 0:
+                self._feeds[scope] = _MaterializedFeed(feed, built_at)
+            return feed
+
+
+recent_feed_cache = RecentFeedCache()
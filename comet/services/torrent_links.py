@@ -0,0 +1,144 @@
+import asyncio
+import time
+
+import orjson
+import xxhash
+
+from comet.core.logger import logger
+from comet.core.models import database, settings
+from comet.observability.metrics import metrics
+from comet.services.torrent_manager import download_torrent, extract_torrent_metadata
+
+TORRENT_LINK_LOOKUP_QUERY = """
+    SELECT info_hash, metadata_json, magnet_url
+    FROM torrent_link_cache
+    WHERE link_key = :link_key
+      AND expires_at > :current_time
+"""
+TORRENT_LINK_UPSERT_QUERY = """
+    INSERT INTO torrent_link_cache (
+        link_key,
+        info_hash,
+        metadata_json,
+        magnet_url,
+        updated_at,
+        expires_at
+    )
+    VALUES (
+        :link_key,
+        :info_hash,
+        :metadata_json,
+        :magnet_url,
+        :updated_at,
+        :expires_at
+    )
+    ON CONFLICT (link_key) DO UPDATE SET
+        info_hash = EXCLUDED.info_hash,
+        metadata_json = EXCLUDED.metadata_json,
+        magnet_url = EXCLUDED.magnet_url,
+        updated_at = EXCLUDED.updated_at,
+        expires_at = EXCLUDED.expires_at
+"""
+
+_EMPTY_RESOLUTION = (None, None, None)
+
+
+def build_torrent_link_key(url: str) -> str:
+    # Indexer links embed API keys, so only a digest of the URL is persisted.
+    return xxhash.xxh3_128_hexdigest(url.encode("utf-8"))
+
+
+class TorrentLinkCache:
+    """
+    Persistent cache of indexer download links resolved to torrent metadata.
+
+    A link resolves to either the extracted metadata of its `.torrent` file or
+    the magnet it redirects to. Dead links are cached for a shorter TTL so
+    repeat scrapes skip them as well; a link only counts as dead on a client
+    error or a body that is not a torrent. Timeouts, throttling and server
+    errors are never cached.
+    """
+
+    async def resolve(self, session, url: str):
+        """Return `(metadata, magnet_hash, magnet_url)` for an indexer link."""
+        ttl = settings.TORRENT_LINK_CACHE_TTL
+        negative_ttl = settings.TORRENT_LINK_NEGATIVE_CACHE_TTL
+        if ttl <= 0 and negative_ttl <= 0:
+            resolution, _ = await self._download(session, url)
+            return resolution
+
+        link_key = build_torrent_link_key(url)
+        cached = await self._get(link_key)
+        if cached is not None:
+            metrics.observe_torrent_link_cache(
+                "hit" if cached != _EMPTY_RESOLUTION else "negative_hit"
+            )
+            return cached
+
+        metrics.observe_torrent_link_cache("miss")
+        resolution, definitive = await self._download(session, url)
+        if not definitive:
+            return resolution
+        entry_ttl = ttl if resolution != _EMPTY_RESOLUTION else negative_ttl
+        if entry_ttl > 0:
+            await self._set(link_key, resolution, entry_ttl)
+        return resolution
+
+    @staticmethod
+    async def _download(session, url: str):
+        """Return the resolution and whether it is definitive enough to cache."""
+        content, magnet_hash, magnet_url, status = await download_torrent(session, url)
+        if content:
+            metadata = await asyncio.to_thread(extract_torrent_metadata, content)
+            if metadata:
+                return (metadata, None, None), True
+            return _EMPTY_RESOLUTION, True
+        if magnet_hash:
+            return (None, magnet_hash, magnet_url), True
+        # Only a client error proves the link is dead; timeouts, resets,
+        # throttling and server errors may succeed on the next scrape.
+        dead = status is not None and 400 <= status < 500 and status != 429
+        return _EMPTY_RESOLUTION, dead
+
+    @staticmethod
+    async def _get(link_key: str):
+        try:
+            row = await database.fetch_one(
+                TORRENT_LINK_LOOKUP_QUERY,
+                {"link_key": link_key, "current_time": time.time()},
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read torrent link cache: {e}")
+            return None
+        if row is None:
+            return None
+
+        if row["metadata_json"] is not None:
+            return orjson.loads(row["metadata_json"]), None, None
+        if row["info_hash"] is not None:
+            return None, row["info_hash"], row["magnet_url"]
+        return _EMPTY_RESOLUTION
+
+    @staticmethod
+    async def _set(link_key: str, resolution, ttl: int):
+        metadata, magnet_hash, magnet_url = resolution
+        current_time = time.time()
+        try:
+            await database.execute(
+                TORRENT_LINK_UPSERT_QUERY,
+                {
+                    "link_key": link_key,
+                    "info_hash": metadata["info_hash"] if metadata else magnet_hash,
+                    "metadata_json": orjson.dumps(metadata).decode("utf-8")
+                    if metadata
+                    else None,
+                    "magnet_url": magnet_url,
+                    "updated_at": current_time,
+                    "expires_at": current_time + ttl,
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store torrent link cache entry: {e}")
+
+
+torrent_link_cache = TorrentLinkCache()
@@ -34,9 +34,22 @@ from comet.core.database import (
 )
 from comet.core.logger import logger
 from comet.core.models import database, settings
+from comet.observability import metrics
 from comet.utils.formatting import normalize_info_hash
 from comet.utils.parsing import default_dump, ensure_multi_language, is_video
 
+RESOLVED_MAGNET_LOOKUP_QUERY = """
+    SELECT metadata_json
+    FROM resolved_magnets
+    WHERE info_hash = :info_hash
+"""
+RESOLVED_MAGNET_UPSERT_QUERY = """
+    INSERT INTO resolved_magnets (info_hash, metadata_json, updated_at)
+    VALUES (:info_hash, :metadata_json, :updated_at)
+    ON CONFLICT (info_hash) DO UPDATE SET
+        metadata_json = EXCLUDED.metadata_json,
+        updated_at = EXCLUDED.updated_at
+"""
 TRACKER_PATTERN = re.compile(r"[&?]tr=([^&]+)")
 INFO_HASH_PATTERN = re.compile(r"btih:([a-fA-F0-9]{40}|[a-zA-Z0-9]{32})")
 TORRENT_DB_COLUMNS = (
@@ -342,24 +355,25 @@ def _construct_torrent_metadata(
 
 
 async def download_torrent(session, url: str):
+    """Return `(content, info_hash, magnet_url, status)`; status is None on failure."""
     try:
         async with session.get(
             url, allow_redirects=False, timeout=TORRENT_TIMEOUT
         ) as response:
             if response.status == 200:
-                return (await response.read(), None, None)
+                return (await response.read(), None, None, response.status)
 
             location = response.headers.get("Location", "")
             if location:
                 info_hash = _extract_info_hash_from_magnet(location)
                 if info_hash:
-                    return (None, info_hash, location)
-            return (None, None, None)
+                    return (None, info_hash, location, response.status)
+            return (None, None, None, response.status)
     except Exception as e:
         logger.debug(
             f"Failed to download torrent from {url}: {e} (in most cases, you can ignore this error)"
         )
-        return (None, None, None)
+        return (None, None, None, None)
 
 
 demagnetizer = Demagnetizer()
@@ -377,6 +391,33 @@ async def get_torrent_from_magnet(magnet_uri: str):
     return None
 
 
+async def load_resolved_magnet(info_hash: str) -> dict | None:
+    try:
+        row = await database.fetch_one(
+            RESOLVED_MAGNET_LOOKUP_QUERY, {"info_hash": info_hash}
+        )
+    except Exception as e:
+        logger.warning(f"Failed to read resolved magnet {info_hash}: {e}")
+        return None
+    if row is None:
+        return None
+    return orjson.loads(row["metadata_json"])
+
+
+async def store_resolved_magnet(info_hash: str, metadata: dict) -> None:
+    try:
+        await database.execute(
+            RESOLVED_MAGNET_UPSERT_QUERY,
+            {
+                "info_hash": info_hash,
+                "metadata_json": encode_json_param(metadata),
+                "updated_at": time.time(),
+            },
+        )
+    except Exception as e:
+        logger.warning(f"Failed to store resolved magnet {info_hash}: {e}")
+
+
 def _resolve_torrent_metadata(torrent) -> dict:
     info_hash = normalize_info_hash(torrent.infohash)
 
@@ -970,6 +1011,7 @@ class AddTorrentQueue:
             cached = self._resolved_torrent_cache.get(magnet_key)
             if cached is not None:
                 self._resolved_torrent_cache.move_to_end(magnet_key)
+                metrics.observe_magnet_resolution("memory_hit")
                 return cached
 
             future = self._inflight_resolutions.get(inflight_key)
@@ -985,10 +1027,19 @@ class AddTorrentQueue:
 
         resolved_torrent = {}
         try:
-            torrent = await get_torrent_from_magnet(magnet_url)
-            if torrent:
-                resolved_torrent = await asyncio.to_thread(
-                    _resolve_torrent_metadata, torrent
+            # Another worker or node may already have paid the DHT lookup.
+            resolved_torrent = await load_resolved_magnet(magnet_key) or {}
+            if resolved_torrent:
+                metrics.observe_magnet_resolution("store_hit")
+            else:
+                torrent = await get_torrent_from_magnet(magnet_url)
+                if torrent:
+                    resolved_torrent = await asyncio.to_thread(
+                        _resolve_torrent_metadata, torrent
+                    )
+                    await store_resolved_magnet(magnet_key, resolved_torrent)
+                metrics.observe_magnet_resolution(
+                    "resolved" if resolved_torrent else "failed"
                 )
         finally:
             async with self._lock:
@@ -15,9 +15,19 @@ def _fsync_directory(directory: Path) -> None:
 
 
 async def write_text_atomic(path: Path, content: str) -> None:
+    await _write_atomic(path, content, "w", "utf-8")
+
+
+async def write_bytes_atomic(path: Path, content: bytes) -> None:
+    await _write_atomic(path, content, "wb", None)
+
+
+async def _write_atomic(
+    path: Path, content: str | bytes, mode: str, encoding: str | None
+) -> None:
     temporary = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
     try:
-        async with aiofiles.open(temporary, "w", encoding="utf-8") as file:
+        async with aiofiles.open(temporary, mode, encoding=encoding) as file:
             await file.write(content)
             await file.flush()
             await asyncio.to_thread(os.fsync, file.fileno())
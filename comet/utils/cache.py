@@ -1,10 +1,11 @@
 import hashlib
 import re
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 import orjson
 from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
 
 from comet.core.models import settings
 
@@ -128,6 +129,30 @@ def _generate_etag(body: bytes):
     return f'W/"{hash_digest}"'
 
 
+def _generate_fragments_etag(fragments: Sequence[bytes]):
+    """ETag of the concatenated fragments, without concatenating them."""
+    digest = hashlib.md5(usedforsecurity=False)
+    for fragment in fragments:
+        digest.update(fragment)
+    return f'W/"{digest.hexdigest()[:16]}"'
+
+
+async def _iter_chunks(
+    fragments: Sequence[bytes], chunk_size: int
+) -> AsyncIterator[bytes]:
+    pending = []
+    pending_size = 0
+    for fragment in fragments:
+        pending.append(fragment)
+        pending_size += len(fragment)
+        if pending_size >= chunk_size:
+            yield b"".join(pending)
+            pending.clear()
+            pending_size = 0
+    if pending:
+        yield b"".join(pending)
+
+
 def check_etag_match(request: Request, etag: str):
     if_none_match = request.headers.get("If-None-Match")
     if not if_none_match:
@@ -243,6 +268,42 @@ def cached_response(
     return Response(content=body, media_type=media_type, headers=headers)
 
 
+def cached_chunked_response(
+    request: Request,
+    fragments: Sequence[bytes],
+    *,
+    media_type: str,
+    cache_policy: CacheControl | None = None,
+    vary: Sequence[str] | None = None,
+    chunk_size: int = 64 * 1024,
+) -> Response:
+    """Stream a body assembled from fragments in `chunk_size` chunks.
+
+    Behaves like `cached_response` for the concatenated body, but never
+    materializes it: the ETag is computed incrementally and the fragments are
+    joined only up to one chunk at a time.
+    """
+    headers = {"Content-Length": str(sum(map(len, fragments)))}
+    if settings.HTTP_CACHE_ENABLED:
+        etag = _generate_fragments_etag(fragments)
+        cache_control = (cache_policy or CachePolicies.empty_results()).build()
+        if check_etag_match(request, etag):
+            return Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": cache_control},
+            )
+        headers["Cache-Control"] = cache_control
+        headers["ETag"] = etag
+        if vary:
+            headers["Vary"] = ", ".join(vary)
+
+    return StreamingResponse(
+        _iter_chunks(fragments, chunk_size),
+        media_type=media_type,
+        headers=headers,
+    )
+
+
 def cached_json_response(
     request: Request,
     content: Any,
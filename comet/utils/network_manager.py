@@ -6,9 +6,16 @@ from urllib.parse import urlparse, urlunparse
 
 import aiohttp
 from curl_cffi.requests import AsyncSession as CurlSession
+from multidict import CIMultiDict
 
 from comet.core.logger import logger
 from comet.core.models import settings
+from comet.utils.response_cache import (
+    CachedResponse,
+    build_response_cache_key,
+    resolve_response_cache_ttl,
+    scraper_response_cache,
+)
 
 
 def resolve_proxy_url(proxy_url: str | None):
@@ -122,6 +129,48 @@ class _RequestContextManager:
         self.response = None
 
     async def __aenter__(self):
+        use_cache = self.kwargs.pop("use_cache", True)
+        # Callers that disable redirects read the redirect itself (e.g. a
+        # magnet in `Location`), which is never cacheable.
+        if (
+            use_cache
+            and self.wrapper.response_cache_ttl > 0
+            and self.method.upper() == "GET"
+            and self.kwargs.get("allow_redirects", True)
+        ):
+            return await self._cached_request()
+        return await self._send()
+
+    async def _cached_request(self):
+        cache_key = build_response_cache_key(
+            self.wrapper.scraper_name,
+            self.method,
+            self.url,
+            self.kwargs.get("params"),
+            self.kwargs.get("headers"),
+        )
+        entry = await scraper_response_cache.get_or_fetch(
+            cache_key,
+            self.wrapper.scraper_name,
+            self.wrapper.response_cache_ttl,
+            self._load_uncached,
+        )
+        return CachedResponse(entry)
+
+    async def _load_uncached(self):
+        async with _RequestContextManager(
+            self.wrapper, self.method, self.url, use_cache=False, **self.kwargs
+        ) as response:
+            body = await response.read()
+            return (
+                response.status,
+                body,
+                getattr(response, "charset", None),
+                response.headers.get("Content-Type"),
+                CIMultiDict(response.headers),
+            )
+
+    async def _send(self):
         # Determine strict proxy usage
         use_proxy_explicit = self.kwargs.pop("use_proxy", None)
         proxy_url = self.wrapper.proxy_url
@@ -227,6 +276,7 @@ class AsyncClientWrapper:
             settings.HTTP_CLIENT_TIMEOUT_TOTAL if timeout is None else timeout
         )
         self.headers = headers or {}
+        self.response_cache_ttl = resolve_response_cache_ttl(scraper_name)
 
         # Determine proxy configuration
         self.proxy_url = proxy_url
@@ -321,6 +371,7 @@ class NetworkManager:
             except Exception as e:
                 logger.warning(f"Failed to close network client {key}: {e}")
         self._clients.clear()
+        await scraper_response_cache.close()
 
 
 network_manager = NetworkManager()
@@ -0,0 +1,323 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import orjson
+import xxhash
+from multidict import CIMultiDict
+
+from comet.core.logger import logger
+from comet.core.models import database, settings
+from comet.core.scrape import normalize_scraper_name
+from comet.observability.metrics import metrics
+
+SHARED_CACHE_LOOKUP_QUERY = """
+    SELECT status, body, encoding, content_type, stored_at, fresh_until, expires_at
+    FROM scraper_response_cache
+    WHERE cache_key = :cache_key
+      AND expires_at > :current_time
+"""
+SHARED_CACHE_UPSERT_QUERY = """
+    INSERT INTO scraper_response_cache (
+        cache_key,
+        status,
+        body,
+        encoding,
+        content_type,
+        stored_at,
+        fresh_until,
+        expires_at
+    )
+    VALUES (
+        :cache_key,
+        :status,
+        :body,
+        :encoding,
+        :content_type,
+        :stored_at,
+        :fresh_until,
+        :expires_at
+    )
+    ON CONFLICT (cache_key) DO UPDATE SET
+        status = EXCLUDED.status,
+        body = EXCLUDED.body,
+        encoding = EXCLUDED.encoding,
+        content_type = EXCLUDED.content_type,
+        stored_at = EXCLUDED.stored_at,
+        fresh_until = EXCLUDED.fresh_until,
+        expires_at = EXCLUDED.expires_at
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponseEntry:
+    status: int
+    body: bytes
+    encoding: str | None
+    content_type: str | None
+    stored_at: float
+    fresh_until: float
+    expires_at: float
+    # Upstream headers, kept in memory only; shared entries have none.
+    headers: CIMultiDict | None = None
+
+    def is_fresh(self, current_time: float) -> bool:
+        return current_time < self.fresh_until
+
+    def is_usable(self, current_time: float) -> bool:
+        return current_time < self.expires_at
+
+
+class CachedResponse:
+    """Read-only response served from the scraper response cache."""
+
+    backend = "cache"
+
+    def __init__(self, entry: CachedResponseEntry):
+        self._entry = entry
+        self.headers = CIMultiDict(entry.headers or ())
+        if entry.content_type and "Content-Type" not in self.headers:
+            self.headers["Content-Type"] = entry.content_type
+
+    @property
+    def status(self):
+        return self._entry.status
+
+    @property
+    def status_code(self):
+        return self._entry.status
+
+    @property
+    def charset(self):
+        return self._entry.encoding
+
+    async def text(self):
+        return self._entry.body.decode(self._entry.encoding or "utf-8", "replace")
+
+    async def json(self):
+        return orjson.loads(self._entry.body)
+
+    async def read(self):
+        return self._entry.body
+
+
+def resolve_response_cache_ttl(scraper_name: str) -> int:
+    if not settings.SCRAPER_RESPONSE_CACHE_ENABLED:
+        return 0
+    return settings.SCRAPER_RESPONSE_CACHE_TTL_OVERRIDES.get(
+        normalize_scraper_name(scraper_name),
+        settings.SCRAPER_RESPONSE_CACHE_TTL,
+    )
+
+
+def _normalize_pairs(values) -> list[tuple[str, str]]:
+    if not values:
+        return []
+    items = values.items() if hasattr(values, "items") else values
+    return sorted((str(key), str(value)) for key, value in items)
+
+
+def build_response_cache_key(
+    scraper_name: str,
+    method: str,
+    url: str,
+    params=None,
+    headers=None,
+) -> str:
+    payload = orjson.dumps(
+        [
+            normalize_scraper_name(scraper_name),
+            method.upper(),
+            url,
+            _normalize_pairs(params),
+            _normalize_pairs(headers),
+        ]
+    )
+    return xxhash.xxh3_128_hexdigest(payload)
+
+
+def _shared_body(body: bytes) -> str | None:
+    try:
+        text = body.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    if "\x00" in text:
+        return None
+    return text
+
+
+class ScraperResponseCache:
+    """
+    Memory-bounded stale-while-revalidate cache for upstream scraper responses.
+
+    Concurrent misses for one key share a single upstream request, and a stale
+    entry triggers at most one background revalidation while it keeps serving.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict[str, CachedResponseEntry] = OrderedDict()
+        self._size_bytes = 0
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._background_tasks: set[asyncio.Task] = set()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get_or_fetch(self, key: str, scraper_name: str, ttl: int, loader):
+        current_time = time.time()
+        entry = self._get_local(key, current_time)
+        result = "hit"
+        if entry is None and settings.SCRAPER_RESPONSE_CACHE_SHARED:
+            entry = await self._get_shared(key, current_time)
+            if entry is not None:
+                self._store_local(key, entry)
+                result = "shared_hit"
+
+        if entry is None:
+            metrics.observe_scraper_response_cache(scraper_name, "miss")
+            return await self._fetch(key, ttl, loader)
+
+        if not entry.is_fresh(current_time):
+            result = "stale"
+            if key not in self._inflight:
+                self._track(self._start_fetch(key, ttl, loader))
+
+        metrics.observe_scraper_response_cache(scraper_name, result)
+        return entry
+
+    def _get_local(self, key: str, current_time: float):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.is_usable(current_time):
+            self._discard_local(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store_local(self, key: str, entry: CachedResponseEntry):
+        max_bytes = settings.SCRAPER_RESPONSE_CACHE_MAX_BYTES
+        if len(entry.body) > max_bytes:
+            return
+
+        self._discard_local(key)
+        self._entries[key] = entry
+        self._size_bytes += len(entry.body)
+        while self._size_bytes > max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size_bytes -= len(evicted.body)
+
+    def _discard_local(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= len(entry.body)
+
+    async def _fetch(self, key: str, ttl: int, loader):
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_fetch(key, ttl, loader)
+        return await asyncio.shield(task)
+
+    def _start_fetch(self, key: str, ttl: int, loader):
+        task = asyncio.create_task(self._load(key, ttl, loader))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish_fetch(key, done))
+        return task
+
+    def _finish_fetch(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Retrieved here so abandoned revalidations never log as unhandled.
+            task.exception()
+
+    async def _load(self, key: str, ttl: int, loader):
+        status, body, encoding, content_type, headers = await loader()
+        current_time = time.time()
+        fresh_until = current_time + ttl
+        entry = CachedResponseEntry(
+            status=status,
+            body=body,
+            encoding=encoding,
+            content_type=content_type,
+            stored_at=current_time,
+            fresh_until=fresh_until,
+            expires_at=fresh_until + settings.SCRAPER_RESPONSE_CACHE_STALE_TTL,
+            headers=headers,
+        )
+        if status == 200:
+            self._store_local(key, entry)
+            if settings.SCRAPER_RESPONSE_CACHE_SHARED:
+                self._track(asyncio.create_task(self._store_shared(key, entry)))
+        return entry
+
+    async def _get_shared(self, key: str, current_time: float):
+        try:
+            row = await database.fetch_one(
+                SHARED_CACHE_LOOKUP_QUERY,
+                {"cache_key": key, "current_time": current_time},
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read shared scraper response cache: {e}")
+            return None
+        if row is None:
+            return None
+
+        return CachedResponseEntry(
+            status=row["status"],
+            body=row["body"].encode("utf-8"),
+            encoding="utf-8",
+            content_type=row["content_type"],
+            stored_at=row["stored_at"],
+            fresh_until=row["fresh_until"],
+            expires_at=row["expires_at"],
+        )
+
+    async def _store_shared(self, key: str, entry: CachedResponseEntry):
+        body = _shared_body(entry.body)
+        if body is None:
+            return
+        await database.execute(
+            SHARED_CACHE_UPSERT_QUERY,
+            {
+                "cache_key": key,
+                "status": entry.status,
+                "body": body,
+                "encoding": "utf-8",
+                "content_type": entry.content_type,
+                "stored_at": entry.stored_at,
+                "fresh_until": entry.fresh_until,
+                "expires_at": entry.expires_at,
+            },
+        )
+
+    def _track(self, task: asyncio.Task):
+        self._background_tasks.add(task)
+        task.add_done_callback(self._handle_background_done)
+
+    def _handle_background_done(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning(f"Scraper response cache refresh failed: {error}")
+
+    async def close(self):
+        tasks = [*self._inflight.values(), *self._background_tasks]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._inflight.clear()
+        self._background_tasks.clear()
+        self._entries.clear()
+        self._size_bytes = 0
+
+
+scraper_response_cache = ScraperResponseCache()
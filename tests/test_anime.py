@@ -1,18 +1,42 @@
 import asyncio
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
-from comet.services.anime import AnimeMapper
+from databases import Database
+
+from comet.core.schema_specs import (
+    ANIME_ENTRIES_TABLE_SPEC,
+    ANIME_IDS_TABLE_SPEC,
+    ANIME_MAPPING_STATE_TABLE_SPEC,
+    ANIME_PROVIDER_OVERRIDES_TABLE_SPEC,
+)
+from comet.services import anime
+from comet.services.anime import AnimeMapper, settings
+
+
+def _entry_row(data_json, linked_provider=None, linked_id=None):
+    return {
+        "data_json": data_json,
+        "linked_provider": linked_provider,
+        "linked_id": linked_id,
+    }
 
 
 class AnimeMapperTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = patch.object(settings, "ANIME_MAPPING_SNAPSHOT_PATH", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     async def test_corrupt_cached_entry_degrades_to_no_aliases(self):
         mapper = AnimeMapper()
         mapper.loaded = True
 
         with patch(
-            "comet.services.anime.database.fetch_one",
-            return_value={"data_json": "not-json"},
+            "comet.services.anime.database.fetch_all",
+            return_value=[_entry_row("not-json")],
         ):
             aliases = await mapper.get_aliases("tt123")
 
@@ -24,8 +48,8 @@ class AnimeMapperTests(unittest.IsolatedAsyncioTestCase):
         payload = b'{"title":"Main","synonyms":["Alt",null,"Main",42,"Alt"]}'
 
         with patch(
-            "comet.services.anime.database.fetch_one",
-            return_value={"data_json": payload},
+            "comet.services.anime.database.fetch_all",
+            return_value=[_entry_row(payload)],
         ):
             aliases = await mapper.get_aliases("tt123")
 
@@ -34,15 +58,53 @@ class AnimeMapperTests(unittest.IsolatedAsyncioTestCase):
     async def test_media_type_uses_persisted_anime_type(self):
         mapper = AnimeMapper()
 
-        with patch.object(mapper, "_get_entry_data", return_value={"type": "Movie"}):
+        with patch(
+            "comet.services.anime.database.fetch_all",
+            side_effect=[
+                [_entry_row(b'{"type":"Movie"}')],
+                [_entry_row(b'{"type":"TV"}')],
+                [_entry_row(b'{"type":"UNKNOWN"}')],
+            ],
+        ):
             self.assertEqual(await mapper.get_media_type("kitsu:1"), "movie")
-
-        with patch.object(mapper, "_get_entry_data", return_value={"type": "TV"}):
             self.assertEqual(await mapper.get_media_type("kitsu:2"), "series")
-
-        with patch.object(mapper, "_get_entry_data", return_value={"type": "UNKNOWN"}):
             self.assertIsNone(await mapper.get_media_type("kitsu:3"))
 
+    async def test_decoded_entries_serve_repeated_lookups_until_reload(self):
+        mapper = AnimeMapper()
+        mapper.loaded = True
+        rows = [
+            _entry_row(b'{"title":"Main"}', "imdb", "tt1"),
+            _entry_row(b'{"title":"Main"}', "kitsu", "7"),
+            _entry_row(b'{"title":"Main"}', "anilist", "21"),
+        ]
+
+        with patch(
+            "comet.services.anime.database.fetch_all", return_value=rows
+        ) as fetch_all:
+            self.assertEqual(
+                await mapper.get_aliases("kitsu:7"), {"original": ["Main"]}
+            )
+            self.assertEqual(await mapper.get_imdb_from_kitsu(7), "tt1")
+            self.assertEqual(await mapper.get_anilist_id("kitsu:7"), "21")
+            self.assertEqual(fetch_all.await_count, 1)
+
+            mapper.anime_imdb_ids = set()
+            with (
+                patch.object(
+                    mapper, "_read_provider_ids", AsyncMock(return_value=set())
+                ),
+                patch.object(
+                    mapper,
+                    "_read_kitsu_mapping_caches",
+                    AsyncMock(return_value=({}, {})),
+                ),
+            ):
+                await mapper._load_mapping_caches()
+            await mapper.get_anilist_id("kitsu:7")
+
+        self.assertEqual(fetch_all.await_count, 2)
+
     def test_malformed_kitsu_identifier_is_rejected(self):
         self.assertEqual(AnimeMapper._parse_media_id("kitsu"), (None, None))
         self.assertEqual(AnimeMapper._parse_media_id("kitsu:"), (None, None))
@@ -159,3 +221,155 @@ class AnimeMapperTests(unittest.IsolatedAsyncioTestCase):
             await mapper._load_mapping_caches()
 
         self.assertEqual(mapper.anime_imdb_ids, {"tt-old"})
+
+
+class AnimeMappingSnapshotTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "anime_mapping.bin"
+        patcher = patch.object(settings, "ANIME_MAPPING_SNAPSHOT_PATH", str(self.path))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _mapper(self, revision=(100.0, 2)):
+        mapper = AnimeMapper()
+        mapper._read_mapping_revision = AsyncMock(return_value=revision)
+        mapper._read_provider_ids = AsyncMock(return_value={"tt2", "tt1"})
+        mapper._read_kitsu_mapping_caches = AsyncMock(
+            return_value=(
+                {
+                    "11": {"imdb_id": "tt1", "from_season": 2, "from_episode": None},
+                    "12": {"imdb_id": "tt1", "from_season": None, "from_episode": 13},
+                },
+                {"tt1": ["12", "11"]},
+            )
+        )
+        return mapper
+
+    async def test_workers_share_the_mapped_snapshot(self):
+        builder = self._mapper()
+        await builder._load_mapping_caches()
+        reader = self._mapper()
+        await reader._load_mapping_caches()
+        reader.loaded = True
+
+        reader._read_provider_ids.assert_not_awaited()
+        reader._read_kitsu_mapping_caches.assert_not_awaited()
+        self.assertIn("tt1", reader.anime_imdb_ids)
+        self.assertNotIn("tt3", reader.anime_imdb_ids)
+        self.assertEqual(len(reader._kitsu_mapping_cache), 2)
+        self.assertEqual(
+            reader.get_kitsu_episode_mapping("11"),
+            {"imdb_id": "tt1", "from_season": 2, "from_episode": None},
+        )
+        self.assertIsNone(reader._kitsu_mapping_cache.get("13"))
+        self.assertEqual(reader.get_kitsu_ids_from_imdb("tt1"), ["12", "11"])
+        self.assertEqual(reader.get_kitsu_ids_from_imdb("tt2"), [])
+
+    async def test_new_revision_swaps_the_snapshot(self):
+        await self._mapper()._load_mapping_caches()
+        mapper = self._mapper(revision=(200.0, 2))
+        mapper._read_provider_ids.return_value = {"tt9"}
+
+        await mapper._load_mapping_caches()
+
+        mapper._read_provider_ids.assert_awaited_once()
+        self.assertEqual(set(mapper.anime_imdb_ids), {"tt9"})
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+
+def _aod_entry(title: str, anilist_id: int) -> dict:
+    return {
+        "title": title,
+        "sources": [f"https://anilist.co/anime/{anilist_id}"],
+    }
+
+
+class AnimeMappingDiffRefreshTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.database = Database(
+            f"sqlite+aiosqlite:///{Path(self._tmp.name) / 'anime.db'}"
+        )
+        await self.database.connect()
+        self.addAsyncCleanup(self.database.disconnect)
+        for spec in (
+            ANIME_ENTRIES_TABLE_SPEC,
+            ANIME_IDS_TABLE_SPEC,
+            ANIME_MAPPING_STATE_TABLE_SPEC,
+            ANIME_PROVIDER_OVERRIDES_TABLE_SPEC,
+        ):
+            await self.database.execute(
+                spec.create_sql.format(table_name=spec.table_name)
+            )
+        patcher = patch.object(anime, "database", self.database)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _entry_ids(self):
+        rows = await self.database.fetch_all(
+            "SELECT provider_id, entry_id FROM anime_ids ORDER BY provider_id"
+        )
+        return {row["provider_id"]: row["entry_id"] for row in rows}
+
+    async def test_refresh_only_rewrites_changed_entries(self):
+        mapper = AnimeMapper()
+        fribb = [{"anilist_id": 1, "imdb_id": "tt1"}]
+        await mapper._persist_mapping(
+            [_aod_entry("One", 1), _aod_entry("Two", 2)], fribb
+        )
+        before = await self._entry_ids()
+
+        changed = await mapper._persist_mapping(
+            [_aod_entry("One", 1), _aod_entry("Three", 3)], fribb
+        )
+
+        after = await self._entry_ids()
+        self.assertEqual(changed, 4)
+        self.assertEqual(after["1"], before["1"])
+        self.assertEqual(after["tt1"], before["1"])
+        self.assertNotIn("2", after)
+        self.assertEqual(
+            await self.database.fetch_val("SELECT COUNT(*) FROM anime_entries"), 2
+        )
+        self.assertEqual(
+            await mapper._persist_mapping(
+                [_aod_entry("One", 1), _aod_entry("Three", 3)], fribb
+            ),
+            0,
+        )
+
+    async def test_unchanged_refresh_keeps_the_mapping_revision(self):
+        mapper = AnimeMapper()
+        anime_list = [_aod_entry("One", 1)]
+        overrides = [{"kitsu_id": 5, "imdb_id": "tt1", "fromSeason": 2}]
+        validators = {"https://source.test": {"etag": '"v1"'}}
+        await mapper._persist_remote_mapping(anime_list, [], overrides)
+        state = await mapper._read_mapping_state()
+
+        await mapper._persist_remote_mapping(
+            anime_list,
+            [],
+            overrides,
+            previous_refreshed_at=state["refreshed_at"],
+            source_validators=validators,
+        )
+
+        refreshed = await mapper._read_mapping_state()
+        self.assertEqual(refreshed["refreshed_at"], state["refreshed_at"])
+        self.assertEqual(refreshed["sources"], validators)
+        self.assertGreaterEqual(
+            await self.database.fetch_val(
+                "SELECT checked_at FROM anime_mapping_state WHERE id = 1"
+            ),
+            state["refreshed_at"],
+        )
+        self.assertEqual(await mapper._persist_provider_overrides(overrides), 0)
+        self.assertEqual(
+            await mapper._persist_provider_overrides(
+                [{"kitsu_id": 5, "imdb_id": "tt1", "fromSeason": 3}]
+            ),
+            1,
+        )
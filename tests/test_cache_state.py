@@ -50,6 +50,19 @@ class CacheStateManagerTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.state, CacheState.STALE)
         self.assertEqual(result.decision, ScrapeDecision.SCRAPE_BACKGROUND)
 
+    async def test_prefetched_demand_decides_without_another_write(self):
+        manager = CacheStateManager("tt123:2")
+
+        with (
+            patch.object(manager, "register_demand") as register_demand,
+            patch.object(manager, "_try_acquire_lock", return_value=False),
+        ):
+            result = await manager.decide(0, None)
+
+        register_demand.assert_not_called()
+        self.assertEqual(result.state, CacheState.EMPTY)
+        self.assertEqual(result.decision, ScrapeDecision.WAIT_FOR_OTHER)
+
     async def test_demand_write_failure_is_visible_and_non_fatal(self):
         manager = CacheStateManager("tt123:2")
 
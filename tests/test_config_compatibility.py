@@ -51,6 +51,26 @@ class ConfigCompatibilityTests(unittest.TestCase):
                     expected,
                 )
 
+    def test_equivalent_configs_share_one_validated_config(self):
+        first = base64.b64encode(
+            b'{"debridService": "realdebrid", "debridApiKey": "key"}'
+        ).decode()
+        reordered = base64.b64encode(
+            b'{"debridApiKey":"key","debridService":"realdebrid","cachedOnly":false}'
+        ).decode()
+        different = base64.b64encode(
+            b'{"debridService": "realdebrid", "debridApiKey": "other"}'
+        ).decode()
+
+        config = config_check(first, strict_b64config=True)
+        reordered_config = config_check(reordered, strict_b64config=True)
+        different_config = config_check(different, strict_b64config=True)
+
+        self.assertIs(config, reordered_config)
+        self.assertIs(config["rtnSettings"], reordered_config["rtnSettings"])
+        self.assertIsNot(config, different_config)
+        self.assertEqual(different_config["debridApiKey"], "other")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,21 @@
 import asyncio
 import sqlite3
 import tempfile
+import time
 import unittest
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from databases import Database
 
 import comet.services.debrid_account_scraper as account_scraper
+from comet.core.schema_specs import (
+    DEBRID_ACCOUNT_MAGNETS_TABLE_SPEC,
+    DEBRID_ACCOUNT_SYNC_STATE_TABLE_SPEC,
+)
+from comet.debrid.manager import build_account_key_hash
+from comet.services import filtering
+from comet.utils.parsing import MediaScope
 
 
 class DebridAccountSnapshotTests(unittest.IsolatedAsyncioTestCase):
@@ -29,6 +37,9 @@ class DebridAccountSnapshotTests(unittest.IsolatedAsyncioTestCase):
                         status TEXT NOT NULL,
                         added_at REAL NOT NULL,
                         synced_at REAL NOT NULL,
+                        parsed_title TEXT,
+                        parsed_year INTEGER,
+                        parsed_json TEXT,
                         PRIMARY KEY (debrid_service, account_key_hash, magnet_id)
                     )
                     """
@@ -39,6 +50,7 @@ class DebridAccountSnapshotTests(unittest.IsolatedAsyncioTestCase):
                         debrid_service TEXT NOT NULL,
                         account_key_hash TEXT NOT NULL,
                         last_sync_at REAL NOT NULL CHECK (last_sync_at < 0),
+                        last_full_sync_at REAL,
                         PRIMARY KEY (debrid_service, account_key_hash)
                     )
                     """
@@ -65,6 +77,9 @@ class DebridAccountSnapshotTests(unittest.IsolatedAsyncioTestCase):
                     "status": "cached",
                     "added_at": 2,
                     "synced_at": 2,
+                    "parsed_title": "new",
+                    "parsed_year": None,
+                    "parsed_json": None,
                 }
                 with patch.object(account_scraper, "database", database):
                     with self.assertRaises(sqlite3.IntegrityError):
@@ -90,6 +105,278 @@ class DebridAccountSnapshotTests(unittest.IsolatedAsyncioTestCase):
                 await database.disconnect()
 
 
+class PrimaryCompatibleDatabase:
+    def __init__(self, database: Database):
+        self.database = database
+
+    async def fetch_all(self, query, values=None, **kwargs):
+        kwargs.pop("force_primary", None)
+        return await self.database.fetch_all(query, values, **kwargs)
+
+    async def fetch_one(self, query, values=None, **kwargs):
+        kwargs.pop("force_primary", None)
+        return await self.database.fetch_one(query, values, **kwargs)
+
+    async def execute(self, query, values=None):
+        return await self.database.execute(query, values)
+
+    async def execute_many(self, query, values):
+        return await self.database.execute_many(query, values)
+
+    def transaction(self):
+        return self.database.transaction()
+
+
+class DebridAccountTitleIndexTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.database = Database(
+            f"sqlite+aiosqlite:///{Path(self._tmp.name) / 'snapshot.db'}"
+        )
+        await self.database.connect()
+        self.addAsyncCleanup(self.database.disconnect)
+        await self.database.execute(
+            DEBRID_ACCOUNT_MAGNETS_TABLE_SPEC.create_sql.format(
+                table_name=DEBRID_ACCOUNT_MAGNETS_TABLE_SPEC.table_name
+            )
+        )
+        patcher = patch.object(
+            account_scraper, "database", PrimaryCompatibleDatabase(self.database)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _store_snapshot(self, account_key_hash: str, magnets: list[dict]):
+        synced_at = account_scraper.time.time()
+        rows = account_scraper._build_snapshot_rows(
+            "realdebrid", account_key_hash, synced_at, magnets
+        )
+        await account_scraper._upsert_snapshot_rows(rows)
+        return rows
+
+    async def test_snapshot_rows_store_parsed_title_and_year(self):
+        rows = await self._store_snapshot(
+            "account",
+            [
+                {
+                    "id": 1,
+                    "hash": "A" * 40,
+                    "name": "Dune.Part.Two.2024.2160p.WEB-DL",
+                    "size": 1,
+                    "status": "downloaded",
+                },
+                {
+                    "id": 2,
+                    "hash": "b" * 40,
+                    "name": "Dune.Part.Two.2024.Sample.mkv",
+                    "size": 1,
+                    "status": "downloaded",
+                },
+            ],
+        )
+
+        self.assertEqual(rows[0]["info_hash"], "a" * 40)
+        self.assertEqual(rows[0]["parsed_title"], "dune part two")
+        self.assertEqual(rows[0]["parsed_year"], 2024)
+        self.assertIsNotNone(rows[0]["parsed_json"])
+        self.assertEqual(rows[1]["parsed_title"], "")
+        self.assertIsNone(rows[1]["parsed_json"])
+
+    async def test_matching_reads_indexed_titles_without_reparsing(self):
+        account_key_hash = build_account_key_hash("key")
+        await self._store_snapshot(
+            account_key_hash,
+            [
+                {
+                    "id": 1,
+                    "hash": "a" * 40,
+                    "name": "Severance.S01E01.1080p.WEB.H264",
+                    "size": 1,
+                    "status": "downloaded",
+                },
+                {
+                    "id": 2,
+                    "hash": "b" * 40,
+                    "name": "Andor.S01E01.1080p.WEB.H264",
+                    "size": 1,
+                    "status": "downloaded",
+                },
+            ],
+        )
+        await account_scraper._upsert_snapshot_rows(
+            [
+                {
+                    "debrid_service": "realdebrid",
+                    "account_key_hash": account_key_hash,
+                    "magnet_id": "3",
+                    "info_hash": "c" * 40,
+                    "name": "Severance.S01E02.1080p.WEB.H264",
+                    "size": 1,
+                    "status": "queued",
+                    "added_at": 1,
+                    "synced_at": account_scraper.time.time(),
+                    "parsed_title": None,
+                    "parsed_year": None,
+                    "parsed_json": None,
+                }
+            ]
+        )
+
+        parse = MagicMock(wraps=filtering._parse_with_cache)
+        with patch.object(filtering, "_parse_with_cache", parse):
+            torrents, statuses = await account_scraper.get_account_torrents_for_media(
+                [{"service": "realdebrid", "apiKey": "key"}],
+                "series",
+                MediaScope.SERIES,
+                "Severance",
+                None,
+                None,
+                None,
+                None,
+                {},
+                False,
+            )
+
+        self.assertEqual(set(torrents), {"a" * 40, "c" * 40})
+        self.assertEqual(
+            statuses,
+            {"a" * 40: {"realdebrid": True}, "c" * 40: {"realdebrid": False}},
+        )
+        parse.assert_called_once_with("Severance.S01E02.1080p.WEB.H264")
+
+
+def _magnet(magnet_id: int, name: str, added_at: float, status="downloaded"):
+    return {
+        "id": magnet_id,
+        "hash": f"{magnet_id:040x}",
+        "name": name,
+        "size": 1,
+        "status": status,
+        "added_at": added_at,
+    }
+
+
+class FakeMagnetClient:
+    def __init__(self, magnets: list[dict]):
+        self.magnets = magnets
+        self.offsets = []
+
+    async def list_magnets(self, limit: int = 500, offset: int = 0):
+        self.offsets.append(offset)
+        return self.magnets[offset : offset + limit], len(self.magnets)
+
+
+class DebridAccountIncrementalSyncTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.database = Database(
+            f"sqlite+aiosqlite:///{Path(self._tmp.name) / 'snapshot.db'}"
+        )
+        await self.database.connect()
+        self.addAsyncCleanup(self.database.disconnect)
+        for spec in (
+            DEBRID_ACCOUNT_MAGNETS_TABLE_SPEC,
+            DEBRID_ACCOUNT_SYNC_STATE_TABLE_SPEC,
+        ):
+            await self.database.execute(
+                spec.create_sql.format(table_name=spec.table_name)
+            )
+        for patcher in (
+            patch.object(
+                account_scraper, "database", PrimaryCompatibleDatabase(self.database)
+            ),
+            patch.object(
+                account_scraper.settings,
+                "DEBRID_ACCOUNT_SCRAPE_FULL_SYNC_INTERVAL",
+                3600,
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def _sync(self, magnets: list[dict]) -> FakeMagnetClient:
+        client = FakeMagnetClient(magnets)
+        with patch.object(account_scraper, "StremThru", return_value=client):
+            await account_scraper._sync_single_account(
+                object(), "realdebrid", "key", "ip", "account"
+            )
+        return client
+
+    async def _stored(self) -> dict:
+        rows = await self.database.fetch_all(
+            "SELECT magnet_id, status, synced_at FROM debrid_account_magnets"
+        )
+        return {row["magnet_id"]: (row["status"], row["synced_at"]) for row in rows}
+
+    async def test_paging_stops_at_watermark(self):
+        magnets = [_magnet(i, f"Movie.{i}.2020", 10_000 - i) for i in range(1, 1201)]
+        client = FakeMagnetClient(magnets)
+
+        fetched = await account_scraper._fetch_all_magnets(
+            client, 5000, watermark=10_000 - 400
+        )
+
+        self.assertEqual(client.offsets, [0])
+        self.assertEqual(len(fetched), 500)
+
+    async def test_incremental_sync_only_upserts_new_or_changed_rows(self):
+        await self._sync(
+            [
+                _magnet(2, "Movie.B.2020", 200, status="downloading"),
+                _magnet(1, "Movie.A.2020", 100),
+            ]
+        )
+        first = await self._stored()
+
+        await self._sync(
+            [
+                _magnet(3, "Movie.C.2020", 300),
+                _magnet(2, "Movie.B.2020", 200),
+            ]
+        )
+        second = await self._stored()
+
+        self.assertEqual(set(second), {"1", "2", "3"})
+        self.assertEqual(second["1"], first["1"])
+        self.assertEqual(second["2"][0], "downloaded")
+        self.assertGreater(second["2"][1], first["2"][1])
+        state = await self.database.fetch_one(
+            "SELECT last_sync_at, last_full_sync_at FROM debrid_account_sync_state"
+        )
+        self.assertGreater(state["last_sync_at"], state["last_full_sync_at"])
+
+    async def test_full_sync_removes_deleted_magnets(self):
+        await self._sync(
+            [_magnet(2, "Movie.B.2020", 200), _magnet(1, "Movie.A.2020", 100)]
+        )
+        await self.database.execute(
+            "UPDATE debrid_account_sync_state SET last_full_sync_at = 0"
+        )
+
+        await self._sync([_magnet(2, "Movie.B.2020", 200)])
+
+        self.assertEqual(set(await self._stored()), {"2"})
+
+    async def test_failed_and_stale_pending_magnets_do_not_pin_the_watermark(self):
+        now = int(time.time())
+        await self._sync(
+            [
+                _magnet(4, "Movie.D.2020", now - 60),
+                _magnet(3, "Movie.C.2020", now - 120, status="downloading"),
+                _magnet(2, "Movie.B.2020", now - 300, status="failed"),
+                _magnet(1, "Movie.A.2020", now - 7200, status="downloading"),
+            ]
+        )
+
+        watermark = await account_scraper._get_sync_watermark(
+            "realdebrid", "account", now
+        )
+
+        self.assertEqual(watermark, now - 120)
+
+
 class DebridAccountTaskTests(unittest.IsolatedAsyncioTestCase):
     async def asyncTearDown(self):
         await account_scraper.shutdown_account_sync_tasks()
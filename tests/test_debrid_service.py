@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import AsyncMock, patch
 
-from comet.services.debrid import DebridService
+from comet.services.debrid import DebridService, settings
 from comet.utils.parsing import MediaScope
 
 
@@ -99,11 +99,17 @@ class DebridServiceCacheTests(unittest.IsolatedAsyncioTestCase):
             (MediaScope.SERIES, None),
         ):
             with self.subTest(media_scope=media_scope):
-                with patch(
-                    "comet.services.debrid.get_cached_availability",
-                    return_value=rows,
+                with (
+                    patch(
+                        "comet.services.debrid.get_cached_availability",
+                        new=AsyncMock(return_value=rows),
+                    ),
+                    patch(
+                        "comet.services.debrid.get_known_uncached",
+                        new=AsyncMock(return_value=set()),
+                    ),
                 ):
-                    cached, updates = await DebridService(
+                    cached, uncached, updates = await DebridService(
                         "torbox", "token", ""
                     ).check_existing_availability(
                         [info_hash],
@@ -114,6 +120,7 @@ class DebridServiceCacheTests(unittest.IsolatedAsyncioTestCase):
                     )
 
                 self.assertEqual(cached, {info_hash})
+                self.assertEqual(uncached, set())
                 self.assertEqual(updates, {})
                 self.assertEqual(torrent["title"], "Show.S02.COMPLETE.1080p.mkv")
                 self.assertEqual(torrent["size"], 1_000)
@@ -164,11 +171,17 @@ class DebridServiceCacheTests(unittest.IsolatedAsyncioTestCase):
             },
         ]
 
-        with patch(
-            "comet.services.debrid.get_cached_availability",
-            return_value=rows,
+        with (
+            patch(
+                "comet.services.debrid.get_cached_availability",
+                new=AsyncMock(return_value=rows),
+            ),
+            patch(
+                "comet.services.debrid.get_known_uncached",
+                new=AsyncMock(return_value=set()),
+            ),
         ):
-            cached, updates = await service.check_existing_availability(
+            cached, _, updates = await service.check_existing_availability(
                 list(torrents), None, None, MediaScope.MOVIE, torrents
             )
 
@@ -179,3 +192,85 @@ class DebridServiceCacheTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(updates["a" * 40]["fileIndex"], 1)
         self.assertNotIn("parsed", updates["a" * 40])
         self.assertEqual(updates["b" * 40]["parsed"].raw_title, "Valid.mkv")
+
+    async def test_checked_hashes_without_cached_files_are_cached_as_negatives(self):
+        cached_hash = "a" * 40
+        uncached_hash = "b" * 40
+        failed_hash = "c" * 40
+        availability = [
+            {
+                "info_hash": cached_hash,
+                "index": 0,
+                "title": "Movie.2024.mkv",
+                "size": 100,
+                "season": None,
+                "episode": None,
+                "parsed": None,
+            }
+        ]
+
+        async def retrieve(*args, checked_hashes, **kwargs):
+            del args, kwargs
+            checked_hashes.update({cached_hash, uncached_hash})
+            return availability
+
+        with (
+            patch.object(settings, "DEBRID_NEGATIVE_CACHE_TTL", 900),
+            patch("comet.services.debrid.retrieve_debrid_availability", new=retrieve),
+            patch("comet.services.debrid.schedule_cache_availability"),
+            patch(
+                "comet.services.debrid.schedule_cache_unavailability"
+            ) as schedule_negative,
+        ):
+            cached, _ = await DebridService(
+                "torbox", "token", ""
+            ).get_and_cache_availability(
+                session=None,
+                info_hashes=[cached_hash, uncached_hash, failed_hash],
+                seeders_map={},
+                tracker_map={},
+                sources_map={},
+                torrents=None,
+                media_id="tt1234567",
+                media_only_id="tt1234567",
+                season=None,
+                episode=None,
+                media_scope=MediaScope.MOVIE,
+            )
+
+        self.assertEqual(cached, {cached_hash})
+        schedule_negative.assert_called_once_with(
+            "torbox", {uncached_hash}, MediaScope.MOVIE, None, None
+        )
+
+    async def test_positive_cache_rows_override_negative_entries(self):
+        cached_hash = "a" * 40
+        uncached_hash = "b" * 40
+        rows = [
+            {
+                "info_hash": cached_hash,
+                "file_index": None,
+                "title": None,
+                "size": None,
+                "parsed": None,
+            }
+        ]
+
+        with (
+            patch(
+                "comet.services.debrid.get_cached_availability",
+                new=AsyncMock(return_value=rows),
+            ),
+            patch(
+                "comet.services.debrid.get_known_uncached",
+                new=AsyncMock(return_value={cached_hash, uncached_hash}),
+            ),
+        ):
+            cached, uncached, _ = await DebridService(
+                "torbox", "token", ""
+            ).check_existing_availability(
+                [cached_hash, uncached_hash], None, None, MediaScope.MOVIE, None
+            )
+
+        self.assertEqual(cached, {cached_hash})
+        self.assertEqual(uncached, {uncached_hash})
@@ -0,0 +1,155 @@
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from comet.services.download_links import (
+    DownloadLinkPrefetcher,
+    LinkPrefetchCandidate,
+    LinkPrefetchContext,
+    settings,
+)
+
+CONTEXT = LinkPrefetchContext(
+    media_id="tt1234567:1:2",
+    media_only_id="tt1234567",
+    title="Show",
+    season=1,
+    episode=2,
+    aliases={},
+    ip="",
+)
+
+
+def _candidate(info_hash: str, api_key: str = "key") -> LinkPrefetchCandidate:
+    return LinkPrefetchCandidate(
+        debrid_service="realdebrid",
+        debrid_api_key=api_key,
+        info_hash=info_hash,
+        index="0",
+        torrent_name=f"{info_hash}.mkv",
+    )
+
+
+class DownloadLinkPrefetcherTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.prefetcher = DownloadLinkPrefetcher()
+        self.tasks = []
+        self.debrid = MagicMock()
+        self.debrid.generate_download_link = AsyncMock(
+            return_value="https://download.test/video"
+        )
+        self.cache_link = AsyncMock()
+        for patcher in (
+            patch.object(settings, "DEBRID_LINK_PREFETCH_ENABLED", True),
+            patch.object(settings, "DEBRID_LINK_PREFETCH_TOP_N", 2),
+            patch.object(settings, "DEBRID_LINK_PREFETCH_MAX_INFLIGHT", 4),
+            patch.object(settings, "DEBRID_LINK_PREFETCH_ACCOUNT_LIMIT", 2),
+            patch.object(settings, "DEBRID_LINK_PREFETCH_ACCOUNT_WINDOW", 3600),
+            patch(
+                "comet.services.download_links.get_cached_download_link",
+                new=AsyncMock(return_value=None),
+            ),
+            patch("comet.services.download_links.cache_download_link", self.cache_link),
+            patch("comet.services.download_links.get_debrid", return_value=self.debrid),
+            patch(
+                "comet.services.download_links.http_client_manager.get_session",
+                new=AsyncMock(),
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _add_task(self, func, *args):
+        self.tasks.append((func, args))
+
+    async def _run_tasks(self):
+        tasks, self.tasks = self.tasks, []
+        for func, args in tasks:
+            await func(*args)
+
+    async def test_top_cached_streams_are_prefetched_into_link_cache(self):
+        candidates = [_candidate(char * 40) for char in "abc"]
+
+        scheduled = self.prefetcher.schedule(self._add_task, candidates, CONTEXT)
+        await self._run_tasks()
+
+        self.assertEqual(scheduled, 2)
+        self.assertEqual(self.debrid.generate_download_link.await_count, 2)
+        cached_hashes = {
+            call.kwargs["info_hash"] for call in self.cache_link.await_args_list
+        }
+        self.assertEqual(cached_hashes, {"a" * 40, "b" * 40})
+        self.assertEqual(self.cache_link.await_args.kwargs["season"], 1)
+        self.assertEqual(self.cache_link.await_args.kwargs["episode"], 2)
+
+    async def test_per_account_limit_stops_link_generation(self):
+        for char in "abc":
+            self.prefetcher.schedule(self._add_task, [_candidate(char * 40)], CONTEXT)
+            await self._run_tasks()
+        self.prefetcher.schedule(
+            self._add_task, [_candidate("d" * 40, api_key="other")], CONTEXT
+        )
+        await self._run_tasks()
+
+        generated = [
+            call.args[0] for call in self.debrid.generate_download_link.await_args_list
+        ]
+        self.assertEqual(generated, ["a" * 40, "b" * 40, "d" * 40])
+
+    async def test_expired_account_windows_are_dropped(self):
+        self.prefetcher.schedule(self._add_task, [_candidate("a" * 40)], CONTEXT)
+        await self._run_tasks()
+        self.assertEqual(len(self.prefetcher._account_windows), 1)
+
+        with patch(
+            "comet.services.download_links.time.monotonic",
+            return_value=time.monotonic() + 3600,
+        ):
+            self.prefetcher.schedule(
+                self._add_task, [_candidate("b" * 40, api_key="other")], CONTEXT
+            )
+            await self._run_tasks()
+
+        self.assertEqual(len(self.prefetcher._account_windows), 1)
+        account = next(iter(self.prefetcher._account_windows))
+        self.assertNotIn("other", account)
+        self.assertEqual(self.debrid.generate_download_link.await_count, 2)
+
+    async def test_inflight_budget_drops_extra_candidates(self):
+        with patch.object(settings, "DEBRID_LINK_PREFETCH_MAX_INFLIGHT", 1):
+            first = self.prefetcher.schedule(
+                self._add_task, [_candidate("a" * 40)], CONTEXT
+            )
+            second = self.prefetcher.schedule(
+                self._add_task, [_candidate("b" * 40)], CONTEXT
+            )
+            await self._run_tasks()
+            third = self.prefetcher.schedule(
+                self._add_task, [_candidate("b" * 40)], CONTEXT
+            )
+
+        self.assertEqual((first, second, third), (1, 0, 1))
+
+    async def test_cached_links_are_not_regenerated(self):
+        with patch(
+            "comet.services.download_links.get_cached_download_link",
+            new=AsyncMock(return_value="https://download.test/cached"),
+        ):
+            self.prefetcher.schedule(self._add_task, [_candidate("a" * 40)], CONTEXT)
+            await self._run_tasks()
+
+        self.debrid.generate_download_link.assert_not_awaited()
+        self.cache_link.assert_not_awaited()
+
+    def test_disabled_prefetch_schedules_nothing(self):
+        with patch.object(settings, "DEBRID_LINK_PREFETCH_ENABLED", False):
+            scheduled = self.prefetcher.schedule(
+                self._add_task, [_candidate("a" * 40)], CONTEXT
+            )
+
+        self.assertEqual(scheduled, 0)
+        self.assertEqual(self.tasks, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
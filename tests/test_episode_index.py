@@ -1,20 +1,45 @@
+import time
 import unittest
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch
 
-from comet.metadata.episode_index import EpisodeIndexService, database
+from comet.metadata.episode_index import (
+    EpisodeIndexService,
+    _series_index_cache,
+    database,
+)
+
+
+def _episode_row(season, episode, air_date, updated_at=100.0):
+    return {
+        "season": season,
+        "episode": episode,
+        "air_date": air_date,
+        "updated_at": updated_at,
+    }
+
+
+def _refresh_row(refreshed_at):
+    return _episode_row(None, None, None, refreshed_at)
 
 
 class EpisodeIndexRefreshTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        _series_index_cache.clear()
+        self.addCleanup(_series_index_cache.clear)
+
     async def test_cached_air_date_requires_valid_current_date(self):
         service = EpisodeIndexService(session=None)
-        with patch.object(database, "fetch_one", return_value={"air_date": "invalid"}):
+        with patch.object(
+            database, "fetch_all", return_value=[_episode_row(1, 2, "invalid")]
+        ):
             self.assertIsNone(await service._get_cached_air_date("tt123", 1, 2, None))
 
+        _series_index_cache.clear()
         with patch.object(
             database,
-            "fetch_one",
-            return_value={"air_date": "2026-07-22T12:00:00Z"},
+            "fetch_all",
+            return_value=[_episode_row(1, 2, "2026-07-22T12:00:00Z")],
         ):
             self.assertEqual(
                 await service._get_cached_air_date("tt123", 1, 2, None),
@@ -24,12 +49,56 @@ class EpisodeIndexRefreshTests(unittest.IsolatedAsyncioTestCase):
     async def test_invalid_refresh_timestamp_is_stale(self):
         service = EpisodeIndexService(session=None)
         for value in (None, True, "invalid", float("inf")):
+            _series_index_cache.clear()
             with (
                 self.subTest(value=value),
-                patch.object(database, "fetch_val", return_value=value),
+                patch.object(database, "fetch_all", return_value=[_refresh_row(value)]),
             ):
                 self.assertFalse(await service._is_series_index_fresh("tt123", 1.0))
 
+    async def test_series_index_is_loaded_once_for_forward_and_reverse_lookups(self):
+        service = EpisodeIndexService(session=None)
+        rows = [
+            _refresh_row(time.time()),
+            _episode_row(2, 1, "2026-07-25", time.time()),
+            _episode_row(1, 3, "2026-07-22", time.time()),
+            _episode_row(1, 4, "2026-07-22", time.time()),
+        ]
+        with patch.object(database, "fetch_all", return_value=rows) as fetch_all:
+            self.assertEqual(
+                await service.get_target_air_date("tt123", 2, 1), "2026-07-25"
+            )
+            self.assertEqual(
+                await service.get_episode_by_air_date("tt123", "2026-07-22"), (1, 3)
+            )
+            self.assertIsNone(
+                await service.get_episode_by_air_date("tt123", "2026-08-01")
+            )
+
+        fetch_all.assert_awaited_once()
+
+    async def test_tmdb_fallback_updates_the_loaded_series_index(self):
+        service = EpisodeIndexService(session=None)
+        with (
+            patch.object(
+                database, "fetch_all", return_value=[_refresh_row(time.time())]
+            ) as fetch_all,
+            patch.object(database, "execute_many", new=AsyncMock()),
+            patch("comet.metadata.episode_index.TMDBApi") as tmdb_api,
+        ):
+            tmdb_api.return_value.get_tmdb_id_from_imdb = AsyncMock(return_value=7)
+            tmdb_api.return_value.get_episode_air_date = AsyncMock(
+                return_value="2026-07-30"
+            )
+            self.assertEqual(
+                await service.get_target_air_date("tt123", 1, 5), "2026-07-30"
+            )
+            self.assertEqual(
+                await service.get_episode_by_air_date("tt123", "2026-07-30"), (1, 5)
+            )
+
+        fetch_all.assert_awaited_once()
+
     async def test_air_date_reverse_lookup_refreshes_the_existing_index_once(self):
         service = EpisodeIndexService(session=None)
         with (
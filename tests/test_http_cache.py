@@ -1,7 +1,14 @@
 import unittest
 from types import SimpleNamespace
+from unittest.mock import patch
 
-from comet.utils.cache import CacheControl, check_etag_match
+from comet.utils.cache import (
+    CacheControl,
+    _generate_etag,
+    cached_chunked_response,
+    check_etag_match,
+    settings,
+)
 
 
 class HttpCacheContractTests(unittest.TestCase):
@@ -50,5 +57,30 @@ class HttpCacheContractTests(unittest.TestCase):
         )
 
 
+class ChunkedResponseTests(unittest.IsolatedAsyncioTestCase):
+    async def test_chunks_match_the_concatenated_body_and_its_etag(self):
+        fragments = [b"<rss>", *(b"<item/>" for _ in range(10)), b"</rss>"]
+        body = b"".join(fragments)
+        request = SimpleNamespace(headers={})
+
+        with patch.object(settings, "HTTP_CACHE_ENABLED", True):
+            response = cached_chunked_response(
+                request, fragments, media_type="application/xml", chunk_size=16
+            )
+            chunks = [chunk async for chunk in response.body_iterator]
+
+            revalidated = cached_chunked_response(
+                SimpleNamespace(headers={"If-None-Match": response.headers["etag"]}),
+                fragments,
+                media_type="application/xml",
+            )
+
+        self.assertEqual(b"".join(chunks), body)
+        self.assertTrue(all(len(chunk) >= 16 for chunk in chunks[:-1]))
+        self.assertEqual(response.headers["content-length"], str(len(body)))
+        self.assertEqual(response.headers["etag"], _generate_etag(body))
+        self.assertEqual(revalidated.status_code, 304)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,7 @@ from comet.metadata.manager import (
     MetadataScraper,
     _alias_cache_timestamp,
     _CacheEntry,
+    _metadata_memory_cache,
 )
 from comet.services.anime import anime_mapper
 
@@ -92,6 +93,10 @@ class _MetadataScraper(MetadataScraper):
 
 
 class MetadataRefreshTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        _metadata_memory_cache.clear()
+        self.addCleanup(_metadata_memory_cache.clear)
+
     async def test_imdb_anime_aliases_are_merged_with_tmdb_languages(self):
         scraper = MetadataScraper(session=None)
         with (
@@ -260,3 +265,72 @@ class MetadataRefreshTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(state.metadata_calls, 0)
         self.assertEqual(state.alias_calls, 1)
         self.assertEqual(state.cache_calls, 1)
+
+    async def test_memory_tier_serves_fresh_rows_without_database(self):
+        with TemporaryDirectory() as temp_dir:
+            database = ReplicaAwareDatabase(
+                Database(f"sqlite+aiosqlite:///{temp_dir}/cache.db")
+            )
+            await database.connect()
+            try:
+                await database.execute(
+                    """
+                    CREATE TABLE media_metadata_cache (
+                        media_id TEXT PRIMARY KEY,
+                        title TEXT,
+                        year INTEGER,
+                        year_end INTEGER,
+                        aliases_json TEXT,
+                        metadata_updated_at REAL,
+                        aliases_updated_at REAL
+                    )
+                    """
+                )
+                now = time.time()
+                await database.execute(
+                    """
+                    INSERT INTO media_metadata_cache VALUES (
+                        'imdb:tt123', 'Movie', 2026, NULL, '{"fr":["Film"]}',
+                        :now, :now
+                    )
+                    """,
+                    {"now": now},
+                )
+                scraper = MetadataScraper(session=None)
+                fetch_one = AsyncMock(wraps=database.fetch_one)
+                with (
+                    patch("comet.metadata.manager.database", database),
+                    patch.object(database, "fetch_one", fetch_one),
+                ):
+                    first, second = await asyncio.gather(
+                        scraper.get_cached("imdb:tt123", None, None),
+                        scraper.get_cached("imdb:tt123", None, None),
+                    )
+                    third = await scraper.get_cached("imdb:tt123", 1, 2)
+            finally:
+                await database.disconnect()
+
+        self.assertEqual(fetch_one.await_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(third.metadata["title"], "Movie")
+        self.assertEqual(third.metadata["episode"], 2)
+        self.assertEqual(third.aliases, {"fr": ["Film"]})
+
+    async def test_failed_metadata_provider_is_not_retried_within_negative_ttl(self):
+        scraper = MetadataScraper(session=None)
+        get_metadata = AsyncMock(return_value=None)
+        with (
+            patch.object(settings, "METADATA_NEGATIVE_CACHE_TTL", 60),
+            patch.object(
+                scraper,
+                "get_cached",
+                new=AsyncMock(return_value=_CacheEntry(metadata=None, aliases={})),
+            ),
+            patch.object(scraper, "get_metadata", get_metadata),
+        ):
+            first = await scraper.fetch_metadata_and_aliases("movie", "tt404", "tt404")
+            second = await scraper.fetch_metadata_and_aliases("movie", "tt404", "tt404")
+
+        self.assertEqual(first, (None, {}))
+        self.assertEqual(second, (None, {}))
+        get_metadata.assert_awaited_once()
@@ -26,7 +26,10 @@ class _DebridService:
         return {info_hash}, {info_hash: {"title": title}}
 
     async def check_existing_availability(self, *args, **kwargs):
-        return await self.get_and_cache_availability(*args, **kwargs)
+        cached_hashes, torrent_updates = await self.get_and_cache_availability(
+            *args, **kwargs
+        )
+        return cached_hashes, set(), torrent_updates
 
 
 class _CredentialDebridService:
@@ -125,6 +128,44 @@ class MultiServiceDebridTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(_SelectiveDebridService.checked_hashes["first"], [second_hash])
         self.assertEqual(_SelectiveDebridService.checked_hashes["second"], [first_hash])
 
+    async def test_fresh_check_skips_recent_negative_results_only(self):
+        first_hash = "a" * 40
+        second_hash = "b" * 40
+        torrents = {
+            info_hash: {
+                "title": f"{info_hash}.mkv",
+                "seeders": 1,
+                "tracker": "tracker",
+                "sources": [],
+            }
+            for info_hash in (first_hash, second_hash)
+        }
+        entries = [{"service": "first", "apiKey": "one"}]
+        _SelectiveDebridService.checked_hashes = {}
+
+        with patch(
+            "comet.services.media_search.DebridService",
+            new=_SelectiveDebridService,
+        ):
+            await get_and_cache_multi_service_availability(
+                None,
+                entries,
+                torrents,
+                "tt123",
+                "tt123",
+                None,
+                None,
+                MediaScope.MOVIE,
+                "",
+                known_cache_status={
+                    first_hash: {"first": False},
+                    second_hash: {"first": False},
+                },
+                verified_cache_status={first_hash: {"first": False}},
+            )
+
+        self.assertEqual(_SelectiveDebridService.checked_hashes["first"], [second_hash])
+
     async def test_cached_enrichment_uses_configured_order_not_completion_order(self):
         info_hash = "a" * 40
         torrents = {info_hash: {"title": "Original.mkv"}}
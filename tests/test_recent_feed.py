@@ -0,0 +1,62 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from comet.services.recent_feed import RecentFeed, RecentFeedCache, settings
+
+FEED = RecentFeed((b"<item/>",), 1, "movie", "hit")
+
+
+class RecentFeedCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cache = RecentFeedCache()
+        patcher = patch.object(settings, "TORZNAB_RECENT_FEED_TTL", 60)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_feed_is_reused_until_the_ttl_expires(self):
+        build = AsyncMock(return_value=FEED)
+
+        with patch("comet.services.recent_feed.time.monotonic", return_value=100.0):
+            self.assertIs(await self.cache.get("movie", build), FEED)
+        with patch("comet.services.recent_feed.time.monotonic", return_value=159.0):
+            self.assertIs(await self.cache.get("movie", build), FEED)
+            await self.cache.get("series", build)
+        self.assertEqual(build.await_count, 2)
+
+        with patch("comet.services.recent_feed.time.monotonic", return_value=160.0):
+            await self.cache.get("movie", build)
+        self.assertEqual(build.await_count, 3)
+
+    async def test_concurrent_polls_share_one_build(self):
+        release = asyncio.Event()
+        calls = 0
+
+        async def build():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return FEED
+
+        polls = [asyncio.create_task(self.cache.get(None, build)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await asyncio.gather(*polls), [FEED] * 3)
+        self.assertEqual(calls, 1)
+
+    async def test_unmaterialized_results_and_zero_ttl_rebuild_every_poll(self):
+        build = AsyncMock(return_value=None)
+        await self.cache.get(None, build)
+        await self.cache.get(None, build)
+        self.assertEqual(build.await_count, 2)
+
+        build = AsyncMock(return_value=FEED)
+        with patch.object(settings, "TORZNAB_RECENT_FEED_TTL", 0):
+            await self.cache.get(None, build)
+            await self.cache.get(None, build)
+        self.assertEqual(build.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from multidict import CIMultiDict
+
+from comet.core.models import AppSettings
+from comet.utils.network_manager import AsyncClientWrapper, _RequestContextManager
+from comet.utils.response_cache import (
+    ScraperResponseCache,
+    build_response_cache_key,
+    resolve_response_cache_ttl,
+    settings,
+)
+
+
+def _loader(body: bytes = b'{"ok":true}', status: int = 200):
+    return AsyncMock(return_value=(status, body, "utf-8", "application/json", None))
+
+
+class ScraperResponseCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.cache = ScraperResponseCache()
+        patcher = patch.object(settings, "SCRAPER_RESPONSE_CACHE_SHARED", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.cache.close()
+
+    async def test_fresh_entry_is_served_without_upstream_request(self):
+        loader = _loader()
+
+        first = await self.cache.get_or_fetch("key", "Example", 60, loader)
+        second = await self.cache.get_or_fetch("key", "Example", 60, loader)
+
+        self.assertIs(first, second)
+        loader.assert_awaited_once()
+
+    async def test_concurrent_misses_share_one_upstream_request(self):
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return 200, b"body", "utf-8", "text/plain", None
+
+        loader = AsyncMock(side_effect=loader)
+        pending = [
+            asyncio.create_task(self.cache.get_or_fetch("key", "Example", 60, loader))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        entries = await asyncio.gather(*pending)
+
+        self.assertEqual({entry.body for entry in entries}, {b"body"})
+        loader.assert_awaited_once()
+
+    async def test_stale_entry_is_served_while_one_refresh_runs(self):
+        loader = _loader(b"old")
+        with patch("comet.utils.response_cache.time.time", return_value=100.0):
+            await self.cache.get_or_fetch("key", "Example", 10, loader)
+
+        release = asyncio.Event()
+
+        async def refresh():
+            await release.wait()
+            return 200, b"new", "utf-8", "text/plain", None
+
+        refresher = AsyncMock(side_effect=refresh)
+        with patch("comet.utils.response_cache.time.time", return_value=115.0):
+            first = await self.cache.get_or_fetch("key", "Example", 10, refresher)
+            second = await self.cache.get_or_fetch("key", "Example", 10, refresher)
+            release.set()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            refreshed = await self.cache.get_or_fetch("key", "Example", 10, refresher)
+
+        self.assertEqual(first.body, b"old")
+        self.assertEqual(second.body, b"old")
+        self.assertEqual(refreshed.body, b"new")
+        refresher.assert_awaited_once()
+
+    async def test_error_responses_are_not_cached(self):
+        loader = _loader(b"busy", status=503)
+
+        await self.cache.get_or_fetch("key", "Example", 60, loader)
+        await self.cache.get_or_fetch("key", "Example", 60, loader)
+
+        self.assertEqual(loader.await_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    async def test_least_recently_used_bodies_are_evicted_by_size(self):
+        with patch.object(settings, "SCRAPER_RESPONSE_CACHE_MAX_BYTES", 8):
+            await self.cache.get_or_fetch("a", "Example", 60, _loader(b"aaaa"))
+            await self.cache.get_or_fetch("b", "Example", 60, _loader(b"bbbb"))
+            await self.cache.get_or_fetch("a", "Example", 60, _loader(b"----"))
+            await self.cache.get_or_fetch("c", "Example", 60, _loader(b"cccc"))
+
+        self.assertEqual(self.cache.size_bytes, 8)
+        self.assertEqual(list(self.cache._entries), ["a", "c"])
+
+
+class CachedClientRequestTests(unittest.IsolatedAsyncioTestCase):
+    MAGNET = "magnet:?xt=urn:btih:" + "a" * 40
+
+    async def asyncSetUp(self):
+        self.cache = ScraperResponseCache()
+        upstream = SimpleNamespace(
+            status=302,
+            headers=CIMultiDict({"Location": self.MAGNET}),
+            charset=None,
+            read=AsyncMock(return_value=b""),
+        )
+        self.send = AsyncMock(return_value=upstream)
+        self.client = AsyncClientWrapper("Example")
+        self.client.response_cache_ttl = 60
+        for patcher in (
+            patch.object(settings, "SCRAPER_RESPONSE_CACHE_SHARED", False),
+            patch("comet.utils.network_manager.scraper_response_cache", self.cache),
+            patch.object(_RequestContextManager, "_attempt_request", self.send),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.cache.close()
+
+    async def test_redirects_read_by_the_caller_bypass_the_cache(self):
+        async with self.client.get(
+            "https://indexer.test/dl", allow_redirects=False
+        ) as response:
+            location = response.headers.get("Location")
+
+        self.assertEqual(location, self.MAGNET)
+        self.assertEqual(len(self.cache), 0)
+
+    async def test_uncached_responses_keep_upstream_headers(self):
+        for _ in range(2):
+            async with self.client.get("https://indexer.test/dl") as response:
+                self.assertEqual(response.status, 302)
+                self.assertEqual(response.headers["Location"], self.MAGNET)
+
+        self.assertEqual(self.send.await_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+
+class ScraperResponseCacheKeyTests(unittest.TestCase):
+    def test_key_ignores_parameter_order_but_not_headers(self):
+        first = build_response_cache_key(
+            "Example", "get", "https://x.test", {"a": 1, "b": 2}
+        )
+        second = build_response_cache_key(
+            "ExampleScraper", "GET", "https://x.test", [("b", "2"), ("a", "1")]
+        )
+        with_header = build_response_cache_key(
+            "Example", "GET", "https://x.test", {"a": 1, "b": 2}, {"X-Key": "secret"}
+        )
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, with_header)
+
+    def test_ttl_resolution_uses_normalized_scraper_override(self):
+        overrides = AppSettings.normalize_scraper_response_cache_ttl_overrides(
+            {"ZileanScraper": 900, "jackett": 0}
+        )
+
+        with (
+            patch.object(settings, "SCRAPER_RESPONSE_CACHE_ENABLED", True),
+            patch.object(settings, "SCRAPER_RESPONSE_CACHE_TTL", 300),
+            patch.object(settings, "SCRAPER_RESPONSE_CACHE_TTL_OVERRIDES", overrides),
+        ):
+            self.assertEqual(resolve_response_cache_ttl("Zilean"), 900)
+            self.assertEqual(resolve_response_cache_ttl("Jackett"), 0)
+            self.assertEqual(resolve_response_cache_ttl("Torrentio"), 300)
+
+        with patch.object(settings, "SCRAPER_RESPONSE_CACHE_ENABLED", False):
+            self.assertEqual(resolve_response_cache_ttl("Zilean"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
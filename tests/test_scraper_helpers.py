@@ -1,9 +1,11 @@
 import asyncio
+import threading
 import unittest
 from unittest.mock import patch
 
 from comet.core.models import settings
-from comet.scrapers.base import gather_with_error_logging
+from comet.scrapers import animetosho, bitmagnet
+from comet.scrapers.base import gather_with_error_logging, parse_pages
 from comet.scrapers.helpers.aiostreams import AIOStreamsConfig
 from comet.scrapers.helpers.mediafusion import MediaFusionConfig
 from comet.utils.parsing import associate_urls_credentials
@@ -38,6 +40,64 @@ class ScraperTaskTests(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(asyncio.CancelledError):
             await gather_with_error_logging((("cancelled operation", cancel()),))
 
+    async def test_pages_are_parsed_in_one_job_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        parser_threads = set()
+
+        def parse(page):
+            parser_threads.add(threading.get_ident())
+            return page.upper()
+
+        results = await parse_pages(parse, ["a", "b"])
+
+        self.assertEqual(results, ["A", "B"])
+        self.assertEqual(len(parser_threads), 1)
+        self.assertNotIn(loop_thread, parser_threads)
+
+
+TORZNAB_FEED = """<?xml version="1.0"?>
+<rss xmlns:torznab="http://torznab.com/schemas/2015/feed"
+     xmlns:newznab="http://www.newznab.com/DTD/2010/feeds/attributes/">
+  <channel>
+    <newznab:response offset="0" total="300"/>
+    <item>
+      <title>Show - 01</title>
+      <torznab:attr name="size" value="1024"/>
+      <torznab:attr name="seeders" value="7"/>
+      <torznab:attr name="infohash" value="{info_hash}"/>
+      <torznab:attr name="magneturl" value="magnet:?xt=urn:btih:{info_hash}&amp;tr=udp://t.test"/>
+    </item>
+    <item><title>No hash</title></item>
+  </channel>
+</rss>
+""".format(info_hash="a" * 40)
+
+
+class TorznabFeedParserTests(unittest.TestCase):
+    def test_animetosho_feed_returns_items_and_total(self):
+        items, total = animetosho.parse_feed(TORZNAB_FEED)
+
+        self.assertEqual(total, 300)
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0]["infoHash"], "a" * 40)
+        self.assertEqual(items[0]["seeders"], 7)
+        self.assertEqual(items[0]["sources"], ["udp://t.test"])
+
+    def test_bitmagnet_feed_returns_items(self):
+        items = bitmagnet.parse_feed(TORZNAB_FEED)
+
+        self.assertEqual([item["size"] for item in items], [1024])
+        self.assertEqual(items[0]["tracker"], "BitMagnet")
+
+    def test_malformed_pages_are_isolated(self):
+        with (
+            patch("comet.scrapers.animetosho.logger.warning"),
+            patch("comet.scrapers.bitmagnet.logger.warning"),
+        ):
+            self.assertEqual(animetosho.parse_feed("<rss"), ([], 0))
+            self.assertEqual(bitmagnet.parse_feed("<rss"), [])
+        self.assertEqual(animetosho.parse_feed("  "), ([], 0))
+
 
 class ScraperHelperConfigTests(unittest.TestCase):
     def test_url_credentials_follow_the_single_current_schema(self):
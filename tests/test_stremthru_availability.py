@@ -1,6 +1,9 @@
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, patch
 
+from comet.debrid.availability_batcher import InstantAvailabilityBatcher, settings
+from comet.debrid.concurrency import AdaptiveConcurrencyLimiter
 from comet.debrid.exceptions import DebridAuthError, DebridLinkGenerationError
 from comet.debrid.stremthru import (
     StremThru,
@@ -142,3 +145,179 @@ class StremThruResponseTests(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(raised.exception.payload["error_type"], "RuntimeError")
         self.assertIsInstance(raised.exception.__cause__, RuntimeError)
+
+
+class InstantAvailabilityBatcherTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.batcher = InstantAvailabilityBatcher()
+        patcher = patch.object(settings, "STREMTHRU_AVAILABILITY_BATCH_WINDOW", 0.01)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _fetcher(calls):
+        async def fetch(hashes, sid):
+            calls.append((list(hashes), sid))
+            return {
+                "data": {
+                    "items": [
+                        {"hash": info_hash.upper(), "status": "cached"}
+                        for info_hash in hashes
+                    ]
+                }
+            }
+
+        return fetch
+
+    async def test_concurrent_callers_share_one_request(self):
+        calls = []
+        fetch = self._fetcher(calls)
+
+        first, second = await asyncio.gather(
+            self.batcher.check(("rd", "token"), "rd", ["a" * 40], "tt1", fetch),
+            self.batcher.check(
+                ("rd", "token"), "rd", ["b" * 40, "a" * 40], "tt2", fetch
+            ),
+        )
+
+        self.assertEqual(calls, [(["a" * 40, "b" * 40], None)])
+        self.assertEqual([item["hash"] for item in first["data"]["items"]], ["A" * 40])
+        self.assertEqual(
+            [item["hash"] for item in second["data"]["items"]],
+            ["A" * 40, "B" * 40],
+        )
+
+    async def test_batches_are_split_per_account_and_at_chunk_size(self):
+        calls = []
+        fetch = self._fetcher(calls)
+        full_chunk = [f"{index:040x}" for index in range(499)]
+
+        await asyncio.gather(
+            self.batcher.check(("rd", "one"), "rd", full_chunk, "tt1", fetch),
+            self.batcher.check(("rd", "one"), "rd", ["a" * 40, "b" * 40], "tt1", fetch),
+            self.batcher.check(("rd", "two"), "rd", ["c" * 40], "tt1", fetch),
+        )
+
+        self.assertEqual(
+            sorted(len(hashes) for hashes, _ in calls),
+            [1, 2, 499],
+        )
+        self.assertTrue(all(sid == "tt1" for _, sid in calls))
+
+    async def test_failed_batch_returns_none_to_every_caller(self):
+        fetch = AsyncMock(return_value=None)
+
+        results = await asyncio.gather(
+            self.batcher.check(("rd", "token"), "rd", ["a" * 40], "tt1", fetch),
+            self.batcher.check(("rd", "token"), "rd", ["b" * 40], "tt1", fetch),
+        )
+
+        self.assertEqual(results, [None, None])
+        fetch.assert_awaited_once()
+
+    async def test_disabled_window_calls_upstream_directly(self):
+        calls = []
+
+        with patch.object(settings, "STREMTHRU_AVAILABILITY_BATCH_WINDOW", 0):
+            await asyncio.gather(
+                self.batcher.check(
+                    ("rd", "token"), "rd", ["a" * 40], "tt1", self._fetcher(calls)
+                ),
+                self.batcher.check(
+                    ("rd", "token"), "rd", ["b" * 40], "tt1", self._fetcher(calls)
+                ),
+            )
+
+        self.assertEqual(len(calls), 2)
+
+
+class AdaptiveConcurrencyLimiterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_waiters_are_bounded_by_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("realdebrid", 1, 2)
+        active = 0
+        peak = 0
+
+        async def request():
+            nonlocal active, peak
+            await limiter.acquire()
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            limiter.release()
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+    async def test_throttling_halves_once_per_burst_and_success_probes_up(self):
+        limiter = AdaptiveConcurrencyLimiter("realdebrid", 1, 8)
+        for _ in range(4):
+            await limiter.acquire()
+
+        for _ in range(4):
+            limiter.release(throttled=True, succeeded=False)
+
+        self.assertEqual(limiter.limit, 4)
+
+        for _ in range(5):
+            await limiter.acquire()
+            limiter.release()
+
+        self.assertEqual(int(limiter.limit), 5)
+
+    async def test_limit_never_drops_below_minimum(self):
+        limiter = AdaptiveConcurrencyLimiter("realdebrid", 2, 4)
+        for _ in range(3):
+            await limiter.acquire()
+            limiter.release(throttled=True, succeeded=False)
+
+        self.assertEqual(limiter.limit, 2)
+
+    async def test_throttled_instant_check_reduces_store_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("realdebrid", 1, 8)
+        response = _ResponseContext(
+            {"error": {"code": "TOO_MANY_REQUESTS"}}, status=429
+        )
+        client = StremThru(_Session(response), None, None, "realdebrid:token", "")
+
+        with patch(
+            "comet.debrid.stremthru.get_availability_limiter", return_value=limiter
+        ):
+            await client._fetch_instant(["a" * 40], None)
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+class StremThruAvailabilityEnqueueTests(unittest.IsolatedAsyncioTestCase):
+    async def test_file_infos_are_enqueued_once_per_response(self):
+        client = StremThru(None, "tt1234567", "tt1234567", "realdebrid:token", "")
+        payload = {
+            "data": {
+                "items": [
+                    {
+                        "hash": info_hash,
+                        "status": "cached",
+                        "files": [
+                            {"name": f"Movie.2024.{part}.mkv", "index": index}
+                            for index, part in enumerate(("Part1", "Part2"))
+                        ],
+                    }
+                    for info_hash in ("a" * 40, "b" * 40)
+                ]
+            }
+        }
+        queue = AsyncMock()
+
+        with (
+            patch.object(client, "check_premium", new=AsyncMock()),
+            patch.object(client, "get_instant", new=AsyncMock(return_value=payload)),
+            patch("comet.debrid.stremthru.torrent_update_queue", queue),
+        ):
+            files = await client.get_availability(["a" * 40, "b" * 40], {}, {}, {})
+
+        self.assertEqual(len(files), 4)
+        queue.add_torrent_infos.assert_awaited_once_with(files, "tt1234567")
+        queue.add_torrent_info.assert_not_called()
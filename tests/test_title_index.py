@@ -0,0 +1,209 @@
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import orjson
+
+from comet.metadata.imdb import ImdbTitleMatch
+from comet.metadata.title_index import (
+    _RESOLVED_TITLES_QUERY,
+    LocalTitleIndex,
+    _build_index,
+    settings,
+)
+
+
+def _metadata_row(imdb_id, title, year, aliases=None):
+    return {
+        "media_id": f"imdb:{imdb_id}",
+        "title": title,
+        "year": year,
+        "aliases_json": orjson.dumps(aliases) if aliases is not None else None,
+    }
+
+
+def _index(*, metadata=(), resolved=(), items=(), series=(), anime=()):
+    index = LocalTitleIndex()
+    index._index = _build_index(
+        list(metadata), list(resolved), list(items), list(series), list(anime)
+    )
+    index._built_at = time.monotonic()
+    return index
+
+
+class LocalTitleIndexTests(unittest.TestCase):
+    def test_normalized_titles_and_aliases_resolve_offline(self):
+        index = _index(
+            metadata=[
+                _metadata_row("tt0000001", "Amélie", 2001, {"ez": ["Le Fabuleux"]}),
+            ],
+            items=[{"media_id": "tt0000001", "media_type": "movie"}],
+        )
+
+        self.assertEqual(
+            index.resolve("amelie", year=2001),
+            ImdbTitleMatch("tt0000001", "movie", 2001),
+        )
+        self.assertEqual(
+            index.resolve("Fabuleux.Le", media_type="movie", year=2001).imdb_id,
+            "tt0000001",
+        )
+        self.assertIsNone(index.resolve("Amelie", media_type="series", year=2001))
+        self.assertIsNone(index.resolve("Amelie Returns", year=2001))
+
+    def test_year_disambiguates_remakes_and_ambiguity_falls_back(self):
+        index = _index(
+            metadata=[
+                _metadata_row("tt0000002", "The Thing", 1982),
+                _metadata_row("tt0000003", "The Thing", 2011),
+            ],
+            resolved=[
+                {
+                    "query_key": "movie:*:the thing",
+                    "imdb_id": "tt0000003",
+                    "media_type": "movie",
+                    "year": 2011,
+                }
+            ],
+            items=[{"media_id": "tt0000002", "media_type": "movie"}],
+        )
+
+        self.assertEqual(index.resolve("The Thing", year=1982).imdb_id, "tt0000002")
+        self.assertEqual(index.resolve("The Thing", year=2012).imdb_id, "tt0000003")
+        self.assertIsNone(index.resolve("The Thing"))
+
+    def test_untyped_titles_never_resolve_offline(self):
+        anime = {
+            "provider_id": "tt0000004",
+            "data_json": orjson.dumps(
+                {"title": "Frieren", "type": "TV", "animeSeason": {"year": 2023}}
+            ),
+        }
+        index = _index(
+            metadata=[
+                _metadata_row("tt0116282", "Fargo", 1996),
+                _metadata_row("tt2802850", "Fargo", 2014),
+            ],
+            series=[{"series_id": "tt2802850"}],
+            anime=[anime],
+        )
+
+        self.assertIsNone(index.resolve("Fargo", media_type="movie"))
+        self.assertIsNone(index.resolve("Fargo", media_type="movie", year=1996))
+        self.assertEqual(
+            index.resolve("Fargo", media_type="series", year=2014).imdb_id,
+            "tt2802850",
+        )
+        self.assertEqual(
+            index.resolve("frieren", year=2023),
+            ImdbTitleMatch("tt0000004", "series", 2023),
+        )
+
+    def test_queries_without_a_year_resolve_only_from_network_answers(self):
+        index = _index(
+            metadata=[
+                _metadata_row("tt2802850", "Fargo", 2014),
+                _metadata_row("tt0000006", "Severance", 2022),
+            ],
+            resolved=[
+                {
+                    "query_key": "*:*:fargo",
+                    "imdb_id": "tt2802850",
+                    "media_type": "series",
+                    "year": 2014,
+                },
+                {
+                    "query_key": "series:2022:severance",
+                    "imdb_id": "tt0000006",
+                    "media_type": "series",
+                    "year": 2022,
+                },
+            ],
+        )
+
+        self.assertEqual(index.resolve("Fargo").imdb_id, "tt2802850")
+        self.assertEqual(
+            index.resolve("fargo", media_type="series").imdb_id, "tt2802850"
+        )
+        self.assertIsNone(index.resolve("Fargo", media_type="movie"))
+        self.assertIsNone(index.resolve("Severance", media_type="series"))
+        self.assertEqual(
+            index.resolve("Severance", media_type="series", year=2022).imdb_id,
+            "tt0000006",
+        )
+
+    def test_queries_without_a_year_keep_word_order_and_repeats(self):
+        index = _index(
+            resolved=[
+                {
+                    "query_key": "*:*:man bites dog",
+                    "imdb_id": "tt0103905",
+                    "media_type": "movie",
+                    "year": 1992,
+                },
+                {
+                    "query_key": "*:*:tora",
+                    "imdb_id": "tt0000007",
+                    "media_type": "movie",
+                    "year": 2001,
+                },
+            ],
+        )
+
+        self.assertEqual(index.resolve("Man Bites Dog").imdb_id, "tt0103905")
+        self.assertIsNone(index.resolve("Dog Bites Man"))
+        self.assertIsNone(index.resolve("Tora! Tora! Tora!"))
+
+    def test_missing_index_schedules_a_build_and_defers_to_the_network(self):
+        index = LocalTitleIndex()
+        with patch.object(index, "_schedule_build") as schedule:
+            self.assertIsNone(index.resolve("The Thing"))
+
+        schedule.assert_called_once_with()
+
+
+class LocalTitleIndexBuildTests(unittest.IsolatedAsyncioTestCase):
+    async def test_expired_network_answers_are_not_indexed(self):
+        now = time.time()
+        lookups = [
+            {
+                "query_key": "*:*:fargo",
+                "imdb_id": "tt2802850",
+                "media_type": "series",
+                "year": 2014,
+                "updated_at": now - 7200,
+            },
+            {
+                "query_key": "*:*:severance",
+                "imdb_id": "tt11280740",
+                "media_type": "series",
+                "year": 2022,
+                "updated_at": now - 60,
+            },
+        ]
+
+        async def fetch_all(query, values=None):
+            if query != _RESOLVED_TITLES_QUERY:
+                return []
+            return [
+                row for row in lookups if row["updated_at"] >= values["min_timestamp"]
+            ]
+
+        index = LocalTitleIndex()
+        with (
+            patch.object(settings, "METADATA_CACHE_TTL", 3600),
+            patch.object(settings, "ANIME_MAPPING_ENABLED", False),
+            patch(
+                "comet.metadata.title_index.database.fetch_all",
+                AsyncMock(side_effect=fetch_all),
+            ),
+        ):
+            await index._build()
+        index._built_at = time.monotonic()
+
+        self.assertIsNone(index.resolve("Fargo"))
+        self.assertEqual(index.resolve("Severance").imdb_id, "tt11280740")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import time
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import orjson
+
+from comet.services.torrent_links import (
+    TorrentLinkCache,
+    build_torrent_link_key,
+    settings,
+)
+
+METADATA = {
+    "info_hash": "a" * 40,
+    "sources": ["udp://tracker.test:1337"],
+    "files": [{"index": 0, "title": "Movie.2024.mkv", "size": 1024}],
+}
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.rows = {}
+        self.fetch_one = AsyncMock(side_effect=self._fetch_one)
+        self.execute = AsyncMock(side_effect=self._execute)
+
+    async def _fetch_one(self, query, params):
+        del query
+        row = self.rows.get(params["link_key"])
+        if row is None or row["expires_at"] <= params["current_time"]:
+            return None
+        return row
+
+    async def _execute(self, query, params):
+        del query
+        self.rows[params["link_key"]] = params
+
+
+class TorrentLinkCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.database = FakeDatabase()
+        self.cache = TorrentLinkCache()
+        for patcher in (
+            patch("comet.services.torrent_links.database", self.database),
+            patch.object(settings, "TORRENT_LINK_CACHE_TTL", 3600),
+            patch.object(settings, "TORRENT_LINK_NEGATIVE_CACHE_TTL", 60),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_torrent_metadata_is_downloaded_once(self):
+        download = AsyncMock(return_value=(b"torrent", None, None, 200))
+
+        with (
+            patch("comet.services.torrent_links.download_torrent", download),
+            patch(
+                "comet.services.torrent_links.extract_torrent_metadata",
+                return_value=METADATA,
+            ),
+        ):
+            first = await self.cache.resolve(object(), "https://idx.test/dl?k=1")
+            second = await self.cache.resolve(object(), "https://idx.test/dl?k=1")
+
+        self.assertEqual(first, (METADATA, None, None))
+        self.assertEqual(second, first)
+        download.assert_awaited_once()
+
+        row = self.database.rows[build_torrent_link_key("https://idx.test/dl?k=1")]
+        self.assertEqual(row["info_hash"], "a" * 40)
+        self.assertEqual(orjson.loads(row["metadata_json"]), METADATA)
+
+    async def test_magnet_redirect_is_cached(self):
+        magnet = f"magnet:?xt=urn:btih:{'b' * 40}"
+        download = AsyncMock(return_value=(None, "b" * 40, magnet, 302))
+
+        with patch("comet.services.torrent_links.download_torrent", download):
+            await self.cache.resolve(object(), "https://idx.test/magnet")
+            resolved = await self.cache.resolve(object(), "https://idx.test/magnet")
+
+        self.assertEqual(resolved, (None, "b" * 40, magnet))
+        download.assert_awaited_once()
+
+    async def test_dead_links_use_the_negative_ttl(self):
+        download = AsyncMock(return_value=(None, None, None, 404))
+
+        with patch("comet.services.torrent_links.download_torrent", download):
+            resolved = await self.cache.resolve(object(), "https://idx.test/dead")
+            await self.cache.resolve(object(), "https://idx.test/dead")
+
+        self.assertEqual(resolved, (None, None, None))
+        download.assert_awaited_once()
+        row = self.database.rows[build_torrent_link_key("https://idx.test/dead")]
+        self.assertLessEqual(row["expires_at"], time.time() + 60)
+
+        with (
+            patch("comet.services.torrent_links.download_torrent", download),
+            patch(
+                "comet.services.torrent_links.time.time", return_value=time.time() + 61
+            ),
+        ):
+            await self.cache.resolve(object(), "https://idx.test/dead")
+
+        self.assertEqual(download.await_count, 2)
+
+    async def test_bodies_that_are_not_torrents_are_negatively_cached(self):
+        download = AsyncMock(return_value=(b"<html>", None, None, 200))
+
+        with (
+            patch("comet.services.torrent_links.download_torrent", download),
+            patch(
+                "comet.services.torrent_links.extract_torrent_metadata",
+                return_value=None,
+            ),
+        ):
+            await self.cache.resolve(object(), "https://idx.test/login")
+            resolved = await self.cache.resolve(object(), "https://idx.test/login")
+
+        self.assertEqual(resolved, (None, None, None))
+        download.assert_awaited_once()
+
+    async def test_timeouts_are_not_cached(self):
+        session = Mock()
+        session.get.side_effect = TimeoutError
+
+        resolved = await self.cache.resolve(session, "https://idx.test/slow")
+        await self.cache.resolve(session, "https://idx.test/slow")
+
+        self.assertEqual(resolved, (None, None, None))
+        self.assertEqual(session.get.call_count, 2)
+        self.assertEqual(self.database.rows, {})
+
+    async def test_throttling_and_server_errors_are_not_cached(self):
+        for status in (429, 503):
+            download = AsyncMock(return_value=(None, None, None, status))
+
+            with patch("comet.services.torrent_links.download_torrent", download):
+                resolved = await self.cache.resolve(object(), "https://idx.test/slow")
+                await self.cache.resolve(object(), "https://idx.test/slow")
+
+            self.assertEqual(resolved, (None, None, None))
+            self.assertEqual(download.await_count, 2)
+        self.assertEqual(self.database.rows, {})
+
+    async def test_disabled_cache_always_downloads(self):
+        download = AsyncMock(return_value=(None, None, None, 404))
+
+        with (
+            patch.object(settings, "TORRENT_LINK_CACHE_TTL", 0),
+            patch.object(settings, "TORRENT_LINK_NEGATIVE_CACHE_TTL", 0),
+            patch("comet.services.torrent_links.download_torrent", download),
+        ):
+            await self.cache.resolve(object(), "https://idx.test/dead")
+            await self.cache.resolve(object(), "https://idx.test/dead")
+
+        self.assertEqual(download.await_count, 2)
+        self.database.fetch_one.assert_not_awaited()
+
+
+if __name__ == "__main__":
+    unittest.main()
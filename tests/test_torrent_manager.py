@@ -224,5 +224,72 @@ class TorrentPersistenceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(calls, 1)
 
 
+RESOLVED_MAGNET = f"magnet:?xt=urn:btih:{'c' * 40}"
+RESOLVED_METADATA = {"info_hash": "c" * 40, "sources": [], "files": []}
+
+
+class ResolvedMagnetStoreTests(unittest.IsolatedAsyncioTestCase):
+    async def test_stored_resolution_skips_demagnetize(self):
+        queue = torrent_manager.AddTorrentQueue()
+        demagnetize = AsyncMock()
+
+        with (
+            patch.object(
+                torrent_manager,
+                "load_resolved_magnet",
+                AsyncMock(return_value=RESOLVED_METADATA),
+            ),
+            patch.object(torrent_manager, "get_torrent_from_magnet", demagnetize),
+        ):
+            resolved = await queue._get_resolved_torrent("c" * 40, RESOLVED_MAGNET)
+
+        self.assertEqual(resolved, RESOLVED_METADATA)
+        demagnetize.assert_not_awaited()
+        self.assertIn("c" * 40, queue._resolved_torrent_cache)
+
+    async def test_new_resolution_is_stored_for_other_workers(self):
+        queue = torrent_manager.AddTorrentQueue()
+        store = AsyncMock()
+
+        with (
+            patch.object(
+                torrent_manager, "load_resolved_magnet", AsyncMock(return_value=None)
+            ),
+            patch.object(
+                torrent_manager,
+                "get_torrent_from_magnet",
+                AsyncMock(return_value=object()),
+            ),
+            patch.object(
+                torrent_manager,
+                "_resolve_torrent_metadata",
+                return_value=RESOLVED_METADATA,
+            ),
+            patch.object(torrent_manager, "store_resolved_magnet", store),
+        ):
+            resolved = await queue._get_resolved_torrent("c" * 40, RESOLVED_MAGNET)
+
+        self.assertEqual(resolved, RESOLVED_METADATA)
+        store.assert_awaited_once_with("c" * 40, RESOLVED_METADATA)
+
+    async def test_failed_resolution_is_not_stored(self):
+        queue = torrent_manager.AddTorrentQueue()
+        store = AsyncMock()
+
+        with (
+            patch.object(
+                torrent_manager, "load_resolved_magnet", AsyncMock(return_value=None)
+            ),
+            patch.object(
+                torrent_manager, "get_torrent_from_magnet", AsyncMock(return_value=None)
+            ),
+            patch.object(torrent_manager, "store_resolved_magnet", store),
+        ):
+            resolved = await queue._get_resolved_torrent("c" * 40, RESOLVED_MAGNET)
+
+        self.assertEqual(resolved, {})
+        store.assert_not_awaited()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -16,6 +16,7 @@ from comet.api.endpoints.torznab import (
     CategoryConstraint,
     SearchTarget,
     TorznabProtocolError,
+    _item_fragments,
     build_magnet,
     category_constraint,
     find_recent_target,
@@ -29,6 +30,7 @@ from comet.core.models import settings
 from comet.metadata import imdb as imdb_metadata
 from comet.metadata.imdb import resolve_imdb_title
 from comet.services.media_search import MediaSearchResult, MediaSearchStatus
+from comet.services.recent_feed import RecentFeedCache
 
 
 def _request(query: str = "", path: str = "/torznab/api") -> Request:
@@ -85,6 +87,10 @@ def _result(count: int, *, media_type: str = "movie") -> MediaSearchResult:
     )
 
 
+async def _feed_body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
 class _Response:
     def __init__(self, payload, status=200):
         self.payload = payload
@@ -204,7 +210,10 @@ class TorznabPureTests(unittest.IsolatedAsyncioTestCase):
         with patch(
             "comet.api.endpoints.torznab.resolve_imdb_title",
             new=AsyncMock(return_value=title_match),
-        ) as resolver:
+        ) as resolver, patch(
+            "comet.api.endpoints.torznab.local_title_index.resolve",
+            return_value=None,
+        ) as local_resolver:
             target = await resolve_search_target(
                 parsed, category_constraint(parsed.categories), session
             )
@@ -213,6 +222,9 @@ class TorznabPureTests(unittest.IsolatedAsyncioTestCase):
         resolver.assert_awaited_once_with(
             session, "Show.Name", media_type="series", year=None
         )
+        local_resolver.assert_called_once_with(
+            "Show.Name", media_type="series", year=None
+        )
 
         daily = parse_torznab_query(
             _request("t=tvsearch&imdbid=7654321&season=2026&ep=07/25")
@@ -416,6 +428,25 @@ class TorznabPureTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(response.attrib, {"offset": "0", "total": "205"})
         self.assertEqual(hashes, result.ranked_info_hashes)
 
+    def test_item_fragment_cache_is_sized_by_its_setting(self):
+        self.assertEqual(
+            _item_fragments.cache_info().maxsize, settings.TORZNAB_ITEM_CACHE_SIZE
+        )
+
+    def test_cached_item_holds_its_magnet_once(self):
+        fragments = _item_fragments("a" * 40, "A & B", 1, "&tr=udp", "movie")
+        result = _result(1)
+        content, _ = serialize_feed(result, "movie", "https://example.test/")
+        item = ET.fromstring(content).find("channel/item")
+        attrs = {
+            attr.attrib["name"]: attr.attrib["value"]
+            for attr in item.findall(f"{{{TORZNAB_NAMESPACE}}}attr")
+        }
+
+        self.assertEqual(b"".join(fragments).count(b"magnet:?"), 1)
+        self.assertEqual(item.findtext("link"), attrs["magneturl"])
+        self.assertEqual(item.find("enclosure").attrib["url"], attrs["magneturl"])
+
 
 class TorznabRouteTests(unittest.IsolatedAsyncioTestCase):
     async def test_offset_and_limit_parameters_are_ignored(self):
@@ -434,7 +465,7 @@ class TorznabRouteTests(unittest.IsolatedAsyncioTestCase):
         ):
             response = await torznab_api(request, BackgroundTasks())
 
-        root = ET.fromstring(response.body)
+        root = ET.fromstring(await _feed_body(response))
         self.assertEqual(len(root.findall("channel/item")), 205)
         self.assertEqual(
             root.find(f"channel/{{{NEWZNAB_NAMESPACE}}}response").attrib,
@@ -454,7 +485,7 @@ class TorznabRouteTests(unittest.IsolatedAsyncioTestCase):
             "application/rss+xml; charset=utf-8",
         )
         self.assertEqual(
-            ET.fromstring(response.body)
+            ET.fromstring(await _feed_body(response))
             .find(f"channel/{{{NEWZNAB_NAMESPACE}}}response")
             .attrib["total"],
             "0",
@@ -468,7 +499,7 @@ class TorznabRouteTests(unittest.IsolatedAsyncioTestCase):
         ) as search:
             response = await torznab_api(request, BackgroundTasks())
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(ET.fromstring(response.body).tag, "rss")
+        self.assertEqual(ET.fromstring(await _feed_body(response)).tag, "rss")
         search.assert_not_awaited()
 
     async def test_targeted_search_uses_exact_default_config_object(self):
@@ -509,6 +540,10 @@ class TorznabRouteTests(unittest.IsolatedAsyncioTestCase):
                 "comet.api.endpoints.torznab.find_recent_target",
                 new=AsyncMock(return_value=target),
             ) as recent,
+            patch(
+                "comet.api.endpoints.torznab.recent_feed_cache",
+                RecentFeedCache(),
+            ),
             patch(
                 "comet.api.endpoints.torznab.config_check",
                 return_value={},
@@ -519,8 +554,10 @@ class TorznabRouteTests(unittest.IsolatedAsyncioTestCase):
             ) as search,
         ):
             response = await torznab_api(request, BackgroundTasks())
+            repeated = await torznab_api(_request("t=search"), BackgroundTasks())
 
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(await _feed_body(repeated), await _feed_body(response))
         recent.assert_awaited_once()
         search.assert_awaited_once()
 
@@ -535,6 +572,10 @@ class TorznabRouteTests(unittest.IsolatedAsyncioTestCase):
                 "comet.api.endpoints.torznab.find_recent_target",
                 new=AsyncMock(return_value=None),
             ),
+            patch(
+                "comet.api.endpoints.torznab.recent_feed_cache",
+                RecentFeedCache(),
+            ),
             patch(
                 "comet.api.endpoints.torznab.search_media",
                 new=AsyncMock(),
@@ -542,7 +583,7 @@ class TorznabRouteTests(unittest.IsolatedAsyncioTestCase):
         ):
             response = await torznab_api(request, BackgroundTasks())
 
-        root = ET.fromstring(response.body)
+        root = ET.fromstring(await _feed_body(response))
         self.assertEqual(
             root.find(f"channel/{{{NEWZNAB_NAMESPACE}}}response").attrib["total"],
             "0",